@@ -0,0 +1,97 @@
+"""
+Time the `/analytics/volume` aggregation on a large synthetic workout history.
+
+    $ python -m bench.analytics --url mysql+aiomysql://... --rows 10000000
+
+Seeds `workout_exercises` up to `--rows` entries spread over two years of
+workout plans, then times every period/grouping combination of
+`AnalyticsCrud.get_volume` with the cache disabled. `--client` also times the
+previous approach of streaming every row to the client and summing there.
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+from datetime import timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import seed
+from bench.timing import timed
+from config import config
+from crud.analytics import AnalyticsCrud
+from models import Base, WorkoutExercise, WorkoutPlan
+from schemas.analytics import VolumeGroupBy, VolumePeriod
+from utils.cache import LRUCache
+
+PLANS = 730
+EXERCISES = 200
+
+
+async def sql_side(crud, period, group_by) -> int:
+    return len(await crud.get_volume(period=period, group_by=group_by))
+
+
+async def client_side(session, period: VolumePeriod) -> int:
+    # What clients did before: fetch every entry and aggregate in Python.
+    query = (
+        select(
+            WorkoutPlan.to_start,
+            WorkoutExercise.sets,
+            WorkoutExercise.repetitions,
+            WorkoutExercise.weight,
+        )
+        .join(WorkoutPlan, WorkoutPlan.id == WorkoutExercise.workout_plan_id)
+        .execution_options(yield_per=10_000)
+    )
+    totals = defaultdict(float)
+    result = await session.stream(query)
+    async for to_start, sets, repetitions, weight in result:
+        if period == VolumePeriod.WEEK:
+            key = (to_start - timedelta(days=to_start.weekday())).date()
+        elif period == VolumePeriod.MONTH:
+            key = to_start.date().replace(day=1)
+        else:
+            key = to_start.date()
+        totals[key] += (sets or 0) * (repetitions or 0) * (weight or 0)
+    return len(totals)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--rows", default=10_000_000, type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--client", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    results = {}
+    async with session_maker() as session:
+        await seed(session, exercises=EXERCISES, plans=PLANS, workouts=args.rows)
+        crud = AnalyticsCrud(session)
+        # A zero-sized cache so every call reaches the database.
+        crud.cache = LRUCache("bench:analytics", maxsize=0, ttl=0)
+        for period in (None, *VolumePeriod):
+            for group_by in (None, *VolumeGroupBy):
+                name = f"sql {period or 'total'} by {group_by or 'nothing'}"
+                results[name] = await timed(
+                    lambda: sql_side(crud, period, group_by), args.repeat
+                )
+        if args.client:
+            for period in VolumePeriod:
+                results[f"client {period} by nothing"] = await timed(
+                    lambda: client_side(session, period), 1
+                )
+
+    await engine.dispose()
+    for name, (median, rows) in results.items():
+        print(f"{name:<34} {median:10.1f} ms {rows:6} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
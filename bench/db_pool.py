@@ -0,0 +1,89 @@
+"""
+Load-test the connection pool against a local database to size it per worker.
+
+    $ python -m bench.db_pool --url mysql+aiomysql://... --concurrency 8 32 128 \\
+          --pool-size 5 --max-overflow 10 --duration 10
+
+For every concurrency level, that many tasks run a short transaction in a loop
+for `--duration` seconds through one engine, as a single uvicorn worker would.
+Reports throughput, latency percentiles and how long checkouts waited.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from bench.timing import percentiles
+from config import config
+from db import create_engine, pool_stats
+
+
+async def worker(session_maker, query: str, deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        async with session_maker() as session:
+            await session.execute(text(query))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args, concurrency: int) -> dict:
+    engine = create_engine(
+        args.url,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        pool_timeout=args.pool_timeout,
+    )
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    latencies: list[float] = []
+    deadline = time.perf_counter() + args.duration
+    results = await asyncio.gather(
+        *[
+            worker(session_maker, args.query, deadline, latencies)
+            for _ in range(concurrency)
+        ],
+        return_exceptions=True,
+    )
+    stats = pool_stats(engine)
+    await engine.dispose()
+
+    checkouts = stats["checkouts"] or 1
+    p50, p95, p99 = percentiles(latencies, 50, 95, 99)
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(1 for result in results if isinstance(result, Exception)),
+        "throughput": round(len(latencies) / args.duration, 1),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "checkout_wait_mean_ms": round(
+            stats["wait_seconds_total"] / checkouts * 1000, 3
+        ),
+        "checkout_wait_max_ms": round(stats["wait_seconds_max"] * 1000, 3),
+        "pool_timeouts": stats["timeouts"],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--concurrency", default=[8, 32, 128], type=int, nargs="+")
+    parser.add_argument("--pool-size", default=config.DB_POOL_SIZE, type=int)
+    parser.add_argument("--max-overflow", default=config.DB_MAX_OVERFLOW, type=int)
+    parser.add_argument("--pool-timeout", default=config.DB_POOL_TIMEOUT, type=float)
+    parser.add_argument("--duration", default=10, type=float)
+    parser.add_argument("--query", default="SELECT 1")
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        print(json.dumps(await run(args, concurrency)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
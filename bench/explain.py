@@ -0,0 +1,132 @@
+"""
+Check that the queries generated by the CRUD layer are served by an index.
+
+    $ python -m bench.explain --url sqlite+aiosqlite:///bench.db
+
+Seeds every table with `bench.generate`, runs the read paths of `BaseCrud` (and the
+workout plan detail query) with caching disabled, captures each SELECT they
+issue and runs `EXPLAIN` on it. MySQL plans with `type = ALL` and SQLite plans
+that `SCAN` a table without an index count as full table scans; unfiltered
+statements that only read a bounded number of rows (`LIMIT` without `WHERE`)
+are skipped. Exits with status 1 if any full scan is found.
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import CATEGORIES, MUSCLE_GROUPS, seed, user_email
+from config import config
+from crud.base import BaseCrud
+from crud.workout_plan import WorkoutPlanCrud
+from models import (Base, Category, Exercise, MuscleGroup, User,
+                    WorkoutExercise, WorkoutPlan)
+from utils.cursor import encode_cursor
+
+
+async def run_queries(session) -> None:
+    def crud(model):
+        instance = BaseCrud(model, session)
+        instance.cache = None
+        return instance
+
+    await crud(User).get_by("email", user_email(10))
+    await crud(User).get_by("name", "User 10")
+    await crud(Category).get_by("name", CATEGORIES[9])
+    await crud(MuscleGroup).get_by("name", MUSCLE_GROUPS[9])
+    await crud(Exercise).get_by("name", "Barbell Squat")
+    await crud(Exercise).get_all_by("category_id", 10)
+    await crud(Exercise).get_all_by("muscle_group_id", 10)
+    await crud(WorkoutExercise).get_all_by("workout_plan_id", 10)
+    await crud(WorkoutExercise).get_all_by("exercise_id", 10)
+
+    for model in (User, Category, MuscleGroup, Exercise, WorkoutPlan, WorkoutExercise):
+        await crud(model).get_by_id(10)
+        await crud(model).get_page(limit=20)
+        await crud(model).get_page(
+            limit=20, cursor=encode_cursor({"f": "id", "id": 10, "k": 10})
+        )
+
+    plans = crud(WorkoutPlan)
+    _, cursor = await plans.get_page(limit=20, order_by="to_start")
+    await plans.get_page(limit=20, cursor=cursor, order_by="to_start")
+
+    detail = WorkoutPlanCrud(session)
+    detail.cache = None
+    await detail.get_workout_plan_detail(10)
+
+
+def full_scans(dialect: str, plan: list) -> list[str]:
+    if dialect == "mysql":
+        return [
+            f"table {row._mapping['table']}"
+            for row in plan
+            if row._mapping["type"] == "ALL"
+        ]
+    return [
+        row.detail
+        for row in plan
+        if row.detail.startswith("SCAN ") and "INDEX" not in row.detail
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--rows", default=5_000, type=int)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    dialect = engine.dialect.name
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await seed(
+            session,
+            exercises=args.rows,
+            users=args.rows,
+            plans=args.rows,
+            workouts=args.rows * 4,
+        )
+    async with engine.begin() as conn:
+        if dialect == "mysql":
+            for table in Base.metadata.sorted_tables:
+                await conn.execute(text(f"ANALYZE TABLE {table.name}"))
+        else:
+            await conn.execute(text("ANALYZE"))
+
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    async with session_maker() as session:
+        await run_queries(session)
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    explain = "EXPLAIN" if dialect == "mysql" else "EXPLAIN QUERY PLAN"
+    failures = 0
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            flat = " ".join(statement.split())
+            if " WHERE " not in flat and " LIMIT " in flat:
+                continue
+            result = await conn.exec_driver_sql(f"{explain} {statement}", parameters)
+            scans = full_scans(dialect, result.all())
+            print(f"{'FULL SCAN' if scans else 'ok':<10} {flat}")
+            for scan in scans:
+                print(f"{'':<10}   {scan}")
+            failures += bool(scans)
+
+    await engine.dispose()
+    print(f"\n{len(statements)} statements, {failures} with full table scans")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
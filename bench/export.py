@@ -0,0 +1,105 @@
+"""
+Check that `GET /export/workouts` streams in constant memory.
+
+    $ python -m bench.export --url sqlite+aiosqlite:///bench.db --rows 1000000
+
+Seeds `workout_exercises` up to `--rows` rows, then drains the export
+response of the route for each format and reports how much the peak RSS of
+the process grew. Exits with status 1 if it grew by more than `--max-rss-mb`.
+`--compare` afterwards loads the same rows with `BaseCrud.get_all` to show
+what materializing them costs.
+"""
+import argparse
+import asyncio
+import resource
+import sys
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import seed
+from config import config
+from crud.workout import WorkoutCrud
+from models import Base
+from routes.export import export_workouts
+from utils.export import FileFormat
+
+PLANS = 730
+EXERCISES = 200
+
+
+def reset_peak_rss() -> None:
+    # Linux only: restart the high-water mark, so the memory used while seeding
+    # does not hide the export's own peak.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--rows", default=1_000_000, type=int)
+    parser.add_argument("--max-rss-mb", default=64, type=float)
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await seed(session, exercises=EXERCISES, plans=PLANS, workouts=args.rows)
+
+    failed = False
+    for export_format in FileFormat:
+        reset_peak_rss()
+        baseline = peak_rss_mb()
+        async with session_maker() as session:
+            start = time.perf_counter()
+            response = await export_workouts(format=export_format, session=session)
+            size = 0
+            async for chunk in response.body_iterator:
+                size += len(chunk)
+            elapsed = time.perf_counter() - start
+
+        growth = peak_rss_mb() - baseline
+        failed |= growth > args.max_rss_mb
+        print(
+            f"{export_format:<7} {size / 2**20:9.1f} MiB in {elapsed:6.1f} s, "
+            f"peak RSS +{growth:.1f} MiB (limit {args.max_rss_mb:g})"
+        )
+
+    if args.compare:
+        reset_peak_rss()
+        baseline = peak_rss_mb()
+        async with session_maker() as session:
+            start = time.perf_counter()
+            rows = await WorkoutCrud(session).get_all(limit=args.rows)
+            elapsed = time.perf_counter() - start
+        print(
+            f"get_all {len(rows):>9} rows in {elapsed:6.1f} s, "
+            f"peak RSS +{peak_rss_mb() - baseline:.1f} MiB"
+        )
+
+    await engine.dispose()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
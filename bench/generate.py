@@ -0,0 +1,265 @@
+"""
+Fill a local database with realistic, reproducible data for load tests.
+
+    $ python -m bench.generate --url sqlite+aiosqlite:///bench.db --workouts 1000000
+
+Creates the tables, then inserts categories, muscle groups, `--exercises`
+exercises, `--users` users, `--plans` workout plans spread over the last two
+years and `--workouts` workout exercises across them, in batches of
+`--batch-size` rows. The same `--seed` produces the same data, with dates
+counted back from the day of the run. The daily rollup and the personal
+records are rebuilt at the end, as the API keeps them in step with
+`workout_exercises`.
+
+Every user's password is `--password`, hashed once. Refuses to run on a
+database that already has users unless `--reset` is given, which drops and
+recreates every table first.
+
+The other benchmarks fill their database through `seed`, with the sizes they
+need.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from config import config
+from crud.progress import rebuild_rollups
+from crud.records import rebuild_records
+from models import (Base, Category, Exercise, MuscleGroup, User,
+                    WorkoutExercise, WorkoutPlan)
+from schemas.workout import WorkoutStatus
+from utils.password import hash_password
+
+CATEGORIES = [
+    "Strength", "Hypertrophy", "Power", "Endurance", "Mobility",
+    "Conditioning", "Plyometrics", "Rehab", "Olympic Lifting", "Calisthenics",
+]
+MUSCLE_GROUPS = [
+    "Chest", "Upper Back", "Lats", "Shoulders", "Biceps", "Triceps",
+    "Forearms", "Abs", "Obliques", "Lower Back", "Glutes", "Quadriceps",
+    "Hamstrings", "Calves", "Adductors", "Abductors", "Hip Flexors", "Neck",
+    "Traps", "Full Body",
+]
+PLAN_NAMES = ["Push", "Pull", "Legs", "Upper", "Lower", "Full Body", "Conditioning"]
+STATUS_WEIGHTS = {
+    WorkoutStatus.COMPLETED: 0.8,
+    WorkoutStatus.TO_BE_STARTED: 0.1,
+    WorkoutStatus.IN_PROGRESS: 0.05,
+    WorkoutStatus.CANCELLED: 0.05,
+}
+MODIFIERS = [
+    "incline", "decline", "seated", "standing", "single arm", "close grip",
+    "wide grip", "reverse", "paused", "tempo", "deficit", "banded", "weighted",
+]
+EQUIPMENT = ["barbell", "dumbbell", "kettlebell", "cable", "machine", "smith"]
+MOVEMENTS = [
+    "bench press", "squat", "deadlift", "row", "curl", "lunge", "pulldown",
+    "overhead press", "fly", "extension", "raise", "shrug", "hip thrust", "dip",
+]
+HISTORY_DAYS = 730
+BATCH_SIZE = 10_000
+
+
+def user_email(index: int) -> str:
+    """Email of the `index`-th generated user, counting from 0."""
+    return f"user{index}@example.com"
+
+
+async def insert_batches(session, model, rows, batch_size: int, label: str) -> int:
+    inserted, batch, start = 0, [], time.perf_counter()
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            await session.execute(insert(model), batch)
+            inserted += len(batch)
+            batch = []
+            print(f"\r{label}: {inserted}", end="", flush=True)
+    if batch:
+        await session.execute(insert(model), batch)
+        inserted += len(batch)
+    await session.commit()
+    rate = inserted / max(time.perf_counter() - start, 1e-9)
+    print(f"\r{label}: {inserted} ({rate:,.0f} rows/s)")
+    return inserted
+
+
+def exercise_rows(rng: random.Random, count: int):
+    names = set()
+    while len(names) < count:
+        name = " ".join(
+            part
+            for part in (
+                rng.choice(MODIFIERS) if rng.random() < 0.6 else "",
+                rng.choice(EQUIPMENT),
+                rng.choice(MOVEMENTS),
+            )
+            if part
+        ).title()
+        if name in names:
+            name = f"{name} {len(names)}"
+        names.add(name)
+        yield {
+            "name": name,
+            "description": f"{name}: a {rng.choice(CATEGORIES).lower()} movement.",
+            "category_id": rng.randint(1, len(CATEGORIES)),
+            "muscle_group_id": rng.randint(1, len(MUSCLE_GROUPS)),
+        }
+
+
+def user_rows(count: int, password_hash: str, start: int = 0):
+    for i in range(start, count):
+        yield {"name": f"User {i}", "email": user_email(i), "password": password_hash}
+
+
+def plan_rows(rng: random.Random, count: int):
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    for i in range(count):
+        # Plans are evenly spread over the history, a few hours apart.
+        start = today - timedelta(days=HISTORY_DAYS * (count - i) / count)
+        start += timedelta(minutes=rng.randint(0, 600))
+        yield {
+            "name": f"{rng.choice(PLAN_NAMES)} day {i}",
+            "description": "Generated for load tests",
+            "to_start": start,
+            "to_end": start + timedelta(minutes=rng.randint(30, 120)),
+        }
+
+
+def workout_rows(
+    rng: random.Random, count: int, plans: int, exercises: int, start: int = 0
+):
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    # Each exercise has a typical working weight, varied per set.
+    base_weights = [rng.choice([10, 20, 40, 60, 80, 100, 140]) for _ in range(exercises)]
+    for i in range(start, count):
+        exercise_id = rng.randint(1, exercises)
+        yield {
+            "description": f"Set {i % 5 + 1}",
+            "workout_plan_id": 1 + i * plans // count,
+            "exercise_id": exercise_id,
+            "sets": rng.randint(1, 5),
+            "repetitions": rng.randint(3, 15),
+            "weight": round(base_weights[exercise_id - 1] * rng.uniform(0.7, 1.2), 1),
+            "status": rng.choices(statuses, weights)[0],
+        }
+
+
+async def count_rows(session, model) -> int:
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+async def seed(
+    session,
+    exercises: int = 0,
+    users: int = 0,
+    plans: int = 0,
+    workouts: int = 0,
+    password_hash: str = "x",
+    random_seed: int = 0,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    Fill the tables with generated rows. Categories, muscle groups, exercises
+    and workout plans are only inserted into empty tables; users and workout
+    exercises are topped up to `users` and `workouts` rows, so a larger run
+    reuses the rows of a smaller one.
+    """
+    rng = random.Random(random_seed)
+    if not await count_rows(session, Category):
+        await insert_batches(
+            session,
+            Category,
+            ({"name": name, "description": f"{name} training"} for name in CATEGORIES),
+            batch_size,
+            "category",
+        )
+    if not await count_rows(session, MuscleGroup):
+        await insert_batches(
+            session,
+            MuscleGroup,
+            ({"name": name, "description": name} for name in MUSCLE_GROUPS),
+            batch_size,
+            "muscle_group",
+        )
+    if exercises and not await count_rows(session, Exercise):
+        await insert_batches(
+            session, Exercise, exercise_rows(rng, exercises), batch_size, "exercises"
+        )
+    existing = await count_rows(session, User)
+    if users > existing:
+        await insert_batches(
+            session, User, user_rows(users, password_hash, existing), batch_size, "users"
+        )
+    if plans and not await count_rows(session, WorkoutPlan):
+        await insert_batches(
+            session, WorkoutPlan, plan_rows(rng, plans), batch_size, "workout_plans"
+        )
+    existing = await count_rows(session, WorkoutExercise)
+    if workouts > existing:
+        await insert_batches(
+            session,
+            WorkoutExercise,
+            workout_rows(
+                rng,
+                workouts,
+                await count_rows(session, WorkoutPlan),
+                await count_rows(session, Exercise),
+                existing,
+            ),
+            batch_size,
+            "workout_exercises",
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--users", default=1_000, type=int)
+    parser.add_argument("--exercises", default=500, type=int)
+    parser.add_argument("--plans", default=50_000, type=int)
+    parser.add_argument("--workouts", default=1_000_000, type=int)
+    parser.add_argument("--batch-size", default=BATCH_SIZE, type=int)
+    parser.add_argument("--password", default="Password@123")
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--reset", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        if args.reset:
+            await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with session_maker() as session:
+        if await count_rows(session, User):
+            print("The database already has data; pass --reset to replace it.")
+            await engine.dispose()
+            sys.exit(1)
+
+        start = time.perf_counter()
+        await seed(
+            session,
+            exercises=args.exercises,
+            users=args.users,
+            plans=args.plans,
+            workouts=args.workouts,
+            password_hash=hash_password(args.password),
+            random_seed=args.seed,
+            batch_size=args.batch_size,
+        )
+        print(f"daily_exercise_stats: {await rebuild_rollups(session)}")
+        print(f"exercise_records: {await rebuild_records(session)}")
+        print(f"generated in {time.perf_counter() - start:.1f} s")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""
+Time a bulk import of workout history.
+
+    $ python -m bench.importer --url sqlite+aiosqlite:///bench.db --rows 100000
+
+Writes a CSV or NDJSON file of `--rows` workouts spread over two years of
+workout plans, with exercises given by name, and imports it with
+`crud.importer.import_workouts`, the code behind `POST /import/workouts`.
+"""
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import count_rows, seed
+from config import config
+from crud.importer import import_workouts
+from models import Base, Exercise, WorkoutPlan
+from utils.export import FileFormat
+from utils.importer import read_records
+
+PLANS = 730
+EXERCISES = 50
+
+
+def write_file(
+    path: str, rows: int, file_format: FileFormat, plans: int, exercises: list[str]
+) -> None:
+    rng = random.Random(0)
+    fields = ["workout_plan_id", "exercise", "sets", "repetitions", "weight", "status"]
+    with open(path, "w") as f:
+        if file_format == FileFormat.CSV:
+            f.write(",".join(fields) + "\n")
+        for i in range(rows):
+            values = [
+                # Roughly chronological, as exported histories are.
+                min(plans, i * plans // rows + rng.randint(1, 3)),
+                rng.choice(exercises),
+                rng.randint(1, 5),
+                rng.randint(1, 12),
+                rng.randrange(20, 150, 5),
+                "completed",
+            ]
+            if file_format == FileFormat.CSV:
+                f.write(",".join(str(value) for value in values) + "\n")
+            else:
+                f.write(json.dumps(dict(zip(fields, values))) + "\n")
+
+
+async def read_file(path: str):
+    with open(path, "rb") as f:
+        while chunk := f.read(64 * 1024):
+            yield chunk
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--rows", default=100_000, type=int)
+    parser.add_argument(
+        "--format", choices=list(FileFormat), default=FileFormat.CSV
+    )
+    parser.add_argument("--chunk-size", default=config.IMPORT_CHUNK_SIZE, type=int)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await seed(session, exercises=EXERCISES, plans=PLANS)
+        plans = await count_rows(session, WorkoutPlan)
+        exercises = list(await session.scalars(select(Exercise.name)))
+
+    with tempfile.NamedTemporaryFile(suffix=f".{args.format}") as f:
+        write_file(f.name, args.rows, FileFormat(args.format), plans, exercises)
+        async with session_maker() as session:
+            start = time.perf_counter()
+            report = await import_workouts(
+                session,
+                read_records(read_file(f.name), FileFormat(args.format)),
+                chunk_size=args.chunk_size,
+            )
+            elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    print(
+        f"imported {report['imported']} rows ({report['failed']} failed) "
+        f"in {elapsed:.1f} s, {report['imported'] / elapsed:,.0f} rows/s"
+    )
+    if report["aborted"]:
+        print(f"aborted: {report['aborted']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
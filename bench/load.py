@@ -0,0 +1,396 @@
+"""
+Drive scripted load scenarios against the app and record latency percentiles.
+
+    $ python -m bench.generate --url "$MYSQL_URL" --workouts 1000000
+    $ python -m bench.load --duration 30 --concurrency 20 --output after.json
+    $ python -m bench.load --compare before.json after.json
+
+Runs `routes:app` in process through `httpx.ASGITransport`, against the
+database in MYSQL_URL, which `bench.generate` filled. Each scenario runs for
+`--duration` seconds with `--concurrency` virtual users looping over it, after
+`--warmup` seconds that are not recorded:
+
+- login_storm: users logging in with their password.
+- catalog_browsing: listing, opening, searching and autocompleting exercises,
+  categories and muscle groups.
+- session_logging: creating a workout plan and logging sets to it.
+- history_paging: paging through workouts by cursor, reading progress,
+  records and full workout plans.
+
+The results (throughput, p50/p95/p99 per scenario and per endpoint, error
+counts, commit and settings) are written as JSON to `--output`. `--baseline`
+compares them with an earlier run; `--compare OLD NEW` compares two files
+without running anything. Both exit with status 1 when a scenario's p95 grew,
+or its throughput dropped, by more than `--threshold`, or when a larger share
+of its requests failed. The warm-up runs with a seed of its own, so the
+measured run does not replay requests whose results the warm-up cached.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import func, select
+
+from bench.generate import MOVEMENTS, user_email
+from bench.timing import percentiles
+from db import async_session_maker, engine
+from models import Category, Exercise, MuscleGroup, User, WorkoutPlan
+from routes import app
+
+# Added to `--seed` for the warm-up; apart from the seeds of any sensible
+# number of virtual users.
+WARMUP_SEED_OFFSET = 10_000
+
+
+@dataclass
+class Catalog:
+    """How many rows of each kind the database holds; ids run from 1."""
+
+    users: int
+    exercises: int
+    categories: int
+    muscle_groups: int
+    plans: int
+    password: str
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+
+    async def request(
+        self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs
+    ) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[label] += 1
+            return None
+        finally:
+            self.latencies[label].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[label] += 1
+        return response
+
+
+async def login_storm(client, recorder: Recorder, rng: random.Random, catalog: Catalog):
+    index = rng.randrange(catalog.users)
+    await recorder.request(
+        client,
+        "POST /user/login",
+        "POST",
+        "/user/login",
+        json={
+            "name": f"User {index}",
+            "email": user_email(index),
+            "password": catalog.password,
+        },
+    )
+
+
+async def catalog_browsing(
+    client, recorder: Recorder, rng: random.Random, catalog: Catalog
+):
+    response = await recorder.request(
+        client, "GET /exercise/", "GET", "/exercise/", params={"limit": 20}
+    )
+    if response is not None and response.status_code == 200:
+        cursor = response.json()["next_cursor"]
+        if cursor and rng.random() < 0.5:
+            await recorder.request(
+                client,
+                "GET /exercise/?cursor",
+                "GET",
+                "/exercise/",
+                params={"limit": 20, "cursor": cursor},
+            )
+    for _ in range(3):
+        await recorder.request(
+            client,
+            "GET /exercise/{exercise_id}",
+            "GET",
+            f"/exercise/{rng.randint(1, catalog.exercises)}",
+        )
+    await recorder.request(client, "GET /category/", "GET", "/category/")
+    await recorder.request(client, "GET /muscle-group/", "GET", "/muscle-group/")
+    words = rng.choice(MOVEMENTS)
+    await recorder.request(
+        client, "GET /exercise/search", "GET", "/exercise/search", params={"q": words}
+    )
+    await recorder.request(
+        client,
+        "GET /exercise/autocomplete",
+        "GET",
+        "/exercise/autocomplete",
+        params={"prefix": words[: rng.randint(1, 4)]},
+    )
+
+
+async def session_logging(
+    client, recorder: Recorder, rng: random.Random, catalog: Catalog
+):
+    response = await recorder.request(
+        client,
+        "POST /workout-plan/",
+        "POST",
+        "/workout-plan/",
+        json={"name": "Load test session", "description": "bench.load"},
+    )
+    if response is None or response.status_code != 200:
+        return
+    plan_id = response.json()["id"]
+
+    workout_id = None
+    for _ in range(rng.randint(3, 6)):
+        response = await recorder.request(
+            client,
+            "POST /workout/",
+            "POST",
+            "/workout/",
+            json={
+                "description": "Working set",
+                "workout_plan_id": plan_id,
+                "exercise_id": rng.randint(1, catalog.exercises),
+                "sets": rng.randint(1, 5),
+                "repetitions": rng.randint(3, 12),
+                "weight": rng.choice([20, 40, 60, 80, 100]),
+                "status": "completed",
+            },
+        )
+        if response is not None and response.status_code == 200:
+            workout_id = response.json()["id"]
+    if workout_id is not None:
+        await recorder.request(
+            client,
+            "PATCH /workout/{workout_id}",
+            "PATCH",
+            f"/workout/{workout_id}",
+            json={"repetitions": rng.randint(3, 12)},
+        )
+
+
+async def history_paging(
+    client, recorder: Recorder, rng: random.Random, catalog: Catalog
+):
+    params = {"limit": 50}
+    for _ in range(rng.randint(1, 5)):
+        response = await recorder.request(
+            client, "GET /workout/", "GET", "/workout/", params=params
+        )
+        if response is None or response.status_code != 200:
+            break
+        cursor = response.json()["next_cursor"]
+        if not cursor:
+            break
+        params = {"limit": 50, "cursor": cursor}
+    start = date.today() - timedelta(days=rng.choice([7, 30, 90]))
+    await recorder.request(
+        client,
+        "GET /progress/daily",
+        "GET",
+        "/progress/daily",
+        params={"start": start.isoformat()},
+    )
+    await recorder.request(client, "GET /records/", "GET", "/records/")
+    await recorder.request(
+        client,
+        "GET /workout-plan/{workout_plan_id}/full",
+        "GET",
+        f"/workout-plan/{rng.randint(1, catalog.plans)}/full",
+    )
+
+
+SCENARIOS = {
+    "login_storm": login_storm,
+    "catalog_browsing": catalog_browsing,
+    "session_logging": session_logging,
+    "history_paging": history_paging,
+}
+
+
+async def read_catalog(password: str) -> Catalog:
+    async with async_session_maker() as session:
+        counts = [
+            await session.scalar(select(func.max(model.id)))
+            for model in (User, Exercise, Category, MuscleGroup, WorkoutPlan)
+        ]
+    if not all(counts):
+        raise SystemExit("The database is empty; fill it with `python -m bench.generate`.")
+    return Catalog(*counts, password=password)
+
+
+async def run_scenario(
+    client, scenario, catalog: Catalog, concurrency: int, seconds: float, seed: int
+) -> tuple[Recorder, float]:
+    recorder = Recorder()
+
+    async def virtual_user(rng: random.Random, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            await scenario(client, recorder, rng, catalog)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            virtual_user(random.Random(seed + i), start + seconds)
+            for i in range(concurrency)
+        )
+    )
+    return recorder, time.perf_counter() - start
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict:
+    p50, p95, p99 = percentiles(latencies, 50, 95, 99)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": round(len(latencies) / duration, 2),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def error_rate(summary: dict) -> float:
+    return summary["errors"] / max(summary["requests"], 1)
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> bool:
+    """Print both runs side by side; return True if any scenario regressed."""
+    print(
+        f"{'scenario':<18} {'req/s':>9} {'was':>9} {'p95 ms':>9} {'was':>9} "
+        f"{'errors':>8} {'was':>8}  "
+        f"({baseline.get('commit')} -> {results.get('commit')})"
+    )
+    regressed = False
+    for name, new in results["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            continue
+        slower = new["p95_ms"] > old["p95_ms"] * (1 + threshold)
+        fewer = new["throughput"] < old["throughput"] * (1 - threshold)
+        # Failing requests are often fast ones, so more of them is a
+        # regression whatever the latency says.
+        failing = error_rate(new) > error_rate(old) * (1 + threshold)
+        regressed |= slower or fewer or failing
+        print(
+            f"{name:<18} {new['throughput']:9.1f} {old['throughput']:9.1f} "
+            f"{new['p95_ms']:9.2f} {old['p95_ms']:9.2f} "
+            f"{error_rate(new):8.2%} {error_rate(old):8.2%}"
+            + ("  REGRESSION" if slower or fewer or failing else "")
+        )
+    return regressed
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--scenario", action="append", choices=list(SCENARIOS), dest="scenarios"
+    )
+    parser.add_argument("--duration", default=10.0, type=float)
+    parser.add_argument("--warmup", default=2.0, type=float)
+    parser.add_argument("--concurrency", default=10, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--password", default="Password@123")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", default=0.1, type=float)
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, results = (json.load(open(path)) for path in args.compare)
+        sys.exit(1 if compare(baseline, results, args.threshold) else 0)
+
+    catalog = await read_catalog(args.password)
+    results = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "settings": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "database": engine.url.get_backend_name(),
+            "users": catalog.users,
+            "exercises": catalog.exercises,
+            "workout_plans": catalog.plans,
+        },
+        "scenarios": {},
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        login = await client.post(
+            "/user/login",
+            json={"name": "User 0", "email": user_email(0), "password": args.password},
+        )
+        login.raise_for_status()
+        token = login.json()["token"]["access_token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        for name in args.scenarios or list(SCENARIOS):
+            scenario = SCENARIOS[name]
+            if args.warmup:
+                # Seeded apart from the measured run, so it does not replay
+                # requests the warm-up just cached.
+                await run_scenario(
+                    client,
+                    scenario,
+                    catalog,
+                    args.concurrency,
+                    args.warmup,
+                    args.seed + WARMUP_SEED_OFFSET,
+                )
+            recorder, duration = await run_scenario(
+                client, scenario, catalog, args.concurrency, args.duration, args.seed
+            )
+            everything = [value for values in recorder.latencies.values() for value in values]
+            summary = summarize(everything, sum(recorder.errors.values()), duration)
+            summary["endpoints"] = {
+                label: summarize(latencies, recorder.errors[label], duration)
+                for label, latencies in sorted(recorder.latencies.items())
+            }
+            results["scenarios"][name] = summary
+            print(
+                f"{name:<18} {summary['throughput']:9.1f} req/s  "
+                f"p50 {summary['p50_ms']:8.2f}  p95 {summary['p95_ms']:8.2f}  "
+                f"p99 {summary['p99_ms']:8.2f} ms  errors {summary['errors']}"
+            )
+    await engine.dispose()
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.load(open(args.baseline))
+        sys.exit(1 if compare(baseline, results, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""
+Measure what recording metrics adds to a request.
+
+    $ python -m bench.metrics --requests 100000
+
+Calls a bare ASGI app that answers 200 at once, directly and wrapped in
+MetricsMiddleware over 50 routes, and reports the time per request of both
+and the difference. Exits with status 1 if the overhead exceeds
+`--max-us`. Also times rendering `/metrics` with the series recorded.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from middleware.metrics import MetricsMiddleware
+from utils.metrics import registry
+
+ROUTES = [type("Route", (), {"path": f"/resource{i}/{{id}}"})() for i in range(50)]
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def app(scope, receive, send) -> None:
+    scope["route"] = ROUTES[scope["index"] % len(ROUTES)]
+    await send(START)
+    await send(BODY)
+
+
+async def receive():
+    return {"type": "http.request"}
+
+
+async def send(message) -> None:
+    pass
+
+
+async def time_requests(asgi, requests: int) -> float:
+    start = time.perf_counter()
+    for index in range(requests):
+        await asgi(
+            {"type": "http", "method": "GET", "path": "/", "index": index},
+            receive,
+            send,
+        )
+    return (time.perf_counter() - start) / requests
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", default=100_000, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    parser.add_argument("--max-us", default=5.0, type=float)
+    args = parser.parse_args()
+
+    wrapped = MetricsMiddleware(app)
+    bare_times, wrapped_times = [], []
+    for _ in range(args.repeat):
+        bare_times.append(await time_requests(app, args.requests))
+        wrapped_times.append(await time_requests(wrapped, args.requests))
+    bare, recorded = min(bare_times) * 1e6, min(wrapped_times) * 1e6
+    overhead = recorded - bare
+    print(f"bare app         {bare:6.2f} us/request")
+    print(f"with metrics     {recorded:6.2f} us/request")
+    print(f"overhead         {overhead:6.2f} us/request  (limit {args.max_us:g})")
+
+    start = time.perf_counter()
+    text = registry.render()
+    print(
+        f"render /metrics  {(time.perf_counter() - start) * 1000:6.2f} ms "
+        f"({len(text.splitlines())} lines)"
+    )
+    sys.exit(1 if overhead > args.max_us else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
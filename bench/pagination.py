@@ -0,0 +1,74 @@
+"""
+Compare OFFSET and keyset (cursor) pagination latency on the `users` table.
+
+    $ python -m bench.pagination --url sqlite+aiosqlite:///bench.db --rows 200000
+
+Seeds the table if it holds fewer than `--rows` rows, then times page 1 and
+page `--page` for both modes. Keyset latency should stay flat while OFFSET
+latency grows with the page number.
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import seed
+from bench.timing import timed
+from config import config
+from crud.user import UserCrud
+from models import Base, User
+from utils.cursor import encode_cursor
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--rows", default=200_000, type=int)
+    parser.add_argument("--page", default=1000, type=int)
+    parser.add_argument("--page-size", default=20, type=int)
+    parser.add_argument("--repeat", default=20, type=int)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with session_maker() as session:
+        await seed(session, users=args.rows)
+        crud = UserCrud(session)
+        skip = (args.page - 1) * args.page_size
+        # The keyset page starts after the last row of the previous page; the
+        # first page has none.
+        cursor = None
+        if skip:
+            last_id = await session.scalar(
+                select(User.id).order_by(User.id).offset(skip - 1).limit(1)
+            )
+            cursor = encode_cursor({"f": "id", "id": last_id, "k": last_id})
+
+        results = {
+            "offset page 1": await timed(
+                lambda: crud.get_page(limit=args.page_size), args.repeat
+            ),
+            "keyset page 1": await timed(
+                lambda: crud.get_page(limit=args.page_size), args.repeat
+            ),
+        }
+        if skip:
+            results[f"offset page {args.page}"] = await timed(
+                lambda: crud.get_page(skip=skip, limit=args.page_size), args.repeat
+            )
+            results[f"keyset page {args.page}"] = await timed(
+                lambda: crud.get_page(limit=args.page_size, cursor=cursor),
+                args.repeat,
+            )
+
+    await engine.dispose()
+    for name, (median, _) in results.items():
+        print(f"{name:<22} {median:8.3f} ms (median of {args.repeat})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Time `GET /exercise/search` and `/exercise/autocomplete` on a large catalog.
+
+    $ python -m bench.search --url sqlite+aiosqlite:///bench.db --exercises 2000
+
+Seeds `--exercises` exercises with `bench.generate` if there are none, builds
+the search index and reports the median and 99th percentile latency of
+`SearchIndex.search` and `SearchIndex.autocomplete` over a set of queries.
+Exits with status 1 if a p99 exceeds `--max-ms`. `--compare` also times the
+`LIKE '%x%'` scan over name and description the index replaces.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bench.generate import seed
+from bench.timing import percentiles, time_calls
+from config import config
+from crud.exercise import load_search_index
+from models import Base, Exercise
+
+QUERIES = [
+    "bench", "barbell row", "incline dumbbell", "press", "squ", "curl cable",
+    "ell", "thrust", "grip row", "paused deadlift", "ext", "single arm row",
+]
+PREFIXES = ["b", "be", "ben", "d", "inc", "seated c", "wide grip p", "sq", "ro"]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=config.MYSQL_URL)
+    parser.add_argument("--exercises", default=2_000, type=int)
+    parser.add_argument("--repeat", default=200, type=int)
+    parser.add_argument("--max-ms", default=1.0, type=float)
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await seed(session, exercises=args.exercises)
+        start = time.perf_counter()
+        index = await load_search_index(session)
+        print(
+            f"index of {len(index.documents)} exercises built in "
+            f"{time.perf_counter() - start:.2f} s"
+        )
+
+    failed = False
+    for label, call, arguments in [
+        ("search", index.search, QUERIES),
+        ("autocomplete", index.autocomplete, PREFIXES),
+    ]:
+        p50, p99 = percentiles(time_calls(call, arguments, args.repeat), 50, 99)
+        failed |= p99 > args.max_ms
+        print(f"{label:<12} p50 {p50:7.3f} ms  p99 {p99:7.3f} ms  (limit {args.max_ms:g})")
+
+    if args.compare:
+        timings = []
+        async with session_maker() as session:
+            for query in QUERIES:
+                pattern = f"%{query}%"
+                start = time.perf_counter()
+                await session.execute(
+                    select(Exercise)
+                    .where(
+                        or_(
+                            Exercise.name.like(pattern),
+                            Exercise.description.like(pattern),
+                        )
+                    )
+                    .limit(10)
+                )
+                timings.append(time.perf_counter() - start)
+        print(f"{'LIKE scan':<12} mean {statistics.mean(timings) * 1000:7.3f} ms")
+
+    await engine.dispose()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Time the serialization of a 1k-row list response.
+
+    $ python -m bench.serialization --rows 1000
+
+Builds a page of `--rows` WorkoutExercise objects, as `GET /workout/` returns
+them, and times turning it into JSON bytes the ways FastAPI can:
+
+- `jsonable_encoder`: what a route without `response_model` goes through.
+- `orjson`: validating with the route's TypeAdapter, then `orjson.dumps` of
+  the plain data, as an `ORJSONResponse` default response class does.
+- `dump_json`: validating with the route's TypeAdapter and serializing to
+  bytes in pydantic-core, what FastAPI does for routes with a `response_model`
+  and the default response class.
+"""
+import argparse
+import json
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from models import WorkoutExercise
+from schemas.pagination import Page
+from schemas.workout import WorkoutResponse, WorkoutStatus
+
+
+def page(rows: int) -> dict:
+    return {
+        "items": [
+            WorkoutExercise(
+                id=i,
+                description=f"set {i}",
+                workout_plan_id=1 + i // 10,
+                exercise_id=1 + i % 50,
+                sets=3,
+                repetitions=10,
+                weight=60.0,
+                status=WorkoutStatus.COMPLETED,
+            )
+            for i in range(rows)
+        ],
+        "next_cursor": "eyJmIjoiaWQiLCJpZCI6MTAwMH0",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", default=1000, type=int)
+    parser.add_argument("--repeat", default=50, type=int)
+    args = parser.parse_args()
+
+    content = page(args.rows)
+    adapter = TypeAdapter(Page[WorkoutResponse])
+    serializers = {
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(content)).encode(),
+        "dump_json": lambda: adapter.dump_json(adapter.validate_python(content)),
+    }
+    try:
+        import orjson
+
+        serializers["orjson"] = lambda: orjson.dumps(
+            adapter.dump_python(adapter.validate_python(content), mode="json")
+        )
+    except ImportError:
+        print("orjson is not installed, skipping it")
+
+    outputs = {}
+    for label, serialize in serializers.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            outputs[label] = serialize()
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{label:<17} {statistics.median(timings) * 1000:7.2f} ms per "
+            f"{args.rows} rows ({len(outputs[label]) / 1024:.0f} KiB)"
+        )
+
+    documents = [json.loads(output) for output in outputs.values()]
+    assert all(document == documents[0] for document in documents)
+
+
+if __name__ == "__main__":
+    main()
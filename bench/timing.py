@@ -0,0 +1,35 @@
+"""
+Latency helpers shared by the benchmarks. Timings are in seconds, reports in
+milliseconds.
+"""
+import statistics
+import time
+
+
+def percentiles(timings: list[float], *points: int) -> list[float]:
+    """The `points`-th percentiles of `timings`, in milliseconds."""
+    if len(timings) > 1:
+        cuts = statistics.quantiles(timings, n=100, method="inclusive")
+        return [cuts[point - 1] * 1000 for point in points]
+    return [(timings[0] if timings else 0.0) * 1000 for _ in points]
+
+
+def time_calls(call, arguments: list, repeat: int) -> list[float]:
+    """Time `call` on each of `arguments`, `repeat` times over."""
+    timings = []
+    for _ in range(repeat):
+        for argument in arguments:
+            start = time.perf_counter()
+            call(argument)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def timed(fn, repeat: int):
+    """Median milliseconds of `repeat` awaits of `fn()`, and the last result."""
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        timings.append(time.perf_counter() - start)
+    return percentiles(timings, 50)[0], result
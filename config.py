@@ -12,11 +12,83 @@ class BaseConfig(BaseSettings):
 
 
 class Config(BaseConfig):
+    DEBUG: bool = os.getenv("DEBUG", False)
     MYSQL_URL: str | None = os.getenv("MYSQL_URL")
+    DB_POOL_SIZE: int = os.getenv("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = os.getenv("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = os.getenv("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE: int = os.getenv("DB_POOL_RECYCLE", 3600)
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", True)
+    DB_CONNECT_TIMEOUT: int = os.getenv("DB_CONNECT_TIMEOUT", 10)
+    DB_ECHO: bool = os.getenv("DB_ECHO", False)
+    SQL_QUERY_BUDGET: int = os.getenv("SQL_QUERY_BUDGET", 20)
+    SQL_REPEATED_QUERY_THRESHOLD: int = os.getenv("SQL_REPEATED_QUERY_THRESHOLD", 5)
+    DB_REPLICA_URLS: str = os.getenv("DB_REPLICA_URLS", "")
+    DB_READ_YOUR_WRITES_SECONDS: float = os.getenv("DB_READ_YOUR_WRITES_SECONDS", 5)
+    DB_READ_YOUR_WRITES_MAX_USERS: int = os.getenv("DB_READ_YOUR_WRITES_MAX_USERS", 10_000)
+    DB_REPLICA_RETRY_SECONDS: float = os.getenv("DB_REPLICA_RETRY_SECONDS", 30)
+    DB_REPLICA_LAG_QUERY: str = os.getenv("DB_REPLICA_LAG_QUERY", "")
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", 5)
+    DB_REPLICA_MAX_LAG_SECONDS: float = os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 2)
     JWT_SECRET_KEY: str | None = os.getenv("JWT_SECRET_KEY")
     JWT_ALGORITHM: str | None = os.getenv("JWT_ALGORITHM")
     JWT_EXP: int | None = os.getenv("JWT_EXP")
     PAGINATION_MAX_LIMIT: int | None = os.getenv("PAGINATION_MAX_LIMIT")
+    TOKEN_CACHE_MAX_SIZE: int = os.getenv("TOKEN_CACHE_MAX_SIZE", 10_000)
+    TOKEN_CACHE_TTL: float = os.getenv("TOKEN_CACHE_TTL", 300)
+    PASSWORD_HASH_SCHEME: str = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+    PASSWORD_BCRYPT_ROUNDS: int = os.getenv("PASSWORD_BCRYPT_ROUNDS", 12)
+    PASSWORD_ARGON2_TIME_COST: int = os.getenv("PASSWORD_ARGON2_TIME_COST", 3)
+    PASSWORD_ARGON2_MEMORY_COST: int = os.getenv("PASSWORD_ARGON2_MEMORY_COST", 65536)
+    PASSWORD_ARGON2_PARALLELISM: int = os.getenv("PASSWORD_ARGON2_PARALLELISM", 4)
+    PASSWORD_HASH_WORKERS: int = os.getenv("PASSWORD_HASH_WORKERS", 4)
+    PASSWORD_HASH_MAX_QUEUE: int = os.getenv("PASSWORD_HASH_MAX_QUEUE", 64)
+    BULK_MAX_ITEMS: int = os.getenv("BULK_MAX_ITEMS", 500)
+    REFERENCE_CACHE_MAX_SIZE: int = os.getenv("REFERENCE_CACHE_MAX_SIZE", 1024)
+    REFERENCE_CACHE_TTL: float = os.getenv("REFERENCE_CACHE_TTL", 300)
+    ANALYTICS_CACHE_MAX_SIZE: int = os.getenv("ANALYTICS_CACHE_MAX_SIZE", 256)
+    ANALYTICS_CACHE_TTL: float = os.getenv("ANALYTICS_CACHE_TTL", 300)
+    EXPORT_BATCH_SIZE: int = os.getenv("EXPORT_BATCH_SIZE", 1000)
+    IMPORT_CHUNK_SIZE: int = os.getenv("IMPORT_CHUNK_SIZE", 1000)
+    IMPORT_MAX_ERRORS: int = os.getenv("IMPORT_MAX_ERRORS", 1000)
+    SEARCH_INDEX_TTL: float = os.getenv("SEARCH_INDEX_TTL", 300)
+    TABLE_VERSION_TTL: float = os.getenv("TABLE_VERSION_TTL", 300)
+    REFERENCE_CACHE_CONTROL: str = os.getenv(
+        "REFERENCE_CACHE_CONTROL", "private, max-age=60, must-revalidate"
+    )
+    WORKOUT_PLAN_CACHE_CONTROL: str = os.getenv(
+        "WORKOUT_PLAN_CACHE_CONTROL", "private, no-cache"
+    )
+    COMPRESSION_ENCODINGS: str = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    COMPRESSION_MINIMUM_SIZE: int = os.getenv("COMPRESSION_MINIMUM_SIZE", 1024)
+    COMPRESSION_GZIP_LEVEL: int = os.getenv("COMPRESSION_GZIP_LEVEL", 6)
+    COMPRESSION_BROTLI_QUALITY: int = os.getenv("COMPRESSION_BROTLI_QUALITY", 5)
+    COMPRESSION_ZSTD_LEVEL: int = os.getenv("COMPRESSION_ZSTD_LEVEL", 3)
+    PRECOMPRESSED_MAX_SIZE: int = os.getenv("PRECOMPRESSED_MAX_SIZE", 128)
+    METRICS_LATENCY_BUCKETS: str = os.getenv(
+        "METRICS_LATENCY_BUCKETS",
+        "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10",
+    )
+    METRICS_AUTH_BUCKETS: str = os.getenv(
+        "METRICS_AUTH_BUCKETS", "0.0001,0.00025,0.0005,0.001,0.0025,0.005,0.01"
+    )
+    METRICS_PASSWORD_BUCKETS: str = os.getenv(
+        "METRICS_PASSWORD_BUCKETS", "0.01,0.025,0.05,0.1,0.25,0.5,1,2.5"
+    )
+    PROFILE_TOKEN: str = os.getenv("PROFILE_TOKEN", "")
+    PROFILE_HEADER: str = os.getenv("PROFILE_HEADER", "X-Profile")
+    PROFILE_SAMPLE_RATE: float = os.getenv("PROFILE_SAMPLE_RATE", 0)
+    PROFILE_INTERVAL: float = os.getenv("PROFILE_INTERVAL", 0.001)
+    PROFILE_FORMAT: str = os.getenv("PROFILE_FORMAT", "speedscope")
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_MAX_FILES: int = os.getenv("PROFILE_MAX_FILES", 50)
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/0")
+    CACHE_REDIS_PREFIX: str = os.getenv("CACHE_REDIS_PREFIX", "fitness")
+    CACHE_REDIS_CHANNEL: str = os.getenv(
+        "CACHE_REDIS_CHANNEL", "fitness:cache-invalidation"
+    )
+    CACHE_LOCAL_TTL: float = os.getenv("CACHE_LOCAL_TTL", 5)
 
 
 config: Config = Config()
@@ -0,0 +1,163 @@
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config
+from models import Exercise, MuscleGroup, WorkoutExercise, WorkoutPlan
+from schemas.analytics import VolumeGroupBy, VolumePeriod
+from schemas.workout import WorkoutStatus
+from utils.cache import create_cache
+
+# Cleared by every write to workouts, workout plans and exercises.
+volume_cache = create_cache(
+    "analytics_volume",
+    maxsize=config.ANALYTICS_CACHE_MAX_SIZE,
+    ttl=config.ANALYTICS_CACHE_TTL,
+)
+
+
+def period_start(column, period: VolumePeriod, dialect: str):
+    """
+    SQL expression for the first day of the day, week (Monday) or month that
+    `column` falls in.
+    """
+    if dialect == "sqlite":
+        if period == VolumePeriod.DAY:
+            return func.date(column)
+        if period == VolumePeriod.WEEK:
+            return func.date(column, "weekday 0", "-6 days")
+        return func.strftime("%Y-%m-01", column)
+
+    if dialect == "mysql":
+        if period == VolumePeriod.DAY:
+            return func.date(column)
+        if period == VolumePeriod.WEEK:
+            return func.date(func.subdate(column, func.weekday(column)))
+        return func.date_format(column, "%Y-%m-01")
+
+    return func.date_trunc(period.value, column)
+
+
+class AnalyticsCrud:
+    """
+    Aggregate queries over workout entries.
+
+    Attributes:
+        session (AsyncSession): An asynchronous SQLAlchemy session for database operations.
+        cache (CacheBackend): Results of previous reports, cleared by every write
+            to workouts, workout plans and exercises.
+    """
+
+    cache = volume_cache
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_volume(
+        self,
+        period: VolumePeriod | None = None,
+        group_by: VolumeGroupBy | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        exercise_id: int | None = None,
+        muscle_group_id: int | None = None,
+        workout_status: WorkoutStatus | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Total training volume (sets × repetitions × weight), optionally bucketed
+        by `period` and grouped by exercise or muscle group.
+
+        Grouping and filtering run in a single GROUP BY query; entries are dated
+        by the `to_start` of their workout plan, and `start`/`end` are inclusive.
+
+        Returns:
+            List[dict]: One row per bucket, ordered by period and group.
+        """
+        key = (
+            "volume",
+            period and period.value,
+            group_by and group_by.value,
+            start and start.isoformat(),
+            end and end.isoformat(),
+            exercise_id,
+            muscle_group_id,
+            workout_status and workout_status.value,
+        )
+        rows = await self.cache.get(key)
+        if rows is not None:
+            return rows
+
+        sets = func.coalesce(WorkoutExercise.sets, 0)
+        repetitions = sets * func.coalesce(WorkoutExercise.repetitions, 0)
+        volume = repetitions * func.coalesce(WorkoutExercise.weight, 0)
+        columns = [
+            func.count(WorkoutExercise.id).label("entries"),
+            func.coalesce(func.sum(sets), 0).label("sets"),
+            func.coalesce(func.sum(repetitions), 0).label("repetitions"),
+            func.coalesce(func.sum(volume), 0).label("volume"),
+        ]
+        keys = []
+
+        if period is not None:
+            dialect = self.session.get_bind().dialect.name
+            bucket = period_start(WorkoutPlan.to_start, period, dialect)
+            keys.append(bucket.label("period"))
+        if group_by == VolumeGroupBy.EXERCISE:
+            keys += [
+                Exercise.id.label("exercise_id"),
+                Exercise.name.label("exercise_name"),
+            ]
+        elif group_by == VolumeGroupBy.MUSCLE_GROUP:
+            keys += [
+                MuscleGroup.id.label("muscle_group_id"),
+                MuscleGroup.name.label("muscle_group_name"),
+            ]
+
+        query = select(*keys, *columns).select_from(WorkoutExercise)
+        if period is not None or start is not None or end is not None:
+            query = query.join(
+                WorkoutPlan, WorkoutPlan.id == WorkoutExercise.workout_plan_id
+            )
+        if group_by is not None or muscle_group_id is not None:
+            query = query.join(Exercise, Exercise.id == WorkoutExercise.exercise_id)
+        if group_by == VolumeGroupBy.MUSCLE_GROUP:
+            query = query.join(MuscleGroup, MuscleGroup.id == Exercise.muscle_group_id)
+
+        if start is not None:
+            query = query.where(
+                WorkoutPlan.to_start >= datetime.combine(start, time.min)
+            )
+        if end is not None:
+            query = query.where(
+                WorkoutPlan.to_start
+                < datetime.combine(end + timedelta(days=1), time.min)
+            )
+        if exercise_id is not None:
+            query = query.where(WorkoutExercise.exercise_id == exercise_id)
+        if muscle_group_id is not None:
+            query = query.where(Exercise.muscle_group_id == muscle_group_id)
+        if workout_status is not None:
+            query = query.where(WorkoutExercise.status == workout_status)
+
+        if keys:
+            # Refer to the labels so the bucket expression is not repeated with
+            # its own bind parameters, which MySQL would not match to the select.
+            labels = [key.name for key in keys]
+            query = query.group_by(*labels).order_by(*labels)
+
+        result = await self.session.execute(query)
+        rows = []
+        for row in result.mappings():
+            row = dict(row)
+            if isinstance(row.get("period"), (date, datetime)):
+                row["period"] = row["period"].isoformat()[:10]
+            row["volume"] = float(row["volume"])
+            row["sets"] = int(row["sets"])
+            row["repetitions"] = int(row["repetitions"])
+            rows.append(row)
+
+        if not self.session.info.get("replica"):
+            await self.cache.set(key, rows)
+        return rows
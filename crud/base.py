@@ -1,36 +1,237 @@
-from typing import Any, Generic, List, Type, TypeVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Generic, List, Type, TypeVar
 
+from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.expression import select
+from sqlalchemy.sql.expression import (and_, delete, func, insert, or_, select,
+                                       update)
 
 from models import Base
+from utils.cache import CacheBackend, table_version
+from utils.cursor import decode_cursor, encode_cursor
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
 class BaseCrud(Generic[ModelType]):
+    # Subclasses opt in to caching by setting a cache backend, which then
+    # serves `get_by` and `get_page` and is filled from primary reads only;
+    # every write through this class clears it,
+    # along with the caches of derived data listed in `invalidates`, and
+    # changes the table's version used for ETags.
+    cache: CacheBackend | None = None
+    invalidates: tuple[CacheBackend, ...] = ()
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
 
+    async def _before_write(self, ids: List[int]) -> Any:
+        """
+        Called before rows are updated or deleted. Whatever it returns is passed
+        to `_after_write`; subclasses use it to remember the old state.
+        """
+        return None
+
+    async def _after_write(self, ids: List[int], before: Any = None) -> None:
+        """
+        Called after rows are written but before the commit, so derived tables
+        can be updated in the same transaction.
+        """
+
+    async def _invalidate(self) -> None:
+        await table_version(self.model.__tablename__).bump()
+        if self.cache is not None:
+            await self.cache.clear()
+        for cache in self.invalidates:
+            await cache.clear()
+
+    def _cacheable(self) -> bool:
+        # A replica may lag behind a write that already cleared the cache, so
+        # only rows read from the primary are stored.
+        return self.cache is not None and not self.session.info.get("replica")
+
+    def _dump(self, model: ModelType) -> dict[str, Any]:
+        return {
+            column.key: getattr(model, column.key)
+            for column in self.model.__mapper__.column_attrs
+        }
+
+    def _load(self, data: dict[str, Any]) -> ModelType:
+        # Shared backends hand back JSON, so datetimes arrive as strings.
+        data = dict(data)
+        for column in self.model.__mapper__.column_attrs:
+            value = data.get(column.key)
+            python_type = column.expression.type.python_type
+            if isinstance(value, str) and python_type is datetime:
+                data[column.key] = datetime.fromisoformat(value)
+        return self.model(**data)
+
     async def get_all(self, skip: int = 0, limit: int = 20) -> List[ModelType]:
         query = select(self.model).offset(skip).limit(limit)
         result = await self.session.scalars(query)
         return result.all()
 
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: str | None = None,
+        order_by: str = "id",
+    ) -> tuple[List[ModelType], str | None]:
+        """
+        Keyset pagination ordered by (`order_by`, id).
+
+        When a cursor is given the page starts right after the row it encodes,
+        so the database seeks on the index instead of scanning `skip` rows, and
+        rows inserted concurrently never shift or duplicate later pages.
+        `skip` is only honoured without a cursor, for backwards compatibility.
+
+        Returns the page and the cursor of the next page, or None on the last page.
+        """
+        if self.cache is not None:
+            page = await self.cache.get(("page", skip, limit, cursor, order_by))
+            if page is not None:
+                return [self._load(data) for data in page["items"]], page["next"]
+
+        sort_column = getattr(self.model, order_by)
+        query = select(self.model).order_by(sort_column, self.model.id)
+
+        if cursor is not None:
+            try:
+                position = decode_cursor(cursor)
+                if position["f"] != order_by:
+                    raise ValueError("Cursor was issued for another ordering")
+                last_id, last_key = position["id"], position["k"]
+                if last_key is not None and sort_column.type.python_type is datetime:
+                    last_key = datetime.fromisoformat(last_key)
+            except (ValueError, KeyError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+            if order_by == "id":
+                query = query.where(self.model.id > last_id)
+            else:
+                query = query.where(
+                    or_(
+                        sort_column > last_key,
+                        and_(sort_column == last_key, self.model.id > last_id),
+                    )
+                )
+        elif skip:
+            query = query.offset(skip)
+
+        result = await self.session.scalars(query.limit(limit + 1))
+        items = result.all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                {"f": order_by, "id": last.id, "k": getattr(last, order_by)}
+            )
+
+        if self._cacheable():
+            await self.cache.set(
+                ("page", skip, limit, cursor, order_by),
+                {"items": [self._dump(item) for item in items], "next": next_cursor},
+            )
+        return items, next_cursor
+
+    async def stream_rows(
+        self, batch_size: int = 1000, order_by: str = "id"
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield every row as a dict of column values, ordered by `order_by`.
+
+        Rows are fetched `batch_size` at a time through a server-side cursor and
+        are not turned into ORM objects, so nothing accumulates in the session
+        and memory stays flat however large the table is.
+        """
+        query = (
+            select(*self.model.__table__.columns)
+            .order_by(getattr(self.model, order_by), self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for row in result.mappings():
+            yield dict(row)
+
     async def create(self, attributes: dict[str, Any]) -> ModelType:
         if attributes is None:
             return {}
 
         model = self.model(**attributes)
         self.session.add(model)
+        await self.session.flush()
+        await self._after_write([model.id])
         await self.session.commit()
+        await self._invalidate()
         return model
 
+    async def bulk_create(self, items: List[dict[str, Any]]) -> List[ModelType]:
+        """
+        Insert all rows with a single flush and a single commit.
+
+        SQLAlchemy batches the flush into multi-row `INSERT ... RETURNING`
+        statements wherever the dialect can return the generated ids in order.
+        Returns the created models in the order of `items`.
+        """
+        if not items:
+            return []
+
+        models = [self.model(**attributes) for attributes in items]
+        self.session.add_all(models)
+        await self.session.flush()
+        await self._after_write([model.id for model in models])
+        await self.session.commit()
+        await self._invalidate()
+        return models
+
+    async def insert_many(self, items: List[dict[str, Any]]) -> List[int]:
+        """
+        Insert plain column dicts with batched multi-row INSERTs and commit.
+
+        Unlike `bulk_create` no ORM objects are built, which matters for large
+        imports. The new ids come back through `RETURNING` where the dialect
+        supports it, in the order of `items`. MySQL cannot return them, so
+        there they are found as those above the previous maximum, and rows
+        inserted concurrently may be included; `_after_write` must not mind
+        seeing a row twice.
+        """
+        if not items:
+            return []
+
+        query = insert(self.model)
+        if self.session.get_bind().dialect.insert_returning:
+            result = await self.session.scalars(
+                query.returning(self.model.id, sort_by_parameter_order=True), items
+            )
+            ids = result.all()
+        else:
+            last_id = await self.session.scalar(select(func.max(self.model.id))) or 0
+            await self.session.execute(query, items)
+            result = await self.session.scalars(
+                select(self.model.id).where(self.model.id > last_id)
+            )
+            ids = result.all()
+        await self._after_write(ids)
+        await self.session.commit()
+        await self._invalidate()
+        return ids
+
     async def get_by(self, field: str, value: Any) -> ModelType:
+        if self.cache is not None:
+            data = await self.cache.get((field, value))
+            if data is not None:
+                return self._load(data)
+
         query = select(self.model).where(getattr(self.model, field) == value)
         result = await self.session.scalars(query)
-        return result.first()
+        model = result.first()
+        if self._cacheable() and model is not None:
+            await self.cache.set((field, value), self._dump(model))
+        return model
 
     async def get_by_id(self, model_id: int) -> ModelType | None:
         model = await self.get_by(field="id", value=model_id)
@@ -44,21 +245,101 @@ class BaseCrud(Generic[ModelType]):
         return result.all()
 
     async def update(self, _id: int, attributes: dict[str, Any]) -> ModelType | None:
-        model = await self.get_by(field="id", value=_id)
-        if model is None:
-            return None
+        """
+        Update the row in a single `UPDATE ... WHERE id = :id` statement.
+
+        The updated row comes back through `RETURNING` where the dialect supports
+        it; otherwise (MySQL) it is read back, before the commit, only when the
+        UPDATE matched a row. Either way it is loaded in the session by the time
+        `_invalidate` runs. Returns None when no row has the given id.
+        """
         if attributes is None:
             return None
+        if not attributes:
+            return await self.get_by_id(_id)
+
+        before = await self._before_write([_id])
+        query = update(self.model).where(self.model.id == _id).values(**attributes)
+        if self.session.get_bind().dialect.update_returning:
+            result = await self.session.scalars(query.returning(self.model))
+            model = result.first()
+            if model is not None:
+                await self._after_write([_id], before)
+            await self.session.commit()
+            await self._invalidate()
+            return model
 
-        for key, value in attributes.items():
-            setattr(model, key, value)
+        result = await self.session.execute(query)
+        model = None
+        if result.rowcount:
+            model = await self.session.get(self.model, _id, populate_existing=True)
+            await self._after_write([_id], before)
         await self.session.commit()
+        await self._invalidate()
         return model
 
     async def delete(self, _id: int) -> bool | None:
-        model = await self.get_by(field="id", value=_id)
-        if model is None:
-            return None
-        await self.session.delete(model)
+        """
+        Delete the row in a single `DELETE ... WHERE id = :id` statement.
+        Returns None when no row has the given id.
+        """
+        before = await self._before_write([_id])
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id == _id)
+        )
+        if result.rowcount:
+            await self._after_write([_id], before)
         await self.session.commit()
+        await self._invalidate()
+        if result.rowcount == 0:
+            return None
         return True
+
+    async def bulk_update(self, items: List[dict[str, Any]]) -> List[int]:
+        """
+        Apply every `{"id": ..., **changes}` item in a single transaction, using
+        one executemany UPDATE per distinct set of changed columns.
+        Returns the ids that exist; items with unknown ids are skipped.
+        """
+        if not items:
+            return []
+
+        ids = [item["id"] for item in items]
+        result = await self.session.scalars(
+            select(self.model.id).where(self.model.id.in_(ids))
+        )
+        existing = set(result.all())
+        rows = [item for item in items if item["id"] in existing and len(item) > 1]
+        if rows:
+            changed = [row["id"] for row in rows]
+            before = await self._before_write(changed)
+            await self.session.execute(update(self.model), rows)
+            await self._after_write(changed, before)
+        await self.session.commit()
+        await self._invalidate()
+        return [_id for _id in ids if _id in existing]
+
+    async def bulk_delete(self, ids: List[int]) -> List[int]:
+        """
+        Delete all rows with the given ids in a single transaction.
+        Returns the ids that were actually deleted.
+        """
+        if not ids:
+            return []
+
+        before = await self._before_write(ids)
+        query = delete(self.model).where(self.model.id.in_(ids))
+        if self.session.get_bind().dialect.delete_returning:
+            result = await self.session.scalars(query.returning(self.model.id))
+            deleted = result.all()
+        else:
+            result = await self.session.scalars(
+                select(self.model.id).where(self.model.id.in_(ids))
+            )
+            deleted = result.all()
+            await self.session.execute(query)
+        if deleted:
+            await self._after_write(deleted, before)
+        await self.session.commit()
+        await self._invalidate()
+        return deleted
@@ -1,8 +1,10 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.base import BaseCrud
 from models import Category
+from utils.cache import create_cache
 
 
 class CategoryCrud(BaseCrud[Category]):
@@ -11,8 +13,15 @@ class CategoryCrud(BaseCrud[Category]):
 
     Inherits from Bas
     eCrud, providing methods to interact with the Category model in the database.
+    Lookups are served from the configured cache, which every write clears.
     """
 
+    cache = create_cache(
+        "category",
+        maxsize=config.REFERENCE_CACHE_MAX_SIZE,
+        ttl=config.REFERENCE_CACHE_TTL,
+    )
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initializes the CategoryCrud instance.
@@ -23,29 +32,34 @@ class CategoryCrud(BaseCrud[Category]):
         super().__init__(model=Category, session=session)
 
     async def get_all_categories(
-        self, skip: int = 0, limit: int = 10
-    ) -> list[Category]:
+        self, skip: int = 0, limit: int = 10, cursor: str | None = None
+    ) -> tuple[list[Category], str | None]:
         """
         Retrieves all categories from the database, with optional pagination.
 
         Parameters:
         - skip (int): The number of categories to skip (for pagination). Default is 0.
         - limit (int): The maximum number of categories to return. Default is 10.
+        - cursor (str | None): Cursor of the page to fetch, takes precedence over `skip`.
 
         Returns:
-        - list[Category]: A list of Category objects.
+        - tuple[list[Category], str | None]: A list of Category objects and the next page cursor.
 
         Raises:
         - HTTPException: If no categories are found (404) or on server error (500).
         """
         try:
-            categories = await self.get_all(skip=skip, limit=limit)
+            categories, next_cursor = await self.get_page(
+                skip=skip, limit=limit, cursor=cursor
+            )
             if not categories:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="No categories found",
                 )
-            return categories
+            return categories, next_cursor
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -158,7 +172,6 @@ class CategoryCrud(BaseCrud[Category]):
         - HTTPException: If the category does not exist (404) or on server error (500).
         """
         try:
-            await self.get_category_by_id(category_id)
             data = {}
             if name:
                 data["name"] = name
@@ -166,7 +179,14 @@ class CategoryCrud(BaseCrud[Category]):
                 data["description"] = description
 
             updated_category = await self.update(category_id, data)
+            if not updated_category:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Category with ID: {category_id} not found",
+                )
             return updated_category
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -187,12 +207,15 @@ class CategoryCrud(BaseCrud[Category]):
         - HTTPException: If the category does not exist (404) or on server error (500).
         """
         try:
-            await self.get_category_by_id(category_id)
-
             deleted = await self.delete(category_id)
-            if deleted:
-                return True
-            return False
+            if not deleted:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Category with ID: {category_id} not found",
+                )
+            return True
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,11 +1,34 @@
-from typing import List
+import asyncio
+import time
+from typing import Any, Dict, List, Set, Tuple
 
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import select
 
+from config import config
+from crud.analytics import volume_cache
 from crud.base import BaseCrud
 from models import Exercise
+from utils.cache import create_cache
+from utils.search import SearchIndex
+
+# The search index of this worker, with the time it was loaded from the table.
+# Writes through ExerciseCrud update it in place; it is reloaded once it is
+# older than SEARCH_INDEX_TTL, so writes made by other workers show up too.
+search_index: Dict[str, Any] = {"index": None, "loaded_at": 0.0}
+_search_index_lock = asyncio.Lock()
+
+
+async def load_search_index(session: AsyncSession) -> SearchIndex:
+    """
+    Build the search index from the `exercises` table and make it current.
+    """
+    result = await session.execute(select(*Exercise.__table__.columns))
+    index = SearchIndex(result.mappings())
+    search_index.update(index=index, loaded_at=time.monotonic())
+    return index
 
 
 class ExerciseCrud(BaseCrud[Exercise]):
@@ -17,8 +40,16 @@ class ExerciseCrud(BaseCrud[Exercise]):
 
     Attributes:
         session (AsyncSession): An asynchronous SQLAlchemy session for database operations.
+        cache (CacheBackend): The configured cache, cleared by every write.
     """
 
+    cache = create_cache(
+        "exercise",
+        maxsize=config.REFERENCE_CACHE_MAX_SIZE,
+        ttl=config.REFERENCE_CACHE_TTL,
+    )
+    invalidates = (volume_cache,)
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initializes the ExerciseCrud with a SQLAlchemy session.
@@ -27,29 +58,88 @@ class ExerciseCrud(BaseCrud[Exercise]):
             session (AsyncSession): The SQLAlchemy session for performing database operations.
         """
         super().__init__(model=Exercise, session=session)
-
-    async def get_all_exercise(self, skip: int = 0, limit: int = 100) -> List[Exercise]:
+        self._written: Set[int] = set()
+        self._deleted: Set[int] = set()
+
+    async def _after_write(self, ids: List[int], before: Any = None) -> None:
+        # The search index is only updated once the commit went through.
+        self._written.update(ids)
+
+    async def delete(self, _id: int) -> bool | None:
+        self._deleted.add(_id)
+        return await super().delete(_id)
+
+    async def bulk_delete(self, ids: List[int]) -> List[int]:
+        self._deleted.update(ids)
+        return await super().bulk_delete(ids)
+
+    async def _invalidate(self) -> None:
+        await super()._invalidate()
+        written, deleted = self._written, self._deleted
+        self._written, self._deleted = set(), set()
+        index = search_index["index"]
+        if index is None:
+            return
+        # Deleted rows are dropped from the index, and created and updated
+        # rows are still loaded in the session, so the index is updated
+        # without another query. Rows written without loading them (bulk
+        # updates, imports) make the next search reload the index instead.
+        stale = False
+        for _id in deleted:
+            index.remove(_id)
+        for _id in written - deleted:
+            exercise = self.session.identity_map.get(
+                self.session.identity_key(Exercise, _id)
+            )
+            if exercise is None:
+                stale = True
+            else:
+                index.add(self._dump(exercise))
+        if stale:
+            search_index["loaded_at"] = float("-inf")
+
+    async def _search_index(self) -> SearchIndex:
+        index = search_index["index"]
+        if (
+            index is not None
+            and time.monotonic() - search_index["loaded_at"] < config.SEARCH_INDEX_TTL
+        ):
+            return index
+        async with _search_index_lock:
+            # Another request may have reloaded it while this one waited.
+            if search_index["index"] is not index:
+                return search_index["index"]
+            return await load_search_index(self.session)
+
+    async def get_all_exercise(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> Tuple[List[Exercise], str | None]:
         """
         Retrieves all Exercise instances, with optional pagination.
 
         Args:
             skip (int): The number of items to skip (default is 0).
             limit (int): The maximum number of items to return (default is 100).
+            cursor (str | None): Cursor of the page to fetch, takes precedence over `skip`.
 
         Raises:
             HTTPException: If no exercises are found or on other errors.
 
         Returns:
-            List[Exercise]: A list of Exercise instances.
+            Tuple[List[Exercise], str | None]: A list of Exercise instances and the next page cursor.
         """
         try:
-            exercise = await self.get_all(skip=skip, limit=limit)
+            exercise, next_cursor = await self.get_page(
+                skip=skip, limit=limit, cursor=cursor
+            )
             if not exercise:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="No exercises found",
                 )
-            return exercise
+            return exercise, next_cursor
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -78,6 +168,8 @@ class ExerciseCrud(BaseCrud[Exercise]):
                     detail=f"Exercise with id: {exercise_id} not found",
                 )
             return exercise
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -112,6 +204,68 @@ class ExerciseCrud(BaseCrud[Exercise]):
                 detail=f"Error on fetching exercise with name: {name}: {str(e)}",
             )
 
+    async def search(
+        self,
+        query: str,
+        category_id: int | None = None,
+        muscle_group_id: int | None = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches exercise names and descriptions through the in-memory index.
+
+        Args:
+            query (str): Words to look for; each must match a word of the
+                exercise exactly, as a prefix or as a substring.
+            category_id (int | None): Only return exercises of this category.
+            muscle_group_id (int | None): Only return exercises of this muscle group.
+            limit (int): The maximum number of results.
+
+        Returns:
+            List[Dict[str, Any]]: The matching exercises with their score, best first.
+        """
+        index = await self._search_index()
+        return [
+            {
+                "id": document.id,
+                "name": document.name,
+                "description": document.description,
+                "category_id": document.category_id,
+                "muscle_group_id": document.muscle_group_id,
+                "score": score,
+            }
+            for document, score in index.search(
+                query, category_id, muscle_group_id, limit
+            )
+        ]
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        category_id: int | None = None,
+        muscle_group_id: int | None = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggests exercise names for what the user has typed so far.
+
+        Args:
+            prefix (str): The text typed so far; its last word may be incomplete.
+            category_id (int | None): Only suggest exercises of this category.
+            muscle_group_id (int | None): Only suggest exercises of this muscle group.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            List[Dict[str, Any]]: The ids and names of the suggested exercises.
+        """
+        index = await self._search_index()
+        return [
+            {"id": document.id, "name": document.name}
+            for document in index.autocomplete(
+                prefix, category_id, muscle_group_id, limit
+            )
+        ]
+
     async def create_exercise(
         self, name: str, description: str, category_id: int, muscle_group_id: int
     ) -> Exercise:
@@ -187,10 +341,15 @@ class ExerciseCrud(BaseCrud[Exercise]):
             if muscle_group_id:
                 data["muscle_group_id"] = muscle_group_id
 
-            await self.get_by_id(exercise_id)
-
             updated_exercise = await self.update(exercise_id, data)
+            if not updated_exercise:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Exercise with id: {exercise_id} not found",
+                )
             return updated_exercise
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -211,17 +370,18 @@ class ExerciseCrud(BaseCrud[Exercise]):
             JSONResponse: A response indicating the deletion of the exercise.
         """
         try:
-            await self.get_by_id(exercise_id)  # Checking if exercise exists
             deleted = await self.delete(exercise_id)
             if not deleted:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Error on deleting exercise with id: {exercise_id}",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Exercise with id: {exercise_id} not found",
                 )
             return JSONResponse(
                 status_code=status.HTTP_202_ACCEPTED,
                 content={"message": "Exercise deleted"},
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
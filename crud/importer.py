@@ -0,0 +1,165 @@
+import argparse
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config
+from crud.workout import WorkoutCrud
+from db import async_session_maker, engine
+from models import Exercise, WorkoutPlan
+from schemas.workout import WorkoutImportRow
+from utils.export import FileFormat
+from utils.importer import RecordError, read_records
+
+IMPORT_COLUMNS = set(WorkoutImportRow.model_fields) - {"exercise"}
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+async def import_workouts(
+    session: AsyncSession,
+    records: AsyncIterator[Tuple[int, Any]],
+    resume_after: int = 0,
+    chunk_size: int = config.IMPORT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Insert the workouts of a parsed file in chunks of `chunk_size` rows.
+
+    Exercise names are resolved through one name → id table loaded up front,
+    and workout plan ids are checked once per chunk. Each chunk is a single
+    transaction of multi-row INSERTs, so an interrupted import can be resumed by
+    passing the returned `last_committed_line` as `resume_after`; records that
+    start on or before that line are skipped.
+
+    Returns:
+        dict: Counts, per-line errors and the last committed line, as
+            described by `WorkoutImportResult`.
+    """
+    workout_crud = WorkoutCrud(session)
+    result = await session.execute(select(Exercise.name, Exercise.id))
+    exercise_ids: Dict[str, int] = {name: _id for name, _id in result}
+    known_exercises = set(exercise_ids.values())
+
+    report: Dict[str, Any] = {
+        "imported": 0,
+        "failed": 0,
+        "last_committed_line": resume_after,
+        "errors": [],
+        "aborted": None,
+    }
+
+    def fail(line: int, message: str) -> None:
+        report["failed"] += 1
+        if len(report["errors"]) < config.IMPORT_MAX_ERRORS:
+            report["errors"].append({"line": line, "error": message})
+
+    async def flush(chunk: List[Tuple[int, Dict[str, Any]]], last_line: int) -> None:
+        plan_ids = {row["workout_plan_id"] for _, row in chunk}
+        result = await session.scalars(
+            select(WorkoutPlan.id).where(WorkoutPlan.id.in_(plan_ids))
+        )
+        known_plans = set(result.all())
+        rows = []
+        for line, row in chunk:
+            if row["workout_plan_id"] in known_plans:
+                rows.append(row)
+            else:
+                fail(line, f"Workout plan {row['workout_plan_id']} not found")
+        await workout_crud.insert_many(rows)
+        report["imported"] += len(rows)
+        report["last_committed_line"] = last_line
+
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    last_line = resume_after
+    try:
+        async for line, record in records:
+            if line <= resume_after:
+                continue
+            last_line = line
+            if isinstance(record, RecordError):
+                fail(line, str(record))
+                continue
+            try:
+                row = WorkoutImportRow.model_validate(record)
+            except ValidationError as e:
+                fail(line, _validation_message(e))
+                continue
+
+            if row.exercise_id is None:
+                exercise_id = exercise_ids.get(row.exercise)
+                if exercise_id is None:
+                    fail(line, f"Exercise '{row.exercise}' not found")
+                    continue
+            elif row.exercise_id in known_exercises:
+                exercise_id = row.exercise_id
+            else:
+                fail(line, f"Exercise {row.exercise_id} not found")
+                continue
+
+            values = row.model_dump(include=IMPORT_COLUMNS)
+            values["exercise_id"] = exercise_id
+            chunk.append((line, values))
+            if len(chunk) >= chunk_size:
+                await flush(chunk, last_line)
+                chunk = []
+        if chunk:
+            await flush(chunk, last_line)
+        report["last_committed_line"] = last_line
+    except Exception as e:
+        await session.rollback()
+        report["aborted"] = str(e)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import workouts from an NDJSON or CSV file."
+    )
+    parser.add_argument("path")
+    parser.add_argument(
+        "-f", "--format", choices=list(FileFormat), default=FileFormat.NDJSON
+    )
+    parser.add_argument(
+        "-r", "--resume-after", help="Skip records up to this line", default=0, type=int
+    )
+    parser.add_argument(
+        "-c", "--chunk-size", default=config.IMPORT_CHUNK_SIZE, type=int
+    )
+    args = parser.parse_args()
+
+    async def read_file():
+        with open(args.path, "rb") as f:
+            while chunk := f.read(64 * 1024):
+                yield chunk
+
+    async def run():
+        async with async_session_maker() as session:
+            report = await import_workouts(
+                session,
+                read_records(read_file(), FileFormat(args.format)),
+                resume_after=args.resume_after,
+                chunk_size=args.chunk_size,
+            )
+        await engine.dispose()
+        for error in report["errors"]:
+            print(f"line {error['line']}: {error['error']}")
+        print(
+            f"imported {report['imported']}, failed {report['failed']}, "
+            f"last committed line {report['last_committed_line']}"
+        )
+        if report["aborted"]:
+            print(f"aborted: {report['aborted']}")
+            raise SystemExit(1)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
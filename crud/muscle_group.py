@@ -1,16 +1,26 @@
 from dataclasses import field
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
+from crud.analytics import volume_cache
 from crud.base import BaseCrud
 from models import MuscleGroup
+from utils.cache import create_cache
 
 
 class MuscleGroupCrud(BaseCrud[MuscleGroup]):
-    """CRUD operations for MuscleGroup model."""
+    """CRUD operations for MuscleGroup model, cached until the next write."""
+
+    cache = create_cache(
+        "muscle_group",
+        maxsize=config.REFERENCE_CACHE_MAX_SIZE,
+        ttl=config.REFERENCE_CACHE_TTL,
+    )
+    invalidates = (volume_cache,)
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize the MuscleGroupCrud with an async database session.
@@ -21,28 +31,31 @@ class MuscleGroupCrud(BaseCrud[MuscleGroup]):
         super().__init__(MuscleGroup, session)
 
     async def get_all_muscle_group(
-        self, skip: int = 0, limit: int = 20
-    ) -> List[MuscleGroup]:
+        self, skip: int = 0, limit: int = 20, cursor: str | None = None
+    ) -> Tuple[List[MuscleGroup], str | None]:
         """Retrieve all muscle groups with optional pagination.
 
         Args:
             skip (int): The number of records to skip (for pagination). Default is 0.
             limit (int): The maximum number of records to return. Default is 20.
+            cursor (str | None): Cursor of the page to fetch, takes precedence over `skip`.
 
         Returns:
-            List[MuscleGroup]: A list of MuscleGroup instances.
+            Tuple[List[MuscleGroup], str | None]: A list of MuscleGroup instances and the next page cursor.
 
         Raises:
             HTTPException: If no muscle groups are found, a 404 error is raised.
         """
         try:
-            muscle_groups = await super().get_all(skip, limit)
+            muscle_groups, next_cursor = await super().get_page(skip, limit, cursor)
             if not muscle_groups:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="No muscle groups found",
                 )
-            return muscle_groups
+            return muscle_groups, next_cursor
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -153,7 +166,6 @@ class MuscleGroupCrud(BaseCrud[MuscleGroup]):
             HTTPException: If an error occurs during the update process, a 500 error is raised.
         """
         try:
-            await self.get_by_id(muscle_group_id)  # Checking if muscle group exists
             data = {}
 
             if name:
@@ -162,8 +174,15 @@ class MuscleGroupCrud(BaseCrud[MuscleGroup]):
                 data["description"] = description
 
             updated_muscle_group = await self.update(muscle_group_id, data)
+            if not updated_muscle_group:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"No muscle group found with ID: {muscle_group_id}",
+                )
 
             return updated_muscle_group
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -184,14 +203,19 @@ class MuscleGroupCrud(BaseCrud[MuscleGroup]):
             HTTPException: If an error occurs during the deletion process, a 500 error is raised.
         """
         try:
-            await self.get_by_id(muscle_group_id)  # Check to see if muscle group exists
-
-            await self.delete(muscle_group_id)
+            deleted = await self.delete(muscle_group_id)
+            if not deleted:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"No muscle group found with ID: {muscle_group_id}",
+                )
 
             return JSONResponse(
                 status_code=status.HTTP_202_ACCEPTED,
                 content={"message": "Muscle group deleted"},
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,192 @@
+import argparse
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.analytics import period_start
+from db import async_session_maker, engine
+from models import DailyExerciseStats, WorkoutExercise, WorkoutPlan
+from schemas.analytics import VolumePeriod
+from schemas.workout import WorkoutStatus
+
+ExerciseDay = Tuple[int, date]
+
+ROLLUP_COLUMNS = [
+    "exercise_id",
+    "day",
+    "entries",
+    "sets",
+    "repetitions",
+    "volume",
+    "max_weight",
+]
+
+
+def _aggregate(dialect: str):
+    day = period_start(WorkoutPlan.to_start, VolumePeriod.DAY, dialect)
+    sets = func.coalesce(WorkoutExercise.sets, 0)
+    repetitions = sets * func.coalesce(WorkoutExercise.repetitions, 0)
+    volume = repetitions * func.coalesce(WorkoutExercise.weight, 0)
+    return (
+        select(
+            WorkoutExercise.exercise_id,
+            day.label("day"),
+            func.count(WorkoutExercise.id),
+            func.sum(sets),
+            func.sum(repetitions),
+            func.sum(volume),
+            func.max(WorkoutExercise.weight),
+        )
+        .join(WorkoutPlan, WorkoutPlan.id == WorkoutExercise.workout_plan_id)
+        .where(WorkoutExercise.status == WorkoutStatus.COMPLETED)
+        .group_by(WorkoutExercise.exercise_id, "day")
+    )
+
+
+async def exercise_days(session: AsyncSession, where) -> Set[ExerciseDay]:
+    """
+    The (exercise, day) rollup rows that the workouts matching `where` count towards.
+    """
+    result = await session.execute(
+        select(WorkoutExercise.exercise_id, WorkoutPlan.to_start)
+        .join(WorkoutPlan, WorkoutPlan.id == WorkoutExercise.workout_plan_id)
+        .where(where)
+        .distinct()
+    )
+    return {(exercise_id, to_start.date()) for exercise_id, to_start in result}
+
+
+def _day_ranges(days: Set[ExerciseDay]) -> List[Tuple[date, date, List[int]]]:
+    # Merge the days into runs of consecutive days, so a chunk of chronological
+    # writes becomes a single range, along with the exercises written in each.
+    ranges: List[Tuple[date, date, Set[int]]] = []
+    for day, exercise_id in sorted((day, exercise_id) for exercise_id, day in days):
+        if ranges and day - ranges[-1][1] <= timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day, ranges[-1][2] | {exercise_id})
+        else:
+            ranges.append((day, day, {exercise_id}))
+    return [(first, last, sorted(exercises)) for first, last, exercises in ranges]
+
+
+async def refresh_days(session: AsyncSession, days: Set[ExerciseDay]) -> None:
+    """
+    Recompute the given rollup rows from `workout_exercises` without committing,
+    so the caller's write and the rollup change land in one transaction.
+
+    Days are merged into runs of consecutive days and each run is recomputed
+    for the exercises written in it, in two statements that seek on
+    `workout_plans.to_start`; recomputing a row that did not change is
+    harmless. The cost grows with the number of workouts of those exercises
+    on those days rather than the whole history, concurrent writers of other
+    exercises do not rewrite each other's rows, and recomputing (rather than
+    adding deltas) keeps `max_weight` right after updates and deletes.
+    """
+    dialect = session.get_bind().dialect.name
+    for first, last, exercise_ids in _day_ranges(days):
+        await session.execute(
+            delete(DailyExerciseStats).where(
+                DailyExerciseStats.day >= first,
+                DailyExerciseStats.day <= last,
+                DailyExerciseStats.exercise_id.in_(exercise_ids),
+            )
+        )
+        query = _aggregate(dialect).where(
+            WorkoutPlan.to_start >= datetime.combine(first, time.min),
+            WorkoutPlan.to_start < datetime.combine(last + timedelta(days=1), time.min),
+            WorkoutExercise.exercise_id.in_(exercise_ids),
+        )
+        await session.execute(
+            insert(DailyExerciseStats).from_select(ROLLUP_COLUMNS, query)
+        )
+
+
+async def rebuild_rollups(session: AsyncSession) -> int:
+    """
+    Rebuild the whole rollup table from `workout_exercises` in one transaction.
+    Used for the initial backfill and to repair drift.
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    dialect = session.get_bind().dialect.name
+    await session.execute(delete(DailyExerciseStats))
+    await session.execute(
+        insert(DailyExerciseStats).from_select(ROLLUP_COLUMNS, _aggregate(dialect))
+    )
+    await session.commit()
+    return await session.scalar(
+        select(func.count()).select_from(DailyExerciseStats)
+    )
+
+
+class ProgressCrud:
+    """
+    Progress statistics read from the `daily_exercise_stats` rollup, so a
+    request reads one row per exercise and day instead of every workout.
+
+    Attributes:
+        session (AsyncSession): An asynchronous SQLAlchemy session for database operations.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_exercise_progress(
+        self, exercise_id: int, start: date | None = None, end: date | None = None
+    ) -> List[DailyExerciseStats]:
+        """
+        Daily totals and heaviest weight of one exercise, oldest first.
+        """
+        query = select(DailyExerciseStats).where(
+            DailyExerciseStats.exercise_id == exercise_id
+        )
+        if start is not None:
+            query = query.where(DailyExerciseStats.day >= start)
+        if end is not None:
+            query = query.where(DailyExerciseStats.day <= end)
+        result = await self.session.scalars(query.order_by(DailyExerciseStats.day))
+        return result.all()
+
+    async def get_daily_progress(
+        self, start: date | None = None, end: date | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Daily totals over all exercises, oldest first.
+        """
+        query = select(
+            DailyExerciseStats.day,
+            func.count(DailyExerciseStats.exercise_id).label("exercises"),
+            func.sum(DailyExerciseStats.entries).label("entries"),
+            func.sum(DailyExerciseStats.sets).label("sets"),
+            func.sum(DailyExerciseStats.repetitions).label("repetitions"),
+            func.sum(DailyExerciseStats.volume).label("volume"),
+        )
+        if start is not None:
+            query = query.where(DailyExerciseStats.day >= start)
+        if end is not None:
+            query = query.where(DailyExerciseStats.day <= end)
+        query = query.group_by(DailyExerciseStats.day).order_by(DailyExerciseStats.day)
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily_exercise_stats rollup from workout_exercises."
+    )
+    parser.parse_args()
+
+    async def rebuild():
+        async with async_session_maker() as session:
+            rows = await rebuild_rollups(session)
+        await engine.dispose()
+        print(f"daily_exercise_stats: {rows} rows")
+
+    asyncio.run(rebuild())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+import argparse
+import asyncio
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import and_, case, delete, insert, or_, select, union
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import async_session_maker, engine
+from models import ExerciseRecord, RepRecord, WorkoutExercise
+from schemas.workout import WorkoutStatus
+
+# (workout id, exercise id, weight, repetitions)
+RecordRow = Tuple[int, int, float, int]
+
+# Brzycki's formula diverges at 37 repetitions.
+BRZYCKI_MAX_REPETITIONS = 36
+
+# (ExerciseRecord value column, ExerciseRecord workout id column)
+RECORD_FIELDS = [
+    ("heaviest_weight", "heaviest_workout_id"),
+    ("best_epley", "epley_workout_id"),
+    ("best_brzycki", "brzycki_workout_id"),
+]
+
+
+def weight_key(weight: float) -> Decimal:
+    """The weight as stored in `rep_records.weight`, rounded to two decimals."""
+    return Decimal(str(round(weight, 2))).quantize(Decimal("0.01"))
+
+
+def _empty_record() -> Dict[str, Any]:
+    return {column: None for pair in RECORD_FIELDS for column in pair}
+
+
+def epley(weight: float, repetitions: int) -> float:
+    """Estimated one-rep max after Epley: w × (1 + r / 30)."""
+    if repetitions == 1:
+        return weight
+    return weight * (1 + repetitions / 30)
+
+
+def brzycki(weight: float, repetitions: int) -> float | None:
+    """Estimated one-rep max after Brzycki: w × 36 / (37 − r)."""
+    if repetitions > BRZYCKI_MAX_REPETITIONS:
+        return None
+    return weight * 36 / (37 - repetitions)
+
+
+async def record_rows(session: AsyncSession, *where) -> List[RecordRow]:
+    """
+    The completed, weighted sets among the workouts matching `where` (all
+    workouts if omitted), oldest first.
+    """
+    result = await session.execute(
+        select(
+            WorkoutExercise.id,
+            WorkoutExercise.exercise_id,
+            WorkoutExercise.weight,
+            WorkoutExercise.repetitions,
+        )
+        .where(
+            *where,
+            WorkoutExercise.status == WorkoutStatus.COMPLETED,
+            WorkoutExercise.weight.is_not(None),
+            WorkoutExercise.repetitions > 0,
+        )
+        .order_by(WorkoutExercise.id)
+    )
+    return result.all()
+
+
+def compute_records(
+    rows: Iterable[RecordRow],
+) -> Tuple[Dict[int, Dict[str, Any]], Dict[Tuple[int, Decimal], Tuple[int, int]]]:
+    """
+    Records set by `rows`, which must be ordered by workout id; on a tie the
+    earlier workout keeps the record.
+
+    Returns:
+        The ExerciseRecord columns per exercise id, and the
+        (repetitions, workout id) per (exercise id, `weight_key(weight)`).
+    """
+    records: Dict[int, Dict[str, Any]] = {}
+    rep_records: Dict[Tuple[int, Decimal], Tuple[int, int]] = {}
+    for workout_id, exercise_id, weight, repetitions in rows:
+        record = records.setdefault(exercise_id, _empty_record())
+        values = (weight, epley(weight, repetitions), brzycki(weight, repetitions))
+        for (field, workout_field), value in zip(RECORD_FIELDS, values):
+            if value is not None and (record[field] is None or value > record[field]):
+                record[field] = value
+                record[workout_field] = workout_id
+
+        key = (exercise_id, weight_key(weight))
+        best = rep_records.get(key)
+        if best is None or repetitions > best[0]:
+            rep_records[key] = (repetitions, workout_id)
+    return records, rep_records
+
+
+def _beats(value, workout_id, best, best_workout_id):
+    """
+    SQL condition of `value`, set by `workout_id`, beating the stored `best`;
+    on a tie the earlier workout keeps the record.
+    """
+    return and_(
+        value.is_not(None),
+        or_(
+            best.is_(None),
+            value > best,
+            and_(value == best, workout_id < best_workout_id),
+        ),
+    )
+
+
+def _upsert(dialect: str, model, rows: List[Dict[str, Any]], assignments):
+    """
+    INSERT `rows`, updating the rows whose primary key already exists with
+    `assignments(new)`, where `new` holds the values the INSERT carried.
+
+    MySQL applies the assignments in order, each seeing those before it, so
+    the `*_workout_id` columns come before the values they are compared on.
+    """
+    if dialect == "mysql":
+        statement = mysql.insert(model).values(rows)
+        return statement.on_duplicate_key_update(assignments(statement.inserted))
+    insert_ = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    statement = insert_(model).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[column.name for column in model.__table__.primary_key],
+        set_=dict(assignments(statement.excluded)),
+    )
+
+
+def _record_assignments(new) -> List[Tuple[str, Any]]:
+    workout_ids, values = [], []
+    for field, workout_field in RECORD_FIELDS:
+        best, best_workout_id = getattr(ExerciseRecord, field), getattr(
+            ExerciseRecord, workout_field
+        )
+        beats = _beats(new[field], new[workout_field], best, best_workout_id)
+        workout_ids.append(
+            (workout_field, case((beats, new[workout_field]), else_=best_workout_id))
+        )
+        values.append((field, case((beats, new[field]), else_=best)))
+    return workout_ids + values
+
+
+def _rep_record_assignments(new) -> List[Tuple[str, Any]]:
+    beats = _beats(
+        new.repetitions, new.workout_id, RepRecord.repetitions, RepRecord.workout_id
+    )
+    return [
+        ("workout_id", case((beats, new.workout_id), else_=RepRecord.workout_id)),
+        ("repetitions", case((beats, new.repetitions), else_=RepRecord.repetitions)),
+    ]
+
+
+async def apply_new_workouts(session: AsyncSession, ids: List[int]) -> None:
+    """
+    Raise the records beaten by newly created workouts. Does not commit.
+
+    The records are upserted and compared with the stored ones in the
+    database, so concurrent writes for the same exercise neither collide on
+    a new record nor lower one another's. Rows are written in key order to
+    keep the lock order the same across transactions.
+    """
+    records, rep_records = compute_records(
+        await record_rows(session, WorkoutExercise.id.in_(ids))
+    )
+    if not records:
+        return
+
+    dialect = session.get_bind().dialect.name
+    await session.execute(
+        _upsert(
+            dialect,
+            ExerciseRecord,
+            [
+                {"exercise_id": exercise_id, **records[exercise_id]}
+                for exercise_id in sorted(records)
+            ],
+            _record_assignments,
+        )
+    )
+    await session.execute(
+        _upsert(
+            dialect,
+            RepRecord,
+            [
+                {
+                    "exercise_id": exercise_id,
+                    "weight": weight,
+                    "repetitions": repetitions,
+                    "workout_id": workout_id,
+                }
+                for (exercise_id, weight), (repetitions, workout_id) in sorted(
+                    rep_records.items()
+                )
+            ],
+            _rep_record_assignments,
+        )
+    )
+
+
+async def record_inputs(session: AsyncSession, ids: List[int]) -> Dict[int, Tuple]:
+    """
+    The columns records are computed from, per workout among `ids` that exists.
+    """
+    result = await session.execute(
+        select(
+            WorkoutExercise.id,
+            WorkoutExercise.exercise_id,
+            WorkoutExercise.weight,
+            WorkoutExercise.repetitions,
+            WorkoutExercise.status,
+        ).where(WorkoutExercise.id.in_(ids))
+    )
+    return {workout_id: tuple(values) for workout_id, *values in result}
+
+
+async def record_holders(session: AsyncSession, ids: List[int]) -> Set[int]:
+    """The workouts among `ids` that hold a record."""
+    columns = [getattr(ExerciseRecord, column) for _, column in RECORD_FIELDS]
+    result = await session.scalars(
+        union(
+            *(select(column).where(column.in_(ids)) for column in columns),
+            select(RepRecord.workout_id).where(RepRecord.workout_id.in_(ids)),
+        )
+    )
+    return set(result.all())
+
+
+async def update_records(
+    session: AsyncSession, before: Dict[int, Tuple], after: Dict[int, Tuple]
+) -> None:
+    """
+    Bring the records in step with workouts that changed from `before` to
+    `after`, their `record_inputs`; deleted workouts are missing from `after`.
+    Does not commit.
+
+    Writes that leave the record inputs alone leave the records alone. An
+    exercise is only recomputed from its whole history when a changed workout
+    held one of its records; otherwise the changed workouts can only raise
+    records, like new ones.
+    """
+    changed = [
+        workout_id for workout_id, old in before.items() if after.get(workout_id) != old
+    ]
+    if not changed:
+        return
+
+    holders = await record_holders(session, changed)
+    stale = {before[workout_id][0] for workout_id in holders}
+    await recompute_records(session, stale)
+    raised = [
+        workout_id
+        for workout_id in changed
+        if workout_id in after and after[workout_id][0] not in stale
+    ]
+    if raised:
+        await apply_new_workouts(session, raised)
+
+
+async def recompute_records(session: AsyncSession, exercise_ids: Set[int]) -> None:
+    """
+    Recompute the records of the given exercises from all of their workouts,
+    as needed after an update or delete removed a record. Does not commit.
+    """
+    if not exercise_ids:
+        return
+
+    await session.execute(
+        delete(ExerciseRecord).where(ExerciseRecord.exercise_id.in_(exercise_ids))
+    )
+    await session.execute(
+        delete(RepRecord).where(RepRecord.exercise_id.in_(exercise_ids))
+    )
+    records, rep_records = compute_records(
+        await record_rows(session, WorkoutExercise.exercise_id.in_(exercise_ids))
+    )
+    await _insert_records(session, records, rep_records)
+
+
+async def _insert_records(session: AsyncSession, records, rep_records) -> None:
+    if records:
+        await session.execute(
+            insert(ExerciseRecord),
+            [
+                {"exercise_id": exercise_id, **values}
+                for exercise_id, values in records.items()
+            ],
+        )
+    if rep_records:
+        await session.execute(
+            insert(RepRecord),
+            [
+                {
+                    "exercise_id": exercise_id,
+                    "weight": weight,
+                    "repetitions": repetitions,
+                    "workout_id": workout_id,
+                }
+                for (exercise_id, weight), (
+                    repetitions,
+                    workout_id,
+                ) in rep_records.items()
+            ],
+        )
+
+
+def compute_records_vectorized(
+    rows: List[RecordRow],
+) -> Tuple[Dict[int, Dict[str, Any]], Dict[Tuple[int, Decimal], Tuple[int, int]]]:
+    """
+    NumPy version of `compute_records` for backfills over the whole history:
+    one sort per record instead of a Python loop over every set.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise RuntimeError("Rebuilding records requires the `numpy` package") from e
+
+    if not rows:
+        return {}, {}
+
+    data = np.array(rows, dtype=np.float64)
+    ids = data[:, 0].astype(np.int64)
+    exercises = data[:, 1].astype(np.int64)
+    weights = data[:, 2]
+    repetitions = data[:, 3]
+
+    epleys = np.where(repetitions == 1, weights, weights * (1 + repetitions / 30))
+    valid = repetitions <= BRZYCKI_MAX_REPETITIONS
+    brzyckis = np.where(
+        valid, weights * 36 / np.where(valid, 37 - repetitions, 1), -np.inf
+    )
+
+    def group_starts(*keys):
+        # Index of the first row of each group of equal `keys`.
+        change = np.zeros(len(keys[0]), dtype=bool)
+        change[0] = True
+        for key in keys:
+            change[1:] |= key[1:] != key[:-1]
+        return np.flatnonzero(change)
+
+    records: Dict[int, Dict[str, Any]] = {}
+    for (field, workout_field), values in zip(
+        RECORD_FIELDS, (weights, epleys, brzyckis)
+    ):
+        # Best value first within each exercise, earliest workout on ties.
+        order = np.lexsort((ids, -values, exercises))
+        best = order[group_starts(exercises[order])]
+        for i in best:
+            record = records.setdefault(int(exercises[i]), _empty_record())
+            if np.isfinite(values[i]):
+                record[field] = float(values[i])
+                record[workout_field] = int(ids[i])
+
+    # Rep records are kept per weight as stored, to two decimals.
+    rounded = np.round(weights, 2)
+    order = np.lexsort((ids, -repetitions, rounded, exercises))
+    best = order[group_starts(exercises[order], rounded[order])]
+    rep_records = {
+        (int(exercises[i]), weight_key(float(rounded[i]))): (
+            int(repetitions[i]),
+            int(ids[i]),
+        )
+        for i in best
+    }
+    return records, rep_records
+
+
+async def rebuild_records(session: AsyncSession) -> int:
+    """
+    Rebuild both record tables from every completed workout in one transaction.
+    Used for the initial backfill and to repair drift.
+
+    Returns:
+        int: The number of exercises with records.
+    """
+    rows = await record_rows(session)
+    records, rep_records = compute_records_vectorized(rows)
+    await session.execute(delete(ExerciseRecord))
+    await session.execute(delete(RepRecord))
+    await _insert_records(session, records, rep_records)
+    await session.commit()
+    return len(records)
+
+
+class RecordCrud:
+    """
+    Personal records read from the `exercise_records` and `rep_records` tables.
+
+    Attributes:
+        session (AsyncSession): An asynchronous SQLAlchemy session for database operations.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_records(self) -> List[ExerciseRecord]:
+        result = await self.session.scalars(
+            select(ExerciseRecord).order_by(ExerciseRecord.exercise_id)
+        )
+        return result.all()
+
+    async def get_exercise_records(self, exercise_id: int) -> Dict[str, Any]:
+        """
+        The records of one exercise, including the most repetitions per weight.
+        Exercises without completed workouts have empty records.
+        """
+        record = await self.session.get(ExerciseRecord, exercise_id)
+        result = await self.session.scalars(
+            select(RepRecord)
+            .where(RepRecord.exercise_id == exercise_id)
+            .order_by(RepRecord.weight)
+        )
+        values = _empty_record()
+        if record is not None:
+            values = {key: getattr(record, key) for key in values}
+        return {"exercise_id": exercise_id, **values, "rep_records": result.all()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild exercise_records and rep_records from workout_exercises."
+    )
+    parser.parse_args()
+
+    async def rebuild():
+        async with async_session_maker() as session:
+            exercises = await rebuild_records(session)
+        await engine.dispose()
+        print(f"exercise_records: {exercises} exercises")
+
+    asyncio.run(rebuild())
+
+
+if __name__ == "__main__":
+    main()
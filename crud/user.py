@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from models import User
 from schemas.token import Token
 from utils.jwt_handler import encode_token
-from utils.password import hash_password, verify_password
+from utils.password import (PasswordHashQueueFull, hash_password_async,
+                            verify_and_update_password_async)
 
 from .base import BaseCrud
 
@@ -34,7 +35,9 @@ class UserCrud(BaseCrud[User]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User already registered",
             )
-        user_data["password"] = hash_password(user_data["password"])
+        user_data["password"] = await UserCrud._run_password_task(
+            hash_password_async(user_data["password"])
+        )
         try:
             new_user = await self.create(user_data)
 
@@ -52,13 +55,30 @@ class UserCrud(BaseCrud[User]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User does not exist",
             )
-        if not verify_password(password, user.password):
+        valid, new_hash = await UserCrud._run_password_task(
+            verify_and_update_password_async(password, user.password)
+        )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid credentials",
             )
+        if new_hash:
+            # The stored hash uses an old scheme or cost; upgrade it transparently.
+            await self.update(user.id, {"password": new_hash})
         return UserCrud._create_token(user.id)
 
+    @staticmethod
+    async def _run_password_task(task):
+        try:
+            return await task
+        except PasswordHashQueueFull as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": "1"},
+            )
+
     @staticmethod
     def _create_token(user_id) -> Token:
         payload = {"user_id": user_id}
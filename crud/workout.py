@@ -1,10 +1,16 @@
-from typing import Any, Dict
+from datetime import date
+from typing import Any, Dict, List, Set, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import select
 
+from crud.analytics import volume_cache
 from crud.base import BaseCrud
-from models import WorkoutExercise
+from crud.progress import exercise_days, refresh_days
+from crud.records import apply_new_workouts, record_inputs, update_records
+from models import Exercise, WorkoutExercise, WorkoutPlan
+from schemas.bulk import BulkItemResult, BulkResult
 
 
 class WorkoutCrud(BaseCrud[WorkoutExercise]):
@@ -13,6 +19,8 @@ class WorkoutCrud(BaseCrud[WorkoutExercise]):
     This class extends BaseCrud, providing methods for creating, reading, updating, and deleting workout data.
     """
 
+    invalidates = (volume_cache,)
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize the WorkoutCrud class with an async database session.
@@ -22,6 +30,34 @@ class WorkoutCrud(BaseCrud[WorkoutExercise]):
         """
         super().__init__(WorkoutExercise, session)
 
+    async def _before_write(
+        self, ids: List[int]
+    ) -> Tuple[Set[Tuple[int, date]], Dict[int, Tuple]]:
+        return (
+            await exercise_days(self.session, WorkoutExercise.id.in_(ids)),
+            await record_inputs(self.session, ids),
+        )
+
+    async def _after_write(
+        self,
+        ids: List[int],
+        before: Tuple[Set[Tuple[int, date]], Dict[int, Tuple]] | None = None,
+    ) -> None:
+        # Refresh the rollup rows the workouts counted towards before and after
+        # the write, in the same transaction.
+        after = await exercise_days(self.session, WorkoutExercise.id.in_(ids))
+        if before is None:
+            await refresh_days(self.session, after)
+            # New workouts can only raise records.
+            await apply_new_workouts(self.session, ids)
+            return
+
+        days, inputs = before
+        await refresh_days(self.session, after | days)
+        await update_records(
+            self.session, inputs, await record_inputs(self.session, ids)
+        )
+
     async def get_workout_by_id(self, workout_id: int) -> WorkoutExercise:
         """
         Retrieve a workout by its ID from the database.
@@ -97,6 +133,8 @@ class WorkoutCrud(BaseCrud[WorkoutExercise]):
                     detail=f"Workout with ID {workout_id} not found",
                 )
             return updated_workout
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -124,8 +162,166 @@ class WorkoutCrud(BaseCrud[WorkoutExercise]):
                     detail=f"Workout with ID {workout_id} not found",
                 )
             return deleted
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error deleting workout: {str(e)}",
             )
+
+    async def _reference_errors(
+        self, items: List[Dict[str, Any]], partial: bool = False
+    ) -> Dict[int, str]:
+        """
+        Check the exercise and workout plan references of every item with one
+        query per referenced table.
+
+        Args:
+            items (list): The workout data of each item.
+            partial (bool): Whether missing references are allowed (updates).
+
+        Returns:
+            dict: The error message of each invalid item, keyed by its index.
+        """
+        exercise_ids = {
+            item["exercise_id"] for item in items if item.get("exercise_id")
+        }
+        plan_ids = {
+            item["workout_plan_id"] for item in items if item.get("workout_plan_id")
+        }
+        existing_exercises = set(
+            await self.session.scalars(
+                select(Exercise.id).where(Exercise.id.in_(exercise_ids))
+            )
+        )
+        existing_plans = set(
+            await self.session.scalars(
+                select(WorkoutPlan.id).where(WorkoutPlan.id.in_(plan_ids))
+            )
+        )
+
+        errors = {}
+        for index, item in enumerate(items):
+            plan_id = item.get("workout_plan_id")
+            exercise_id = item.get("exercise_id")
+            if plan_id is None and not partial:
+                errors[index] = "workout_plan_id is required"
+            elif plan_id is not None and plan_id not in existing_plans:
+                errors[index] = f"WorkoutPlan with ID {plan_id} not found"
+            elif exercise_id is not None and exercise_id not in existing_exercises:
+                errors[index] = f"Exercise with ID {exercise_id} not found"
+        return errors
+
+    async def bulk_create_workouts(self, items: List[Dict[str, Any]]) -> BulkResult:
+        """
+        Create many workouts in a single transaction.
+
+        Args:
+            items (list): A list of dictionaries containing the workout data.
+
+        Returns:
+            BulkResult: The created ID or the error of every item.
+
+        Raises:
+            HTTPException: If an error occurs during the creation process.
+        """
+        try:
+            errors = await self._reference_errors(items)
+            valid = [i for i in range(len(items)) if i not in errors]
+            created = await self.bulk_create([items[i] for i in valid])
+
+            results = [
+                BulkItemResult(index=index, error=error)
+                for index, error in errors.items()
+            ]
+            results += [
+                BulkItemResult(index=index, id=workout.id)
+                for index, workout in zip(valid, created)
+            ]
+            results.sort(key=lambda result: result.index)
+            return BulkResult(
+                succeeded=len(created), failed=len(errors), results=results
+            )
+        except Exception as e:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error creating workouts: {str(e)}",
+            )
+
+    async def bulk_update_workouts(self, items: List[Dict[str, Any]]) -> BulkResult:
+        """
+        Update many workouts in a single transaction.
+
+        Args:
+            items (list): A list of dictionaries with the workout ID and the updated data.
+
+        Returns:
+            BulkResult: The updated ID or the error of every item.
+
+        Raises:
+            HTTPException: If an error occurs during the update process.
+        """
+        try:
+            errors = await self._reference_errors(items, partial=True)
+            valid = [i for i in range(len(items)) if i not in errors]
+            updated = set(await self.bulk_update([items[i] for i in valid]))
+
+            results = []
+            for index, item in enumerate(items):
+                if index in errors:
+                    results.append(BulkItemResult(index=index, error=errors[index]))
+                elif item["id"] not in updated:
+                    results.append(
+                        BulkItemResult(
+                            index=index,
+                            error=f"Workout with ID {item['id']} not found",
+                        )
+                    )
+                else:
+                    results.append(BulkItemResult(index=index, id=item["id"]))
+            failed = sum(1 for result in results if result.error)
+            return BulkResult(
+                succeeded=len(results) - failed, failed=failed, results=results
+            )
+        except Exception as e:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error updating workouts: {str(e)}",
+            )
+
+    async def bulk_delete_workouts(self, workout_ids: List[int]) -> BulkResult:
+        """
+        Delete many workouts in a single transaction.
+
+        Args:
+            workout_ids (list): The IDs of the workouts to delete.
+
+        Returns:
+            BulkResult: The deleted ID or the error of every item.
+
+        Raises:
+            HTTPException: If an error occurs during the deletion process.
+        """
+        try:
+            deleted = set(await self.bulk_delete(workout_ids))
+            results = [
+                BulkItemResult(index=index, id=workout_id)
+                if workout_id in deleted
+                else BulkItemResult(
+                    index=index, error=f"Workout with ID {workout_id} not found"
+                )
+                for index, workout_id in enumerate(workout_ids)
+            ]
+            failed = sum(1 for result in results if result.error)
+            return BulkResult(
+                succeeded=len(results) - failed, failed=failed, results=results
+            )
+        except Exception as e:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error deleting workouts: {str(e)}",
+            )
@@ -1,16 +1,38 @@
-from typing import Any, Dict
+from datetime import date
+from typing import Any, Dict, List, Set, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.expression import select
 
+from crud.analytics import volume_cache
 from crud.base import BaseCrud
-from models import WorkoutPlan
+from crud.progress import exercise_days, refresh_days
+from models import Exercise, WorkoutExercise, WorkoutPlan
 
 
 class WorkoutPlanCrud(BaseCrud[WorkoutPlan]):
+    invalidates = (volume_cache,)
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(WorkoutPlan, session)
 
+    async def _before_write(self, ids: List[int]) -> Set[Tuple[int, date]]:
+        return await exercise_days(
+            self.session, WorkoutExercise.workout_plan_id.in_(ids)
+        )
+
+    async def _after_write(
+        self, ids: List[int], before: Set[Tuple[int, date]] | None = None
+    ) -> None:
+        # Moving a plan's start moves all of its workouts to another day.
+        if before:
+            after = await exercise_days(
+                self.session, WorkoutExercise.workout_plan_id.in_(ids)
+            )
+            await refresh_days(self.session, after | before)
+
     async def get_workout_plan_by_id(self, workout_plan_id: int) -> WorkoutPlan:
         try:
             workout: WorkoutPlan = await self.get_by_id(workout_plan_id)
@@ -26,6 +48,38 @@ class WorkoutPlanCrud(BaseCrud[WorkoutPlan]):
                 detail=f"Error fetching workout plan: {str(e)}",
             )
 
+    async def get_workout_plan_detail(self, workout_plan_id: int) -> WorkoutPlan:
+        # Two queries whatever the plan size: the plan, then its workout
+        # exercises joined to their exercise, category and muscle group.
+        query = (
+            select(WorkoutPlan)
+            .where(WorkoutPlan.id == workout_plan_id)
+            .options(
+                selectinload(WorkoutPlan.workout_exercises)
+                .joinedload(WorkoutExercise.exercise)
+                .options(
+                    joinedload(Exercise.category),
+                    joinedload(Exercise.muscle_group),
+                )
+            )
+        )
+        try:
+            result = await self.session.scalars(query)
+            workout: WorkoutPlan = result.first()
+            if not workout:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"WorkoutPlan with ID {workout_plan_id} not found",
+                )
+            return workout
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching workout plan: {str(e)}",
+            )
+
     async def create_workout_plan(
             self, workout_plan_data: Dict[str, Any]
     ) -> WorkoutPlan:
@@ -53,6 +107,8 @@ class WorkoutPlanCrud(BaseCrud[WorkoutPlan]):
                     detail=f"Workout Plan with ID {workout_plan_id} not found",
                 )
             return updated_workout
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -68,6 +124,8 @@ class WorkoutPlanCrud(BaseCrud[WorkoutPlan]):
                     detail=f"WorkoutPlan with ID {workout_plan_id} not found",
                 )
             return deleted
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
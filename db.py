@@ -1,15 +1,197 @@
-from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
-                                    create_async_engine)
+import time
+from typing import Any, AsyncIterator
+
+from fastapi import Request
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import config
+from utils.cache import create_cache
+from utils.query_stats import instrument
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that also records how long each checkout takes, including the
+    time spent waiting for a free connection or opening a new one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats["timeouts"] += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.wait_stats["checkouts"] += 1
+            self.wait_stats["wait_seconds_total"] += waited
+            self.wait_stats["wait_seconds_max"] = max(
+                self.wait_stats["wait_seconds_max"], waited
+            )
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+def create_engine(url: str = config.MYSQL_URL, **overrides: Any) -> AsyncEngine:
+    """
+    Create an async engine with the pool settings from `config`.
+    Keyword arguments override single settings, e.g. `pool_size` in load tests.
+    """
+    backend = make_url(url).get_backend_name()
+    timeout_arg = "timeout" if backend == "sqlite" else "connect_timeout"
+    settings = {
+        "poolclass": TimedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": {timeout_arg: config.DB_CONNECT_TIMEOUT},
+        "echo": config.DB_ECHO,
+    }
+    settings.update(overrides)
+    engine = create_async_engine(url, **settings)
+    instrument(engine)
+    return engine
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        **getattr(pool, "wait_stats", {}),
+    }
+
 
-engine = create_async_engine(config.MYSQL_URL)
+class ReplicaRouter:
+    """
+    Hands out sessions on read replicas, round-robin over the healthy ones.
+
+    A replica that fails to connect, or lags more than
+    `DB_REPLICA_MAX_LAG_SECONDS` according to `DB_REPLICA_LAG_QUERY`, is skipped
+    for `DB_REPLICA_RETRY_SECONDS`. Users who just wrote are pinned to the
+    primary for `DB_READ_YOUR_WRITES_SECONDS` after their write so they read
+    their own writes.
+    """
+
+    def __init__(self, urls: list[str]):
+        self.session_makers = [
+            async_sessionmaker(bind=create_engine(url), expire_on_commit=False)
+            for url in urls
+        ]
+        # Shared by all workers under CACHE_BACKEND=redis, so the next read
+        # finds the pin whichever worker serves it.
+        self.pinned_users = create_cache(
+            "read_your_writes",
+            maxsize=config.DB_READ_YOUR_WRITES_MAX_USERS,
+            ttl=config.DB_READ_YOUR_WRITES_SECONDS,
+        )
+        self._down_until = [0.0] * len(urls)
+        self._lag_checked_at = [0.0] * len(urls)
+        self._next = 0
+
+    async def pin(self, user_id: int | None) -> None:
+        if user_id is not None:
+            await self.pinned_users.set(user_id, True)
+
+    async def is_pinned(self, user_id: int | None) -> bool:
+        return user_id is not None and await self.pinned_users.get(user_id) is not None
+
+    async def _is_lagging(self, index: int, session: AsyncSession) -> bool:
+        now = time.monotonic()
+        if (
+            not config.DB_REPLICA_LAG_QUERY
+            or now - self._lag_checked_at[index] < config.DB_REPLICA_LAG_CHECK_INTERVAL
+        ):
+            return False
+        self._lag_checked_at[index] = now
+        lag = await session.scalar(text(config.DB_REPLICA_LAG_QUERY))
+        return lag is None or lag > config.DB_REPLICA_MAX_LAG_SECONDS
+
+    async def open_session(self) -> AsyncSession | None:
+        """
+        Open a session on the next healthy replica, or return None when the
+        primary has to serve the read.
+        """
+        for _ in range(len(self.session_makers)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.session_makers)
+            if self._down_until[index] > time.monotonic():
+                continue
+
+            session = self.session_makers[index]()
+            # Lets callers tell replica reads apart, e.g. to keep possibly
+            # lagging rows out of shared caches.
+            session.info["replica"] = True
+            try:
+                await session.connection()
+                if not await self._is_lagging(index, session):
+                    return session
+            except Exception:
+                pass
+            await session.close()
+            self._down_until[index] = time.monotonic() + config.DB_REPLICA_RETRY_SECONDS
+        return None
+
+
+engine = create_engine()
 async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+replicas = ReplicaRouter(
+    [url.strip() for url in config.DB_REPLICA_URLS.split(",") if url.strip()]
+)
 
 Base = declarative_base()
 
 
-async def get_async_session() -> AsyncSession:
+async def get_async_session(request: Request = None) -> AsyncIterator[AsyncSession]:
+    """
+    Yield a session on a replica for read-only requests, and on the primary for
+    writes, for users inside their read-your-writes window, for requests that
+    set `request.state.read_primary` and when no replica is healthy.
+    """
+    user = request.scope.get("user") if request is not None else None
+    user_id = getattr(user, "id", None)
+
+    writes = request is not None and request.method not in READ_METHODS
+    if request is not None and not writes:
+        if not await replicas.is_pinned(user_id) and not getattr(
+            request.state, "read_primary", False
+        ):
+            session = await replicas.open_session()
+            if session is not None:
+                async with session:
+                    yield session
+                return
+    elif writes:
+        # For reads sent while the write is still running.
+        await replicas.pin(user_id)
+
     async with async_session_maker() as session:
         yield session
+    if writes:
+        # Again once the write is done, so the window starts after its last
+        # commit however long it ran.
+        await replicas.pin(user_id)
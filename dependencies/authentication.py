@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from utils.jwt_handler import decode_token
@@ -12,18 +12,26 @@ class AuthenticationRequired:
 
     def __init__(
         self,
+        request: Request,
         token: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=True)),
     ):
         """
         Initializes the authentication dependency by checking the provided token.
+        Reuses the payload already verified by AuthBackend for this request.
 
         Args:
+            request (Request): The current request.
             token (HTTPAuthorizationCredentials): Bearer token from the Authorization header.
 
         Raises:
             HTTPException: If the token is missing or invalid.
         """
         self.token = token.credentials
+        payload = getattr(request.state, "token_payload", None)
+        if payload is not None:
+            self.user_payload = payload
+            return
+
         try:
             self.user_payload = decode_token(self.token)
         except Exception:
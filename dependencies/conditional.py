@@ -0,0 +1,78 @@
+import hashlib
+
+from fastapi import HTTPException, Request, Response, status
+
+from middleware.compression import cached_response
+from utils.cache import table_version
+
+
+class PrecompressedHit(Exception):
+    """
+    Raised by `ConditionalGet` to answer with a stored response instead of
+    running the route; the app's handler for it returns `response`.
+    """
+
+    def __init__(self, response: Response):
+        self.response = response
+
+
+class ConditionalGet:
+    """
+    Route dependency that adds a strong `ETag` and a `Cache-Control` header to
+    a GET response, and answers a matching `If-None-Match` with 304 Not Modified.
+
+    The ETag is derived from the request URL and the versions of the tables
+    the response is read from, not from the body, so it is known before the
+    route runs. Listed in the route's `dependencies`, it runs before the
+    session dependency: a 304 opens no database session at all.
+
+    With `precompress=True` the encoded response of each ETag, as sent by
+    `CompressionMiddleware`, is kept in memory and served for later requests
+    asking for the same encoding, without querying or serializing again.
+
+    Requests that get past it are read from the primary: a lagging replica
+    would pair the current versions, and so the ETag and the stored
+    response, with rows older than the last write.
+    """
+
+    def __init__(
+        self, *tables: str, cache_control: str, precompress: bool = False
+    ):
+        """
+        Args:
+            tables (str): Names of the tables the response is built from.
+            cache_control (str): The `Cache-Control` header to send.
+            precompress (bool): Serve repeated requests from stored responses.
+        """
+        self.tables = tables
+        self.cache_control = cache_control
+        self.precompress = precompress
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        versions = [await table_version(table).get() for table in self.tables]
+        key = "|".join([request.url.path, request.url.query, *versions])
+        etag = f'"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            # Weak comparison, as RFC 9110 requires for If-None-Match.
+            candidates |= {tag[2:] for tag in candidates if tag.startswith("W/")}
+            if etag in candidates or "*" in candidates:
+                raise HTTPException(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+        # Set by CompressionMiddleware; absent when it is not installed.
+        encoding = getattr(request.state, "content_encoding", None)
+        if self.precompress and encoding is not None:
+            entry = cached_response(etag, encoding)
+            if entry is not None:
+                raw_headers, body = entry
+                stored = Response(content=body)
+                stored.raw_headers = list(raw_headers)
+                raise PrecompressedHit(stored)
+            request.state.precompress_etag = etag
+        request.state.read_primary = True
+        response.headers.update(headers)
@@ -0,0 +1,26 @@
+from fastapi import HTTPException, Request, status
+
+from config import config
+from middleware.profiling import authorized
+
+
+class ProfileAccessRequired:
+    """
+    Restricts a route to clients sending PROFILE_TOKEN in the PROFILE_HEADER
+    header, as they may profile requests. A 403 Forbidden error is raised
+    otherwise, and always when no token is configured.
+    """
+
+    def __init__(self, request: Request):
+        """
+        Args:
+            request (Request): The current request.
+
+        Raises:
+            HTTPException: If the profiling token is missing or wrong.
+        """
+        if not authorized(request.headers.get(config.PROFILE_HEADER)):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Profiling token required.",
+            )
@@ -0,0 +1,22 @@
+from utils.query_stats import current_queries
+
+
+class QueryBudget:
+    """
+    Route dependency declaring how many SQL statements the route may run per
+    request, in place of SQL_QUERY_BUDGET. `QueryStatsMiddleware` logs
+    requests over it, and the `utils.query_budget_plugin` pytest plugin fails
+    the tests that make them.
+    """
+
+    def __init__(self, queries: int):
+        """
+        Args:
+            queries (int): Statements the route may run per request.
+        """
+        self.queries = queries
+
+    async def __call__(self) -> None:
+        stats = current_queries.get()
+        if stats is not None:
+            stats.budget = self.queries
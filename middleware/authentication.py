@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 from starlette.authentication import AuthenticationBackend
@@ -5,14 +6,35 @@ from starlette.middleware.authentication import \
     AuthenticationMiddleware as BaseAuthenticationMiddleware
 from starlette.requests import HTTPConnection
 
+from config import config
 from schemas.user import CurrentUser
 from utils.jwt_handler import decode_token
+from utils.metrics import parse_buckets, registry
+
+authentication_duration = registry.histogram(
+    "authentication_duration_seconds",
+    "Time spent verifying the bearer token of a request.",
+    ("result",),
+    parse_buckets(config.METRICS_AUTH_BUCKETS),
+)
 
 
 class AuthBackend(AuthenticationBackend):
     async def authenticate(
         self,
         conn: HTTPConnection,
+    ) -> tuple[bool, Optional[CurrentUser]]:
+        start = time.perf_counter()
+        authenticated, current_user = await self._authenticate(conn)
+        if conn.headers.get("Authorization"):
+            authentication_duration.labels(
+                "success" if authenticated else "failure"
+            ).observe(time.perf_counter() - start)
+        return authenticated, current_user
+
+    async def _authenticate(
+        self,
+        conn: HTTPConnection,
     ) -> tuple[bool, Optional[CurrentUser]]:
         current_user: CurrentUser = CurrentUser()
 
@@ -37,6 +59,8 @@ class AuthBackend(AuthenticationBackend):
         except Exception:
             return False, current_user
 
+        # Share the verified payload so AuthenticationRequired does not decode again.
+        conn.state.token_payload = payload
         current_user.id = user_id
         return True, current_user
 
@@ -0,0 +1,235 @@
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config
+from utils.cache import LRUCache
+
+# Responses of these types are already compressed, or must not be buffered.
+EXCLUDED_CONTENT_TYPES = ("image/", "video/", "audio/", "application/zip", "text/event-stream")
+
+# Encoded catalog responses, keyed by (ETag, encoding). Filled by the
+# middleware for requests `ConditionalGet(precompress=True)` marks, and served
+# by that dependency, so each version of a catalog page is serialized and
+# compressed once per worker.
+precompressed = LRUCache(
+    "precompressed",
+    maxsize=config.PRECOMPRESSED_MAX_SIZE,
+    ttl=config.TABLE_VERSION_TTL,
+)
+
+
+class Compressor:
+    """
+    Incremental compressor: `compress` returns what can be sent so far, or,
+    with `flush=True`, everything fed in up to now; `finish` ends the stream.
+    """
+
+    def __init__(
+        self,
+        compress: Callable[[bytes], bytes],
+        flush: Callable[[], bytes],
+        finish: Callable[[], bytes],
+    ):
+        self._compress = compress
+        self._flush = flush
+        self.finish = finish
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compress(data)
+        return output + self._flush() if flush else output
+
+
+def _gzip() -> Compressor:
+    compressor = zlib.compressobj(config.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return Compressor(
+        compressor.compress,
+        lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+        compressor.flush,
+    )
+
+
+def _brotli() -> Compressor:
+    import brotli
+
+    compressor = brotli.Compressor(quality=config.COMPRESSION_BROTLI_QUALITY)
+    return Compressor(compressor.process, compressor.flush, compressor.finish)
+
+
+def _zstd() -> Compressor:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(
+        level=config.COMPRESSION_ZSTD_LEVEL
+    ).compressobj()
+    return Compressor(
+        compressor.compress,
+        lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        compressor.flush,
+    )
+
+
+def available_encodings() -> Dict[str, Callable[[], Compressor]]:
+    """
+    The encodings of COMPRESSION_ENCODINGS whose library is installed, in the
+    server's order of preference. gzip needs nothing beyond the standard
+    library; br needs `brotli` and zstd needs `zstandard`.
+    """
+    factories = {"gzip": _gzip, "br": _brotli, "zstd": _zstd}
+    modules = {"br": "brotli", "zstd": "zstandard"}
+    encodings = {}
+    for name in config.COMPRESSION_ENCODINGS.split(","):
+        name = name.strip()
+        if name not in factories:
+            continue
+        if name in modules:
+            try:
+                __import__(modules[name])
+            except ImportError:
+                continue
+        encodings[name] = factories[name]
+    return encodings
+
+
+def negotiate(accept_encoding: str, encodings: List[str]) -> str:
+    """
+    Pick the encoding for an `Accept-Encoding` header: the highest q-value
+    wins, the server's order breaks ties. Returns "identity" if none fits.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = "identity", 0.0
+    for name in encodings:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best encoding the client accepts among
+    gzip, br and zstd.
+
+    Bodies smaller than COMPRESSION_MINIMUM_SIZE, partial responses,
+    responses that already have a Content-Encoding and excluded media types
+    are sent as they are. Streaming responses, such as the exports, are
+    compressed chunk by chunk and flushed after each one. A compressed
+    response's ETag becomes weak, as it no longer names the exact bytes
+    the route produced; `ConditionalGet` compares tags weakly.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), list(self.encodings)
+        )
+        # Read by ConditionalGet to look up a precompressed response.
+        scope.setdefault("state", {})["content_encoding"] = encoding
+        responder = _Responder(scope, send, encoding, self.encodings.get(encoding))
+        await self.app(scope, receive, responder.send)
+
+
+class _Responder:
+    def __init__(
+        self,
+        scope: Scope,
+        send: Send,
+        encoding: str,
+        factory: Callable[[], Compressor] | None,
+    ):
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.factory = factory
+        self.start: Message | None = None
+        self.compressor: Compressor | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or content_type.startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            if self.passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.factory is None or (
+                not more_body and len(body) < config.COMPRESSION_MINIMUM_SIZE
+            ):
+                self.passthrough = True
+                self._store(start, headers, body, more_body)
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self.compressor = self.factory()
+            headers["Content-Encoding"] = self.encoding
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+                body = self.compressor.compress(body, flush=True)
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                self._store(start, headers, body, more_body)
+            await self._send(start)
+            await self._send({**message, "body": body})
+            return
+
+        if more_body:
+            body = self.compressor.compress(body, flush=True)
+        else:
+            body = self.compressor.compress(body) + self.compressor.finish()
+        await self._send({**message, "body": body})
+
+    def _store(
+        self, start: Message, headers: MutableHeaders, body: bytes, more_body: bool
+    ) -> None:
+        etag = self.scope.get("state", {}).get("precompress_etag")
+        if etag is None or more_body or start["status"] != 200:
+            return
+        entry: Tuple[List[Tuple[bytes, bytes]], bytes] = (list(headers.raw), body)
+        precompressed.set_nowait((etag, self.encoding), entry)
+
+
+def cached_response(etag: str, encoding: str) -> Any:
+    """The stored (raw headers, body) of a precompressed response, or None."""
+    return precompressed.get_nowait((etag, encoding))
@@ -0,0 +1,82 @@
+import time
+from typing import Dict, Iterable
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config
+from utils.metrics import parse_buckets, registry
+
+# Label of requests no route matched, so unknown URLs do not add series.
+UNMATCHED = "<unmatched>"
+
+requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests being served.", ("method",)
+)
+requests_total = registry.counter(
+    "http_requests_total", "HTTP requests served.", ("method", "route", "status")
+)
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an HTTP request to sending the end of its response.",
+    ("method", "route"),
+    parse_buckets(config.METRICS_LATENCY_BUCKETS),
+)
+
+# Full path templates of included routes, by route id. Depending on the
+# FastAPI version, the route set on the scope is the router's own, whose path
+# lacks the prefix given to `include_router`.
+route_templates: Dict[int, str] = {}
+
+
+def register_routes(prefix: str, routes: Iterable[BaseRoute]) -> None:
+    """Record the path templates of `routes`, included under `prefix`."""
+    for route in routes:
+        path = getattr(route, "path", None)
+        if path is not None:
+            route_templates[id(route)] = prefix + path
+
+
+def route_template(scope: Scope) -> str:
+    # Set by the router on the scope once a route matched.
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED
+    return route_templates.get(id(route)) or getattr(route, "path", UNMATCHED)
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, status and in-flight count of every HTTP request,
+    labelled with the route's path template (`/exercise/{exercise_id}`)
+    rather than the URL, which keeps the number of series bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = requests_in_progress.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            route = route_template(scope)
+            request_duration.labels(method, route).observe(duration)
+            requests_total.labels(method, route, str(status_code)).inc()
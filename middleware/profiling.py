@@ -0,0 +1,66 @@
+import asyncio
+import random
+import secrets
+import sys
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config
+from utils.profiler import Sampler, profile_filename, save_profile
+
+# Where the routes listing profiles are mounted; requests to them are never
+# profiled, though they carry the profiling token.
+PROFILES_PATH = "/profiles"
+
+
+def authorized(token: str | None) -> bool:
+    """Whether `token` is the configured PROFILE_TOKEN; never when none is set."""
+    return bool(config.PROFILE_TOKEN) and secrets.compare_digest(
+        (token or "").encode(), config.PROFILE_TOKEN.encode()
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that send PROFILE_TOKEN in the PROFILE_HEADER header,
+    and a random PROFILE_SAMPLE_RATE share of all others, with `Sampler`.
+
+    Profiles are written to PROFILE_DIR once the response is sent, and the
+    response names its profile in an `X-Profile-Id` header. Requests that are
+    not profiled only pay for the header lookup and the random draw.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(PROFILES_PATH)
+            or not (
+                authorized(Headers(scope=scope).get(config.PROFILE_HEADER))
+                or random.random() < config.PROFILE_SAMPLE_RATE
+            )
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        filename = profile_filename(method, path)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", filename)
+            await send(message)
+
+        # Samples start at this frame, leaving out the server's.
+        sampler = Sampler(asyncio.current_task().get_coro(), sys._getframe())
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            await asyncio.to_thread(
+                save_profile, sampler, filename, f"{method} {path}"
+            )
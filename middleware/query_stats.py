@@ -0,0 +1,62 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config
+from middleware.metrics import route_template
+from utils.metrics import registry
+from utils.query_stats import QueryStats, check, current_queries
+
+over_budget_total = registry.counter(
+    "sql_query_budget_exceeded_total",
+    "Requests that ran more SQL statements than their budget.",
+    ("method", "route"),
+)
+repeated_total = registry.counter(
+    "sql_repeated_statements_total",
+    "Requests that repeated a statement often enough to be a likely N+1.",
+    ("method", "route"),
+)
+
+
+class QueryStatsMiddleware:
+    """
+    Counts and times the SQL statements each request runs.
+
+    Requests over their query budget (SQL_QUERY_BUDGET, or the route's
+    `QueryBudget`) and statements repeated SQL_REPEATED_QUERY_THRESHOLD times
+    within one request are logged and counted in /metrics. With DEBUG on,
+    responses carry the count and time in a `Server-Timing` header; a
+    streaming response only reports the statements run before it started.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+
+        async def send_wrapper(message: Message) -> None:
+            if config.DEBUG and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        token = current_queries.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_queries.reset(token)
+            if stats.count:
+                method, route = scope["method"], route_template(scope)
+                check(stats, method, route)
+                if stats.count > stats.budget:
+                    over_budget_total.labels(method, route).inc()
+                if stats.repeated():
+                    repeated_total.labels(method, route).inc()
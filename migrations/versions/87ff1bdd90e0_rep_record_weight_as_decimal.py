@@ -0,0 +1,43 @@
+"""rep record weight as decimal
+
+Revision ID: 87ff1bdd90e0
+Revises: d21dfe8a32e7
+Create Date: 2026-10-17 09:02:41.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '87ff1bdd90e0'
+down_revision: Union[str, None] = 'd21dfe8a32e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_rep_records(weight_type: sa.types.TypeEngine) -> None:
+    op.create_table('rep_records',
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('weight', weight_type, nullable=False),
+    sa.Column('repetitions', sa.Integer(), nullable=False),
+    sa.Column('workout_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ),
+    sa.PrimaryKeyConstraint('exercise_id', 'weight')
+    )
+
+
+def upgrade() -> None:
+    # rep_records is derived from workout_exercises, and FLOAT keys that
+    # differ only past the second decimal would collide as DECIMAL, so the
+    # table is recreated rather than altered. Refill it afterwards with
+    # `python -m crud.records`.
+    op.drop_table('rep_records')
+    _create_rep_records(sa.Numeric(precision=6, scale=2))
+
+
+def downgrade() -> None:
+    op.drop_table('rep_records')
+    _create_rep_records(sa.Float())
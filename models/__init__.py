@@ -1,7 +1,9 @@
 from db import Base
 
 from .category import Category
+from .daily_exercise_stats import DailyExerciseStats
 from .exercise import Exercise
+from .exercise_record import ExerciseRecord, RepRecord
 from .muscle_group import MuscleGroup
 from .user import User
 from .workout_exercie import WorkoutExercise
@@ -15,4 +17,7 @@ __all__ = [
     "Category",
     "MuscleGroup",
     "WorkoutPlan",
+    "DailyExerciseStats",
+    "ExerciseRecord",
+    "RepRecord",
 ]
@@ -0,0 +1,34 @@
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db import Base
+
+
+class DailyExerciseStats(Base):
+    """
+    Rollup of the completed workouts of one exercise on one day, kept in step
+    with `workout_exercises` by `WorkoutCrud` and `WorkoutPlanCrud`.
+    """
+
+    __tablename__ = "daily_exercise_stats"
+
+    exercise_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("exercises.id"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True, index=True)
+    entries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    repetitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    volume: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    max_weight: Mapped[float] = mapped_column(Float, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DailyExerciseStats: ExerciseID={self.exercise_id}, Day={self.day}, "
+            f"Volume={self.volume}>"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -1,17 +1,30 @@
+from typing import TYPE_CHECKING
+
 from sqlalchemy import ForeignKey, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import Base
 
+if TYPE_CHECKING:
+    from .category import Category
+    from .muscle_group import MuscleGroup
+
 
 class Exercise(Base):
     __tablename__ = "exercises"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(255))
+    name: Mapped[str] = mapped_column(String(255), index=True)
     description: Mapped[str] = mapped_column(Text)
-    category_id: Mapped[int] = mapped_column(Integer, ForeignKey("category.id"))
-    muscle_group_id: Mapped[str] = mapped_column(Integer, ForeignKey("muscle_group.id"))
+    category_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("category.id"), index=True
+    )
+    muscle_group_id: Mapped[str] = mapped_column(
+        Integer, ForeignKey("muscle_group.id"), index=True
+    )
+
+    category: Mapped["Category"] = relationship(lazy="raise")
+    muscle_group: Mapped["MuscleGroup"] = relationship(lazy="raise")
 
     def __repr__(self):
         return f"<Exercise(id={self.id}, name={self.name}, category={self.category_id}, muscle_group={self.muscle_group_id})>"
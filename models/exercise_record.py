@@ -0,0 +1,63 @@
+from decimal import Decimal
+
+from sqlalchemy import Float, ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db import Base
+
+
+class ExerciseRecord(Base):
+    """
+    Personal records of one exercise over its completed workouts, kept in step
+    with `workout_exercises` by `WorkoutCrud`. The `*_workout_id` columns point
+    at the workout that set each record.
+    """
+
+    __tablename__ = "exercise_records"
+
+    exercise_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("exercises.id"), primary_key=True
+    )
+    heaviest_weight: Mapped[float] = mapped_column(Float, nullable=True)
+    heaviest_workout_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    best_epley: Mapped[float] = mapped_column(Float, nullable=True)
+    epley_workout_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    best_brzycki: Mapped[float] = mapped_column(Float, nullable=True)
+    brzycki_workout_id: Mapped[int] = mapped_column(Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ExerciseRecord: ExerciseID={self.exercise_id}, "
+            f"Heaviest={self.heaviest_weight}, Epley={self.best_epley}>"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+class RepRecord(Base):
+    """
+    Most repetitions done in one set of an exercise at a given weight.
+
+    The weight is part of the primary key, so it is stored exactly, to two
+    decimals; a FLOAT key would not match the value it was written with on
+    MySQL.
+    """
+
+    __tablename__ = "rep_records"
+
+    exercise_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("exercises.id"), primary_key=True
+    )
+    weight: Mapped[Decimal] = mapped_column(Numeric(6, 2), primary_key=True)
+    repetitions: Mapped[int] = mapped_column(Integer, nullable=False)
+    workout_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RepRecord: ExerciseID={self.exercise_id}, Weight={self.weight}, "
+            f"Repetitions={self.repetitions}>"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
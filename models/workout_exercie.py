@@ -1,9 +1,15 @@
+from typing import TYPE_CHECKING
+
 from sqlalchemy import Enum, Float, ForeignKey, Integer, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import Base
 from schemas.workout import WorkoutStatus
 
+if TYPE_CHECKING:
+    from .exercise import Exercise
+    from .workout_plan import WorkoutPlan
+
 
 class WorkoutExercise(Base):
     __tablename__ = "workout_exercises"
@@ -11,10 +17,10 @@ class WorkoutExercise(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     workout_plan_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("workout_plans.id"), nullable=False
+        Integer, ForeignKey("workout_plans.id"), nullable=False, index=True
     )
     exercise_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("exercises.id"), nullable=False
+        Integer, ForeignKey("exercises.id"), nullable=False, index=True
     )
     sets: Mapped[int] = mapped_column(Integer, nullable=True)
     repetitions: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -23,6 +29,11 @@ class WorkoutExercise(Base):
         Enum(WorkoutStatus), default=WorkoutStatus.TO_BE_STARTED
     )
 
+    workout_plan: Mapped["WorkoutPlan"] = relationship(
+        back_populates="workout_exercises", lazy="raise"
+    )
+    exercise: Mapped["Exercise"] = relationship(lazy="raise")
+
     def __repr__(self):
         return f"<WorkoutExercise(id={self.id}, sets={self.sets}, repetitions={self.repetitions},weight={self.weight})>"
 
@@ -1,10 +1,15 @@
 from datetime import datetime
 
+from typing import TYPE_CHECKING, List
+
 from sqlalchemy import DateTime, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import Base
 
+if TYPE_CHECKING:
+    from .workout_exercie import WorkoutExercise
+
 
 class WorkoutPlan(Base):
     __tablename__ = "workout_plans"
@@ -13,13 +18,17 @@ class WorkoutPlan(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     to_start: Mapped[DateTime] = mapped_column(
-        DateTime, nullable=False, default=datetime.now
+        DateTime, nullable=False, default=datetime.now, index=True
     )
     to_end: Mapped[DateTime] = mapped_column(
         DateTime,
         nullable=True,
     )
 
+    workout_exercises: Mapped[List["WorkoutExercise"]] = relationship(
+        back_populates="workout_plan", lazy="raise"
+    )
+
     def __repr__(self):
         return f"WorkoutPlan: ID={self.id}, Name={self.name}, ToStart={self.to_start}"
 
@@ -1,20 +1,58 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from crud.exercise import load_search_index
+from db import async_session_maker, engine, pool_stats
+from dependencies.conditional import PrecompressedHit
 from middleware.authentication import AuthBackend, AuthenticationMiddleware
+from middleware.compression import CompressionMiddleware
+from middleware.metrics import MetricsMiddleware, register_routes
+from middleware.profiling import PROFILES_PATH, ProfilingMiddleware
+from middleware.query_stats import QueryStatsMiddleware
+from utils.cache import RedisCache, caches
+from utils.metrics import registry
+from utils.password import password_pool_stats
 
+from .analytics import router as analytics_router
 from .category import router as category_router
 from .exercise import router as exercise_router
+from .export import router as export_router
+from .importer import router as import_router
 from .muscle_group import router as muscle_group_router
+from .profile import router as profile_router
+from .progress import router as progress_router
+from .record import router as record_router
 from .user import router as user_router
 from .workout_exercise import router as workout_router
 from .workout_plan import router as workout_plan_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the exercise search index; if the database is not reachable yet it
+    # is built by the first search instead.
+    try:
+        async with async_session_maker() as session:
+            await load_search_index(session)
+    except Exception:
+        pass
+    yield
+    for cache in list(caches.values()):
+        if isinstance(cache, RedisCache):
+            await cache.close()
+
+
 app = FastAPI(
     title="Fitness Workout Tracker",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Innermost, so stored precompressed responses carry no per-request CORS headers
+app.add_middleware(CompressionMiddleware)
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +62,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(AuthenticationMiddleware, backend=AuthBackend())
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+# Outermost, so recorded latencies cover every other middleware
+app.add_middleware(MetricsMiddleware)
+
+
+@registry.collector
+def db_pool_metrics():
+    stats = pool_stats(engine)
+    yield "db_pool_size", "gauge", "Connections the pool keeps open.", [
+        ({}, stats["size"])
+    ]
+    yield "db_pool_checked_out", "gauge", "Connections in use.", [
+        ({}, stats["checked_out"])
+    ]
+    yield "db_pool_checked_in", "gauge", "Idle connections in the pool.", [
+        ({}, stats["checked_in"])
+    ]
+    yield "db_pool_overflow", "gauge", "Connections opened beyond the pool size.", [
+        ({}, stats["overflow"])
+    ]
+    if "checkouts" in stats:
+        yield "db_pool_checkouts_total", "counter", "Connection checkouts.", [
+            ({}, stats["checkouts"])
+        ]
+        yield "db_pool_timeouts_total", "counter", "Checkouts that timed out.", [
+            ({}, stats["timeouts"])
+        ]
+        yield "db_pool_wait_seconds_total", "counter", "Time spent in checkouts.", [
+            ({}, stats["wait_seconds_total"])
+        ]
+
+
+@registry.collector
+def password_pool_metrics():
+    stats = password_pool_stats()
+    yield "password_hash_queue_depth", "gauge", "Password operations queued.", [
+        ({}, stats["queue_depth"])
+    ]
+    yield "password_hash_in_progress", "gauge", "Password operations running.", [
+        ({}, stats["in_progress"])
+    ]
+
+
+@registry.collector
+def cache_metrics():
+    stats = {name: cache.stats() for name, cache in caches.items()}
+    yield "cache_hits_total", "counter", "Cache lookups that found an entry.", [
+        ({"cache": name}, cache["hits"]) for name, cache in stats.items()
+    ]
+    yield "cache_misses_total", "counter", "Cache lookups that found nothing.", [
+        ({"cache": name}, cache["misses"]) for name, cache in stats.items()
+    ]
 
 
 @app.get("/")
@@ -48,6 +139,43 @@ async def health_check():
     )
 
 
+@app.get("/health/db")
+async def db_stats():
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=pool_stats(engine),
+    )
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={name: cache.stats() for name, cache in caches.items()},
+    )
+
+
+@app.get("/health/password")
+async def password_stats():
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=password_pool_stats(),
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    return Response(
+        content=registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.exception_handler(PrecompressedHit)
+async def precompressed_hit_handler(request: Request, exc: PrecompressedHit):
+    return exc.response
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
@@ -57,9 +185,19 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 # Register routes
-app.include_router(user_router, prefix="/user", tags=["User"])
-app.include_router(workout_router, prefix="/workout", tags=["Workout Management"])
-app.include_router(exercise_router, prefix="/exercise", tags=["Exercise"])
-app.include_router(category_router, prefix="/category", tags=["Category"])
-app.include_router(muscle_group_router, prefix="/muscle-group", tags=["MuscleGroup"])
-app.include_router(workout_plan_router, prefix="/workout-plan", tags=["WorkoutPlan"])
+for router, prefix, tags in [
+    (user_router, "/user", ["User"]),
+    (workout_router, "/workout", ["Workout Management"]),
+    (exercise_router, "/exercise", ["Exercise"]),
+    (category_router, "/category", ["Category"]),
+    (muscle_group_router, "/muscle-group", ["MuscleGroup"]),
+    (workout_plan_router, "/workout-plan", ["WorkoutPlan"]),
+    (analytics_router, "/analytics", ["Analytics"]),
+    (progress_router, "/progress", ["Progress"]),
+    (record_router, "/records", ["Records"]),
+    (export_router, "/export", ["Export"]),
+    (import_router, "/import", ["Import"]),
+    (profile_router, PROFILES_PATH, ["Profiling"]),
+]:
+    app.include_router(router, prefix=prefix, tags=tags)
+    register_routes(prefix, router.routes)
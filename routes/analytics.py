@@ -0,0 +1,62 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.analytics import AnalyticsCrud
+from db import get_async_session
+from dependencies.authentication import AuthenticationRequired
+from schemas.analytics import VolumeGroupBy, VolumePeriod, VolumeReport
+from schemas.workout import WorkoutStatus
+
+router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+
+
+@router.get(
+    "/volume",
+    response_model=VolumeReport,
+    summary="Training volume",
+    description="Total sets × repetitions × weight, aggregated in the database.",
+)
+async def get_volume(
+    period: VolumePeriod | None = None,
+    group_by: VolumeGroupBy | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    exercise_id: int | None = None,
+    muscle_group_id: int | None = None,
+    workout_status: WorkoutStatus | None = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Aggregate the volume of workout entries.
+
+    Args:
+        period (VolumePeriod | None): Bucket entries by day, week or month of their plan's start.
+        group_by (VolumeGroupBy | None): Break the totals down by exercise or muscle group.
+        start (date | None): First day to include.
+        end (date | None): Last day to include.
+        exercise_id (int | None): Only count this exercise.
+        muscle_group_id (int | None): Only count exercises of this muscle group.
+        workout_status (WorkoutStatus | None): Only count entries with this status, e.g. completed.
+        session (AsyncSession): The database session dependency.
+
+    Returns:
+        VolumeReport: One row per bucket.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    analytics_crud = AnalyticsCrud(session)
+    rows = await analytics_crud.get_volume(
+        period=period,
+        group_by=group_by,
+        start=start,
+        end=end,
+        exercise_id=exercise_id,
+        muscle_group_id=muscle_group_id,
+        workout_status=workout_status,
+    )
+    return {"period": period, "group_by": group_by, "rows": rows}
@@ -2,38 +2,59 @@ from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.category import CategoryCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
+from dependencies.conditional import ConditionalGet
+from models import Category
 from schemas.category import (CategoryCreateData, CategoryPartialUpdateData,
-                              CategoryUpdateData)
+                              CategoryResponse, CategoryUpdateData)
+from schemas.message import Message
+from schemas.pagination import Page
 
 router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+category_etag = ConditionalGet(
+    Category.__tablename__,
+    cache_control=config.REFERENCE_CACHE_CONTROL,
+    precompress=True,
+)
 
 
 @router.get(
     "/",
+    dependencies=[Depends(category_etag)],
+    response_model=Page[CategoryResponse],
     summary="Get all categories",
     description="Retrieve a list of all categories with pagination.",
 )
 async def get_all_categories_api(
-    skip: int = 0, limit: int = 10, session: AsyncSession = Depends(get_async_session)
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Retrieve a paginated list of all categories.
 
     - **skip**: Number of records to skip (default: 0).
     - **limit**: Maximum number of records to return (default: 10).
+    - **cursor**: The `next_cursor` of the previous page; takes precedence over `skip`.
 
     Returns:
-        A list of categories limited by the `skip` and `limit` parameters.
+        A page of categories and the cursor of the next page.
     """
     category_crud: CategoryCrud = CategoryCrud(session)
-    return await category_crud.get_all_categories(skip, limit)
+    categories, next_cursor = await category_crud.get_all_categories(
+        skip, limit, cursor
+    )
+    return {"items": categories, "next_cursor": next_cursor}
 
 
 @router.get(
     "/{category_id}",
+    dependencies=[Depends(category_etag)],
+    response_model=CategoryResponse,
     summary="Get category by ID",
     description="Retrieve a specific category by its ID.",
 )
@@ -54,6 +75,7 @@ async def get_category_by_id_api(
 
 @router.post(
     "/",
+    response_model=CategoryResponse,
     summary="Create a new category",
     description="Create a new category with the provided data.",
 )
@@ -75,6 +97,7 @@ async def create_new_category_api(
 
 @router.put(
     "/{category_id}",
+    response_model=CategoryResponse,
     summary="Update a category",
     description="Update an existing category by its ID.",
 )
@@ -100,6 +123,7 @@ async def update_category_api(
 
 @router.patch(
     "/{category_id}",
+    response_model=CategoryResponse,
     summary="Partially update a category",
     description="Update certain fields of an existing category by its ID.",
 )
@@ -125,6 +149,7 @@ async def update_category_api(
 
 @router.delete(
     "/{category_id}",
+    response_model=Message,
     summary="Delete a category",
     description="Delete a category by its ID.",
 )
@@ -1,41 +1,121 @@
-from typing import Annotated
+from typing import Annotated, List
 
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Query
 from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.exercise import ExerciseCrud
+from crud.records import RecordCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
+from dependencies.conditional import ConditionalGet
+from models import Exercise
 from schemas.exercise import (ExerciseCreate, ExercisePartialUpdate,
-                              ExerciseUpdate)
+                              ExerciseResponse, ExerciseSearchResult,
+                              ExerciseSuggestion, ExerciseUpdate)
+from schemas.message import Message
+from schemas.pagination import Page
+from schemas.record import ExerciseRecordDetail
 
 router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+exercise_etag = ConditionalGet(
+    Exercise.__tablename__,
+    cache_control=config.REFERENCE_CACHE_CONTROL,
+    precompress=True,
+)
 
 
 @router.get(
     "/",
+    dependencies=[Depends(exercise_etag)],
+    response_model=Page[ExerciseResponse],
     summary="Get all exercises",
     description="Retrieve a list of all exercises with pagination.",
 )
 async def get_all_exercise(
-    skip: int = 0, limit: int = 10, session: AsyncSession = Depends(get_async_session)
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Retrieves a paginated list of all exercises.
 
     - **skip**: Number of records to skip (default: 0).
     - **limit**: Maximum number of records to return (default: 10).
+    - **cursor**: The `next_cursor` of the previous page; takes precedence over `skip`.
+
+    Returns:
+        A page of exercises and the cursor of the next page.
+    """
+    exercise_crud: ExerciseCrud = ExerciseCrud(session)
+    exercises, next_cursor = await exercise_crud.get_all_exercise(skip, limit, cursor)
+    return {"items": exercises, "next_cursor": next_cursor}
+
+
+@router.get(
+    "/search",
+    response_model=List[ExerciseSearchResult],
+    summary="Search exercises",
+    description="Full-text search over exercise names and descriptions.",
+)
+async def search_exercises(
+    q: Annotated[str, Query(min_length=1, max_length=255)],
+    category_id: int | None = None,
+    muscle_group_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Search exercises by words of their name or description.
+
+    - **q**: The search text. Every word must match a word of the exercise,
+      exactly, as a prefix or as a substring of at least three letters.
+    - **category_id**: Only return exercises of this category.
+    - **muscle_group_id**: Only return exercises targeting this muscle group.
+    - **limit**: Maximum number of results (default: 10).
+
+    Returns:
+        The matching exercises, best match first.
+    """
+    exercise_crud: ExerciseCrud = ExerciseCrud(session)
+    return await exercise_crud.search(q, category_id, muscle_group_id, limit)
+
+
+@router.get(
+    "/autocomplete",
+    response_model=List[ExerciseSuggestion],
+    summary="Autocomplete exercise names",
+    description="Suggest exercise names for a partially typed name.",
+)
+async def autocomplete_exercises(
+    prefix: Annotated[str, Query(min_length=1, max_length=255)],
+    category_id: int | None = None,
+    muscle_group_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Suggest exercises whose name contains a word starting with the last word
+    of `prefix`, and the words before it.
+
+    - **prefix**: The text typed so far.
+    - **category_id**: Only suggest exercises of this category.
+    - **muscle_group_id**: Only suggest exercises targeting this muscle group.
+    - **limit**: Maximum number of suggestions (default: 10).
 
     Returns:
-        A list of exercises limited by the `skip` and `limit` parameters.
+        The ids and names of the suggested exercises, names starting with `prefix` first.
     """
     exercise_crud: ExerciseCrud = ExerciseCrud(session)
-    return await exercise_crud.get_all_exercise(skip, limit)
+    return await exercise_crud.autocomplete(prefix, category_id, muscle_group_id, limit)
 
 
 @router.get(
     "/{exercise_id}",
+    dependencies=[Depends(exercise_etag)],
+    response_model=ExerciseResponse,
     summary="Get an exercise",
     description="Retrieve details of a specific exercise by its ID.",
 )
@@ -55,8 +135,33 @@ async def get_exercise(
     return await exercise_crud.get_by_id(exercise_id)
 
 
+@router.get(
+    "/{exercise_id}/records",
+    response_model=ExerciseRecordDetail,
+    summary="Get the personal records of an exercise",
+    description="Heaviest weight, best estimated one-rep max and most repetitions per weight.",
+)
+async def get_exercise_records(
+    exercise_id: Annotated[int, Path(ge=1)],
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Retrieve the personal records of a specific exercise.
+
+    - **exercise_id**: The ID of the exercise. Must be greater than or equal to 1.
+
+    Returns:
+        The records, empty if the exercise has no completed weighted workouts.
+    """
+    exercise_crud: ExerciseCrud = ExerciseCrud(session)
+    await exercise_crud.get_by_id(exercise_id)
+    record_crud = RecordCrud(session)
+    return await record_crud.get_exercise_records(exercise_id)
+
+
 @router.post(
     "/",
+    response_model=ExerciseResponse,
     summary="Create a new exercise",
     description="Create a new exercise with the provided data.",
 )
@@ -77,6 +182,7 @@ async def create_new_exercise(
 
 @router.put(
     "/{exercise_id}",
+    response_model=ExerciseResponse,
     summary="Update an exercise",
     description="Update an existing exercise by its ID.",
 )
@@ -102,6 +208,7 @@ async def update_exercise(
 
 @router.patch(
     "/{exercise_id}",
+    response_model=ExerciseResponse,
     summary="Partially update an exercise",
     description="Update certain fields of an existing exercise by its ID.",
 )
@@ -127,6 +234,7 @@ async def partial_update_exercise(
 
 @router.delete(
     "/{exercise_id}",
+    response_model=Message,
     summary="Delete an exercise",
     description="Delete an exercise by its ID.",
 )
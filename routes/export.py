@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config
+from crud.workout import WorkoutCrud
+from db import get_async_session
+from dependencies.authentication import AuthenticationRequired
+from models import WorkoutExercise
+from utils.export import FileFormat, csv_chunks, ndjson_chunks
+
+router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+
+
+@router.get(
+    "/workouts",
+    summary="Export workout history",
+    description="Stream every workout as NDJSON or CSV.",
+)
+async def export_workouts(
+    format: FileFormat = FileFormat.NDJSON,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Stream the full workout history without loading it into memory.
+
+    Args:
+        format (FileFormat): `ndjson` (one JSON object per line) or `csv`.
+        session (AsyncSession): The database session dependency.
+
+    Returns:
+        StreamingResponse: The rows, ordered by ID, as an attachment.
+    """
+    workout_crud: WorkoutCrud = WorkoutCrud(session)
+    rows = workout_crud.stream_rows(batch_size=config.EXPORT_BATCH_SIZE)
+    if format == FileFormat.CSV:
+        fieldnames = [column.key for column in WorkoutExercise.__table__.columns]
+        body = csv_chunks(rows, fieldnames)
+        media_type = "text/csv"
+    else:
+        body = ndjson_chunks(rows)
+        media_type = "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="workouts.{format}"'},
+    )
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.importer import import_workouts
+from db import get_async_session
+from dependencies.authentication import AuthenticationRequired
+from schemas.workout import WorkoutImportResult
+from utils.export import FileFormat
+from utils.importer import read_records
+
+router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+
+
+@router.post(
+    "/workouts",
+    response_model=WorkoutImportResult,
+    summary="Import workout history",
+    description="Insert workouts from an NDJSON or CSV request body, streamed.",
+)
+async def import_workouts_api(
+    request: Request,
+    format: FileFormat = FileFormat.NDJSON,
+    resume_after: int = 0,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Import workouts from the raw request body, e.g.
+    `curl --data-binary @workouts.csv '/import/workouts?format=csv'`.
+
+    Records use the columns of `GET /export/workouts`; `exercise` (a name) may
+    replace `exercise_id`, and `id` is ignored.
+
+    Args:
+        request (Request): The request whose body is parsed as it arrives.
+        format (FileFormat): `ndjson` or `csv`.
+        resume_after (int): Skip the records up to this line, as returned in
+            `last_committed_line` by an interrupted import.
+        session (AsyncSession): The database session dependency.
+
+    Returns:
+        WorkoutImportResult: Counts, per-line errors and the last committed line.
+    """
+    return await import_workouts(
+        session,
+        read_records(request.stream(), format),
+        resume_after=resume_after,
+    )
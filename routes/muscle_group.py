@@ -1,38 +1,60 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.muscle_group import MuscleGroupCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
+from dependencies.conditional import ConditionalGet
+from models import MuscleGroup
+from schemas.message import Message
 from schemas.muscle_group import (MuscleGroupCreate, MuscleGroupPartialUpdate,
-                                  MuscleGroupUpdate)
+                                  MuscleGroupResponse, MuscleGroupUpdate)
+from schemas.pagination import Page
 
 router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+muscle_group_etag = ConditionalGet(
+    MuscleGroup.__tablename__,
+    cache_control=config.REFERENCE_CACHE_CONTROL,
+    precompress=True,
+)
 
 
 @router.get(
     "/",
+    dependencies=[Depends(muscle_group_etag)],
+    response_model=Page[MuscleGroupResponse],
     summary="Get all muscle groups",
     description="Retrieve a list of all muscle groups with pagination.",
 )
 async def get_all_muscle_groups_api(
-    skip: int = 0, limit: int = 10, session: AsyncSession = Depends(get_async_session)
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Retrieve a paginated list of all muscle groups.
 
     - **skip**: Number of records to skip (default: 0).
     - **limit**: Maximum number of records to return (default: 10).
+    - **cursor**: The `next_cursor` of the previous page; takes precedence over `skip`.
 
     Returns:
-        A list of muscle groups limited by the `skip` and `limit` parameters.
+        A page of muscle groups and the cursor of the next page.
     """
     muscle_group_crud: MuscleGroupCrud = MuscleGroupCrud(session)
-    return await muscle_group_crud.get_all_muscle_group(skip=skip, limit=limit)
+    muscle_groups, next_cursor = await muscle_group_crud.get_all_muscle_group(
+        skip=skip, limit=limit, cursor=cursor
+    )
+    return {"items": muscle_groups, "next_cursor": next_cursor}
 
 
 @router.get(
     "/{muscle_group_id}",
+    dependencies=[Depends(muscle_group_etag)],
+    response_model=MuscleGroupResponse,
     summary="Get muscle group by ID",
     description="Retrieve a specific muscle group by its ID.",
 )
@@ -53,6 +75,7 @@ async def get_muscle_group_by_id_api(
 
 @router.post(
     "/",
+    response_model=MuscleGroupResponse,
     summary="Create a new muscle group",
     description="Create a new muscle group with the provided data.",
 )
@@ -74,6 +97,7 @@ async def create_muscle_group_api(
 
 @router.put(
     "/{muscle_group_id}",
+    response_model=MuscleGroupResponse,
     summary="Update a muscle group",
     description="Update an existing muscle group by its ID.",
 )
@@ -99,6 +123,7 @@ async def update_muscle_group_api(
 
 @router.patch(
     "/{muscle_group_id}",
+    response_model=MuscleGroupResponse,
     summary="Partially update a muscle group",
     description="Update certain fields of an existing muscle group by its ID.",
 )
@@ -124,6 +149,7 @@ async def partial_update_muscle_group_api(
 
 @router.delete(
     "/{muscle_group_id}",
+    response_model=Message,
     summary="Delete a muscle group",
     description="Delete a muscle group by its ID.",
 )
@@ -0,0 +1,57 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+
+from dependencies.authentication import AuthenticationRequired
+from dependencies.profiling import ProfileAccessRequired
+from schemas.profile import ProfileInfo
+from utils.profiler import list_profiles, profile_path
+
+router: APIRouter = APIRouter(
+    dependencies=[Depends(AuthenticationRequired), Depends(ProfileAccessRequired)]
+)
+
+
+@router.get(
+    "/",
+    response_model=List[ProfileInfo],
+    summary="List captured profiles",
+    description="List the request profiles kept in the profile directory, newest first.",
+)
+async def get_profiles_api():
+    """
+    List the captured request profiles.
+
+    Returns:
+        List[ProfileInfo]: Name, size and capture time of every profile.
+    """
+    return list_profiles()
+
+
+@router.get(
+    "/{name}",
+    summary="Download a profile",
+    description="Download a captured profile, to open in speedscope or a flame graph tool.",
+)
+async def get_profile_api(name: str):
+    """
+    Download one captured profile.
+
+    Args:
+        name (str): The profile's file name, as listed.
+
+    Returns:
+        FileResponse: The profile as an attachment.
+
+    Raises:
+        HTTPException: If no profile has that name.
+    """
+    path = profile_path(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+    media_type = "application/json" if name.endswith(".json") else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=name)
@@ -0,0 +1,45 @@
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.progress import ProgressCrud
+from db import get_async_session
+from dependencies.authentication import AuthenticationRequired
+from schemas.progress import DailyProgress, ExerciseProgress
+
+router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+
+
+@router.get(
+    "/daily",
+    response_model=List[DailyProgress],
+    summary="Daily progress",
+    description="Completed training per day, read from the daily rollup.",
+)
+async def get_daily_progress(
+    start: date | None = None,
+    end: date | None = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    progress_crud = ProgressCrud(session)
+    return await progress_crud.get_daily_progress(start=start, end=end)
+
+
+@router.get(
+    "/exercise/{exercise_id}",
+    response_model=List[ExerciseProgress],
+    summary="Exercise progress",
+    description="Completed training of one exercise per day, read from the daily rollup.",
+)
+async def get_exercise_progress(
+    exercise_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    progress_crud = ProgressCrud(session)
+    return await progress_crud.get_exercise_progress(
+        exercise_id, start=start, end=end
+    )
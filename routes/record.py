@@ -0,0 +1,22 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.records import RecordCrud
+from db import get_async_session
+from dependencies.authentication import AuthenticationRequired
+from schemas.record import ExerciseRecordResponse
+
+router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
+
+
+@router.get(
+    "/",
+    response_model=List[ExerciseRecordResponse],
+    summary="Personal records",
+    description="Heaviest weight and best estimated one-rep max of every exercise.",
+)
+async def get_records(session: AsyncSession = Depends(get_async_session)):
+    record_crud = RecordCrud(session)
+    return await record_crud.get_records()
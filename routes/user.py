@@ -1,4 +1,4 @@
-from typing import Annotated, List
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,6 +7,8 @@ from config import config
 from crud.user import UserCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
+from schemas.pagination import Page
+from schemas.token import LoginResponse
 from schemas.user import UserLogin, UserRegister, UserResponse
 
 router: APIRouter = APIRouter()
@@ -15,7 +17,7 @@ router: APIRouter = APIRouter()
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=List[UserResponse],
+    response_model=Page[UserResponse],
     dependencies=[Depends(AuthenticationRequired)],
 )
 async def get_users(
@@ -26,6 +28,10 @@ async def get_users(
             description=f"Maximum number of records to return. Max Limit is {config.PAGINATION_MAX_LIMIT}"
         ),
     ] = 10,
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor of the next page, takes precedence over skip"),
+    ] = None,
     session: AsyncSession = Depends(get_async_session),
 ):
     """
@@ -34,21 +40,22 @@ async def get_users(
     Parameters:
     - skip: The number of records to skip (default: 0)
     - limit: The maximum number of records to return (default: 10)
+    - cursor: The next_cursor returned by the previous page (default: None)
 
     Returns:
-    - A list of user records.
+    - A page of user records and the cursor of the next page.
     """
     limit = min(limit, config.PAGINATION_MAX_LIMIT)
     user_crud = UserCrud(session=session)
 
-    users = await user_crud.get_all(skip=skip, limit=limit)
+    users, next_cursor = await user_crud.get_page(skip=skip, limit=limit, cursor=cursor)
 
     if not users:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="No users found."
         )
 
-    return users
+    return {"items": users, "next_cursor": next_cursor}
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -74,7 +81,7 @@ async def create_user(
     return new_user
 
 
-@router.post("/login", status_code=status.HTTP_200_OK)
+@router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login_user(
     user_data: UserLogin, session: AsyncSession = Depends(get_async_session)
 ):
@@ -1,38 +1,127 @@
-from fastapi import APIRouter, Depends, status
+from typing import List
+
+from fastapi import APIRouter, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.workout import WorkoutCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
-from schemas.workout import WorkoutCreate, WorkoutPartialUpdate, WorkoutUpdate
+from schemas.bulk import BulkResult
+from schemas.message import Message
+from schemas.pagination import Page
+from schemas.workout import (WorkoutBulkDelete, WorkoutBulkUpdate,
+                             WorkoutCreate, WorkoutPartialUpdate,
+                             WorkoutResponse, WorkoutUpdate)
 
 router: APIRouter = APIRouter(dependencies=[Depends(AuthenticationRequired)])
 
 
 @router.get(
     "/",
+    response_model=Page[WorkoutResponse],
     summary="Get all workout plans",
     description="Retrieve a list of all workout plans with pagination.",
 )
 async def get_workout_plans(
-    skip: int = 0, limit: int = 10, session: AsyncSession = Depends(get_async_session)
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Retrieve a paginated list of all workout plans.
 
     - **skip**: Number of records to skip (default: 0).
     - **limit**: Maximum number of records to return (default: 10).
+    - **cursor**: The `next_cursor` of the previous page; takes precedence over `skip`.
+
+    Returns:
+        A page of workout plans and the cursor of the next page.
+    """
+    workout_crud: WorkoutCrud = WorkoutCrud(session)
+    workouts, next_cursor = await workout_crud.get_page(
+        skip=skip, limit=limit, cursor=cursor
+    )
+    return {"items": workouts, "next_cursor": next_cursor}
+
+
+@router.post(
+    "/bulk",
+    summary="Create many workouts",
+    description="Create a batch of workouts in a single transaction.",
+    response_model=BulkResult,
+)
+async def bulk_create_workouts(
+    workout_data: List[WorkoutCreate] = Body(..., max_length=config.BULK_MAX_ITEMS),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Create a batch of workouts.
+
+    - **workout_data**: The workouts to create.
+
+    Returns:
+        The ID of each created workout, or why it was rejected.
+    """
+    workout_crud: WorkoutCrud = WorkoutCrud(session)
+    return await workout_crud.bulk_create_workouts(
+        [workout.model_dump(exclude_none=True) for workout in workout_data]
+    )
+
+
+@router.patch(
+    "/bulk",
+    summary="Update many workouts",
+    description="Partially update a batch of workouts in a single transaction.",
+    response_model=BulkResult,
+)
+async def bulk_update_workouts(
+    workout_data: List[WorkoutBulkUpdate] = Body(
+        ..., max_length=config.BULK_MAX_ITEMS
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Partially update a batch of workouts.
+
+    - **workout_data**: The ID and the fields to change of each workout.
+
+    Returns:
+        The ID of each updated workout, or why it was rejected.
+    """
+    workout_crud: WorkoutCrud = WorkoutCrud(session)
+    return await workout_crud.bulk_update_workouts(
+        [workout.model_dump(exclude_none=True) for workout in workout_data]
+    )
+
+
+@router.delete(
+    "/bulk",
+    summary="Delete many workouts",
+    description="Delete a batch of workouts in a single transaction.",
+    response_model=BulkResult,
+)
+async def bulk_delete_workouts(
+    workout_data: WorkoutBulkDelete,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Delete a batch of workouts.
+
+    - **workout_data**: The IDs of the workouts to delete.
 
     Returns:
-        A list of workout plans limited by the `skip` and `limit` parameters.
+        The ID of each deleted workout, or why it was rejected.
     """
     workout_crud: WorkoutCrud = WorkoutCrud(session)
-    return await workout_crud.get_all(skip=skip, limit=limit)
+    return await workout_crud.bulk_delete_workouts(workout_data.ids)
 
 
 @router.get(
     "/{workout_id}",
+    response_model=WorkoutResponse,
     summary="Get a workout plan",
     description="Retrieve details of a specific workout plan by its ID.",
 )
@@ -53,6 +142,7 @@ async def get_workout_plan(
 
 @router.post(
     "/",
+    response_model=WorkoutResponse,
     summary="Create a new workout plan",
     description="Create a new workout plan with the provided data.",
 )
@@ -73,6 +163,7 @@ async def create_new_workout_plan(
 
 @router.put(
     "/{workout_id}",
+    response_model=WorkoutResponse,
     summary="Update a workout plan",
     description="Update an existing workout plan by its ID.",
 )
@@ -96,6 +187,7 @@ async def update_workout_plan(
 
 @router.patch(
     "/{workout_id}",
+    response_model=WorkoutResponse,
     summary="Partially update a workout plan",
     description="Update certain fields of an existing workout plan by its ID.",
 )
@@ -121,6 +213,7 @@ async def partial_update_workout_plan(
 
 @router.delete(
     "/{workout_id}",
+    response_model=Message,
     summary="Delete a workout plan",
     description="Delete a workout plan by its ID.",
 )
@@ -2,29 +2,51 @@ from fastapi import APIRouter, status, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
 from crud.workout_plan import WorkoutPlanCrud
 from db import get_async_session
 from dependencies.authentication import AuthenticationRequired
-from schemas.workout_plan import WorkoutPlanCreate, WorkoutPlanUpdate, WorkoutPlanPartialUpdate
+from dependencies.conditional import ConditionalGet
+from dependencies.query_budget import QueryBudget
+from models import (Category, Exercise, MuscleGroup, WorkoutExercise,
+                    WorkoutPlan)
+from schemas.message import Message
+from schemas.pagination import Page
+from schemas.workout_plan import WorkoutPlanCreate, WorkoutPlanUpdate, WorkoutPlanPartialUpdate, WorkoutPlanDetail, WorkoutPlanResponse
 
 router: APIRouter = APIRouter(
     dependencies=[Depends(AuthenticationRequired)])
+workout_plan_etag = ConditionalGet(WorkoutPlan.__tablename__, cache_control=config.WORKOUT_PLAN_CACHE_CONTROL)
+workout_plan_detail_etag = ConditionalGet(
+    WorkoutPlan.__tablename__, WorkoutExercise.__tablename__, Exercise.__tablename__,
+    Category.__tablename__, MuscleGroup.__tablename__,
+    cache_control=config.WORKOUT_PLAN_CACHE_CONTROL)
+# The plan and its exercises, eagerly loaded; one more for a replica lag check.
+workout_plan_detail_budget = QueryBudget(3)
 
 
-@router.get("/")
-async def get_workout_plans_api(skip: int = 0, limit: int = 10,
+@router.get("/", response_model=Page[WorkoutPlanResponse], dependencies=[Depends(workout_plan_etag)])
+async def get_workout_plans_api(skip: int = 0, limit: int = 10, cursor: str | None = None,
                                 session: AsyncSession = Depends(get_async_session)):
     workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
-    return await workout_plan_crud.get_all(skip=skip, limit=limit)
+    workout_plans, next_cursor = await workout_plan_crud.get_page(skip=skip, limit=limit, cursor=cursor)
+    return {"items": workout_plans, "next_cursor": next_cursor}
 
 
-@router.get("/{workout_plan_id}")
+@router.get("/{workout_plan_id}", response_model=WorkoutPlanResponse, dependencies=[Depends(workout_plan_etag)])
 async def get_workout_plan_api(workout_plan_id: int, session: AsyncSession = Depends(get_async_session)):
     workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
     return await workout_plan_crud.get_workout_plan_by_id(workout_plan_id)
 
 
-@router.post("/")
+@router.get("/{workout_plan_id}/full", response_model=WorkoutPlanDetail,
+            dependencies=[Depends(workout_plan_detail_etag), Depends(workout_plan_detail_budget)])
+async def get_workout_plan_detail_api(workout_plan_id: int, session: AsyncSession = Depends(get_async_session)):
+    workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
+    return await workout_plan_crud.get_workout_plan_detail(workout_plan_id)
+
+
+@router.post("/", response_model=WorkoutPlanResponse)
 async def create_workout_plan_api(workout_plan_data: WorkoutPlanCreate,
                                   session: AsyncSession = Depends(get_async_session)):
     workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
@@ -32,14 +54,14 @@ async def create_workout_plan_api(workout_plan_data: WorkoutPlanCreate,
 
 
 
-@router.patch("/{workout_plan_id}")
+@router.patch("/{workout_plan_id}", response_model=WorkoutPlanResponse)
 async def partial_update_workout_plan_api(workout_plan_id: int, workout_plan_data: WorkoutPlanPartialUpdate,
                                           session: AsyncSession = Depends(get_async_session)):
     workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
     return await workout_plan_crud.update_workout_plan(workout_plan_id, workout_plan_data.model_dump(exclude_none=True))
 
 
-@router.delete("/{workout_plan_id}")
+@router.delete("/{workout_plan_id}", response_model=Message)
 async def delete_workout_plan_id(workout_plan_id: int, session: AsyncSession = Depends(get_async_session)):
     workout_plan_crud: WorkoutPlanCrud = WorkoutPlanCrud(session)
     await workout_plan_crud.delete_workout_plan(workout_plan_id)
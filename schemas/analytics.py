@@ -0,0 +1,38 @@
+from datetime import date
+from enum import StrEnum
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class VolumePeriod(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class VolumeGroupBy(StrEnum):
+    EXERCISE = "exercise"
+    MUSCLE_GROUP = "muscle_group"
+
+
+class VolumeRow(BaseModel):
+    period: date | None = Field(
+        None, description="First day of the day, week (Monday) or month"
+    )
+    exercise_id: int | None = Field(None, examples=[1])
+    exercise_name: str | None = Field(None, examples=["Bench press"])
+    muscle_group_id: int | None = Field(None, examples=[1])
+    muscle_group_name: str | None = Field(None, examples=["Chest"])
+    entries: int = Field(..., description="Number of workout entries", examples=[4])
+    sets: int = Field(..., examples=[12])
+    repetitions: int = Field(..., description="Sets × repetitions", examples=[120])
+    volume: float = Field(
+        ..., description="Sum of sets × repetitions × weight", examples=[9600.0]
+    )
+
+
+class VolumeReport(BaseModel):
+    period: VolumePeriod | None = None
+    group_by: VolumeGroupBy | None = None
+    rows: List[VolumeRow]
@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class BulkItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    id: int | None = Field(None, description="ID of the affected row", examples=[1])
+    error: str | None = Field(None, description="Why the item was rejected")
+
+
+class BulkResult(BaseModel):
+    succeeded: int = Field(..., examples=[2])
+    failed: int = Field(..., examples=[0])
+    results: List[BulkItemResult]
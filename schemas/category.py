@@ -23,3 +23,12 @@ class CategoryPartialUpdateData(BaseModel):
             "Training designed to increase stamina and overall fitness, typically involving prolonged activities."
         ],
     )
+
+
+class CategoryResponse(BaseModel):
+    id: int = Field(..., examples=[1])
+    name: str = Field(..., examples=["Endurance"])
+    description: str | None = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field
 
+from schemas.category import CategoryResponse
+from schemas.muscle_group import MuscleGroupResponse
+
 
 class ExerciseCreate(BaseModel):
     name: str = Field(..., max_length=255, description="The name of the exercise.")
@@ -38,3 +41,29 @@ class ExercisePartialUpdate(BaseModel):
     muscle_group_id: int | None = Field(
         None, description="The primary muscle group id targeted by the exercise."
     )
+
+
+class ExerciseResponse(ExerciseCreate):
+    id: int = Field(..., examples=[1])
+
+    class Config:
+        from_attributes = True
+
+
+class ExerciseDetail(ExerciseResponse):
+    category: CategoryResponse
+    muscle_group: MuscleGroupResponse
+
+
+class ExerciseSearchResult(BaseModel):
+    id: int = Field(..., examples=[1])
+    name: str = Field(..., examples=["Bench press"])
+    description: str | None = None
+    category_id: int = Field(..., examples=[1])
+    muscle_group_id: int = Field(..., examples=[1])
+    score: float = Field(..., description="Relevance, higher is better", examples=[6.0])
+
+
+class ExerciseSuggestion(BaseModel):
+    id: int = Field(..., examples=[1])
+    name: str = Field(..., examples=["Bench press"])
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class Message(BaseModel):
+    status: str | None = Field(None, examples=["success"])
+    message: str = Field(..., examples=["Deleted successfully"])
@@ -23,3 +23,12 @@ class MuscleGroupPartialUpdate(BaseModel):
             "Exercises that target the pectoral muscles, including bench presses, push-ups, and chest flies."
         ],
     )
+
+
+class MuscleGroupResponse(BaseModel):
+    id: int = Field(..., examples=[1])
+    name: str = Field(..., examples=["Chest"])
+    description: str | None = None
+
+    class Config:
+        from_attributes = True
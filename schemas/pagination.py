@@ -0,0 +1,13 @@
+from typing import Generic, List, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor of the next page, null on the last page",
+    )
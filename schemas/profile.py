@@ -0,0 +1,9 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileInfo(BaseModel):
+    name: str = Field(..., examples=["20261017T101500123456Z-GET-workout.speedscope.json"])
+    size: int = Field(..., description="Size of the file in bytes")
+    created_at: datetime
@@ -0,0 +1,29 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class ExerciseProgress(BaseModel):
+    exercise_id: int = Field(..., examples=[1])
+    day: date
+    entries: int = Field(..., description="Completed workout entries", examples=[2])
+    sets: int = Field(..., examples=[6])
+    repetitions: int = Field(..., description="Sets × repetitions", examples=[60])
+    volume: float = Field(
+        ..., description="Sum of sets × repetitions × weight", examples=[4800.0]
+    )
+    max_weight: float | None = Field(None, examples=[90.0])
+
+    class Config:
+        from_attributes = True
+
+
+class DailyProgress(BaseModel):
+    day: date
+    exercises: int = Field(..., description="Exercises trained", examples=[4])
+    entries: int = Field(..., description="Completed workout entries", examples=[8])
+    sets: int = Field(..., examples=[24])
+    repetitions: int = Field(..., description="Sets × repetitions", examples=[240])
+    volume: float = Field(
+        ..., description="Sum of sets × repetitions × weight", examples=[19200.0]
+    )
@@ -0,0 +1,33 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class RepRecordResponse(BaseModel):
+    weight: float = Field(..., examples=[80.0])
+    repetitions: int = Field(..., description="Most repetitions in one set", examples=[8])
+    workout_id: int = Field(..., examples=[1])
+
+    class Config:
+        from_attributes = True
+
+
+class ExerciseRecordResponse(BaseModel):
+    exercise_id: int = Field(..., examples=[1])
+    heaviest_weight: float | None = Field(None, examples=[100.0])
+    heaviest_workout_id: int | None = Field(None, examples=[1])
+    best_epley: float | None = Field(
+        None, description="Best estimated one-rep max (Epley)", examples=[120.0]
+    )
+    epley_workout_id: int | None = Field(None, examples=[1])
+    best_brzycki: float | None = Field(
+        None, description="Best estimated one-rep max (Brzycki)", examples=[116.1]
+    )
+    brzycki_workout_id: int | None = Field(None, examples=[1])
+
+    class Config:
+        from_attributes = True
+
+
+class ExerciseRecordDetail(ExerciseRecordResponse):
+    rep_records: List[RepRecordResponse] = []
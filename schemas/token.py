@@ -1,6 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Token(BaseModel):
     access_token: str
     refresh_token: str
+
+
+class LoginResponse(BaseModel):
+    message: str = Field(..., examples=["Login successful"])
+    token: Token
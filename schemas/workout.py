@@ -1,6 +1,9 @@
 from enum import StrEnum
+from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from config import config
 
 
 class WorkoutStatus(StrEnum):
@@ -18,7 +21,10 @@ class WorkoutBase(BaseModel):
     repetitions: int | None = Field(
         None, description="Number of repetitions", examples=[1]
     )
-    weight: float | None = Field(None, description="Workout weight", examples=[190])
+    # rep_records keeps the weight as DECIMAL(6, 2).
+    weight: float | None = Field(
+        None, description="Workout weight", examples=[190], ge=0, le=9999.99
+    )
     status: WorkoutStatus | None = Field(
         None, description="Workout status", examples=[WorkoutStatus.TO_BE_STARTED]
     )
@@ -36,3 +42,61 @@ class WorkoutUpdate(WorkoutCreate):
 class WorkoutPartialUpdate(WorkoutBase):
     description: str | None = Field(None, description="Description of the workout")
     exercise_id: int | None = Field(None, description="ID of the exercise", gt=0)
+
+
+class WorkoutResponse(WorkoutBase):
+    id: int = Field(..., examples=[1])
+    description: str | None = Field(None, description="Description of the workout")
+    exercise_id: int = Field(..., description="ID of the exercise")
+    # Rows written before the weight was bounded are still returned.
+    weight: float | None = Field(None, description="Workout weight", examples=[190])
+
+    class Config:
+        from_attributes = True
+
+
+class WorkoutBulkUpdate(WorkoutPartialUpdate):
+    id: int = Field(..., description="ID of the workout to update", gt=0)
+
+
+class WorkoutBulkDelete(BaseModel):
+    ids: List[int] = Field(
+        ..., description="IDs of the workouts to delete", max_length=config.BULK_MAX_ITEMS
+    )
+
+
+class WorkoutImportRow(WorkoutBase):
+    """One record of an imported file; the exercise is given by ID or by name."""
+
+    description: str | None = Field(None, description="Description of the workout")
+    workout_plan_id: int = Field(..., description="Workout plan ID", gt=0)
+    exercise_id: int | None = Field(None, description="ID of the exercise", gt=0)
+    exercise: str | None = Field(None, description="Name of the exercise")
+    status: WorkoutStatus = Field(WorkoutStatus.TO_BE_STARTED)
+
+    @model_validator(mode="after")
+    def check_exercise(self) -> "WorkoutImportRow":
+        if self.exercise_id is None and self.exercise is None:
+            raise ValueError("Either exercise_id or exercise is required")
+        return self
+
+
+class WorkoutImportError(BaseModel):
+    line: int = Field(..., description="Line of the file the record starts on")
+    error: str
+
+
+class WorkoutImportResult(BaseModel):
+    imported: int = Field(..., examples=[1000])
+    failed: int = Field(..., examples=[0])
+    last_committed_line: int = Field(
+        ...,
+        description="Pass as `resume_after` to continue after an interrupted import",
+        examples=[1001],
+    )
+    errors: List[WorkoutImportError] = Field(
+        ..., description=f"At most IMPORT_MAX_ERRORS ({config.IMPORT_MAX_ERRORS}) errors"
+    )
+    aborted: str | None = Field(
+        None, description="Why the import stopped before the end of the file"
+    )
@@ -1,6 +1,9 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+
+from schemas.exercise import ExerciseDetail
+from schemas.workout import WorkoutResponse
 
 
 class WorkoutPlanCreate(BaseModel):
@@ -23,4 +26,19 @@ class WorkoutPlanPartialUpdate(BaseModel):
     to_end: Optional[datetime] = Field(None, description="The new end time of the workout plan")
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class WorkoutPlanResponse(WorkoutPlanCreate):
+    id: int = Field(..., examples=[1])
+
+    class Config:
+        from_attributes = True
+
+
+class WorkoutExerciseDetail(WorkoutResponse):
+    exercise: ExerciseDetail
+
+
+class WorkoutPlanDetail(WorkoutPlanResponse):
+    workout_exercises: List[WorkoutExerciseDetail]
@@ -0,0 +1,81 @@
+"""
+The tests run the app in-process over ASGI against a throwaway SQLite
+database, which replaces the configured one before the app is imported.
+"""
+import os
+import tempfile
+from typing import AsyncIterator, Iterator, List
+
+os.environ.update(
+    MYSQL_URL=f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='fitness-tests-')}/app.db",
+    DB_REPLICA_URLS="",
+    CACHE_BACKEND="memory",
+    JWT_SECRET_KEY="test-secret",
+    JWT_ALGORITHM="HS256",
+    JWT_EXP="3600",
+    PAGINATION_MAX_LIMIT="100",
+    PASSWORD_BCRYPT_ROUNDS="4",
+)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from crud.exercise import search_index  # noqa: E402
+from db import engine  # noqa: E402
+from models import Base  # noqa: E402
+from routes import app  # noqa: E402
+from utils.cache import caches  # noqa: E402
+
+pytest_plugins = ["pytester", "utils.query_budget_plugin"]
+
+USER = {"name": "tester", "email": "tester@example.com", "password": "Password@123"}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: takes seconds; deselect with `-m 'not slow'`"
+    )
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """A client of the app, on an empty database and with empty caches."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    for cache in list(caches.values()):
+        await cache.clear()
+    search_index.update(index=None, loaded_at=0.0)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def auth_headers(client: httpx.AsyncClient) -> dict[str, str]:
+    await client.post("/user/", json=USER)
+    response = await client.post("/user/login", json=USER)
+    return {"Authorization": f"Bearer {response.json()['token']['access_token']}"}
+
+
+@pytest.fixture
+def statements() -> Iterator[List[str]]:
+    """
+    The SQL statements run on the database during the test. Clear the list
+    right before the request whose statements are counted.
+    """
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
@@ -0,0 +1,101 @@
+import asyncio
+from typing import AsyncIterator, Callable, List
+
+import pytest
+
+from utils.cache import CacheBackend, RedisCache, caches
+
+fakeredis = pytest.importorskip("fakeredis")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def worker() -> AsyncIterator[Callable[..., RedisCache]]:
+    """
+    Makes caches as separate worker processes see them: each has its own
+    client and local copies, and all share one Redis server.
+    """
+    server = fakeredis.FakeServer()
+    workers: List[RedisCache] = []
+
+    def make(maxsize: int = 100) -> RedisCache:
+        cache = RedisCache(
+            "test",
+            maxsize=maxsize,
+            ttl=60,
+            client=fakeredis.FakeAsyncRedis(server=server),
+        )
+        workers.append(cache)
+        return cache
+
+    make.server = server
+    yield make
+    for cache in workers:
+        await cache.close()
+    caches.pop("test", None)
+    caches.pop("test:local", None)
+
+
+def test_backends_must_implement_the_interface():
+    with pytest.raises(TypeError):
+        CacheBackend("incomplete")
+
+
+async def test_entries_are_shared_and_expire_on_their_own(worker):
+    first, second = worker(), worker()
+    await first.set(("id", 1), {"name": "Chest"})
+
+    assert await second.get(("id", 1)) == {"name": "Chest"}
+    keys = await first.client.keys("*:0:*")
+    assert len(keys) == 1
+    assert 0 < await first.client.ttl(keys[0]) <= 60
+
+
+async def test_clear_hides_entries_from_every_worker(worker):
+    first, second = worker(), worker()
+    await first.set(("id", 1), {"name": "Chest"})
+    assert await first.get(("id", 1)) == {"name": "Chest"}
+    await asyncio.sleep(0.05)
+
+    await second.clear()
+    await asyncio.sleep(0.05)
+
+    # The local copy of the first worker is dropped through pub/sub, and the
+    # Redis entry belongs to the previous generation.
+    assert await first.get(("id", 1)) is None
+    assert await worker().get(("id", 1)) is None
+    await first.set(("id", 1), {"name": "Back"})
+    assert await second.get(("id", 1)) == {"name": "Back"}
+
+
+async def test_values_read_before_a_clear_are_not_stored(worker):
+    cache = worker()
+    assert await cache.get(("id", 1)) is None
+    # A write commits and clears the cache while the old row is being read.
+    await cache.clear()
+    await cache.set(("id", 1), {"name": "Stale"})
+
+    assert await cache.get(("id", 1)) is None
+    assert await worker().get(("id", 1)) is None
+
+
+async def test_maxsize_evicts_the_oldest_entries(worker):
+    cache = worker(maxsize=3)
+    for i in range(5):
+        await cache.set(("id", i), i)
+
+    assert len(await cache.client.keys("*:0:*")) == 3
+    assert await worker().get(("id", 0)) is None
+    assert await worker().get(("id", 4)) == 4
+
+
+async def test_falls_back_to_local_copies_when_redis_is_down(worker):
+    cache = worker()
+    worker.server.connected = False
+
+    assert await cache.get(("id", 1)) is None
+    await cache.set(("id", 1), {"name": "Chest"})
+    assert await cache.get(("id", 1)) == {"name": "Chest"}
+    await cache.clear()
+    assert await cache.get(("id", 1)) is None
@@ -0,0 +1,33 @@
+import httpx
+import pytest
+
+from config import config
+from utils.cache import table_version
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def category(client: httpx.AsyncClient, auth_headers: dict[str, str]) -> None:
+    await client.post(
+        "/category/", json={"name": "Strength", "description": "-"}, headers=auth_headers
+    )
+
+
+async def test_matching_etag_is_not_modified_until_a_write(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], category: None
+):
+    response = await client.get("/category/1", headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = await client.get("/category/1", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.patch("/category/1", json={"description": "Updated"}, headers=auth_headers)
+    response = await client.get("/category/1", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_versions_expire_with_the_reference_cache():
+    assert table_version("category").cache.ttl <= config.REFERENCE_CACHE_TTL
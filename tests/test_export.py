@@ -0,0 +1,102 @@
+import zlib
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import insert
+
+from db import engine
+from models import Category, Exercise, MuscleGroup, WorkoutExercise, WorkoutPlan
+from utils.export import FileFormat
+
+pytestmark = pytest.mark.anyio
+
+ROWS = 200_000
+MAX_RSS_GROWTH_MB = 16
+
+
+def reset_peak_rss() -> bool:
+    # Linux only: restart the high-water mark of the process.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmHWM missing from /proc/self/status")
+
+
+@pytest.fixture
+async def history(client: httpx.AsyncClient) -> None:
+    start = datetime(2024, 1, 1, 8)
+    async with engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="Strength", description="-"))
+        await conn.execute(insert(MuscleGroup).values(name="Chest", description="-"))
+        await conn.execute(
+            insert(Exercise).values(
+                name="Bench press", description="-", category_id=1, muscle_group_id=1
+            )
+        )
+        await conn.execute(
+            insert(WorkoutPlan).values(
+                name="Push day", to_start=start, to_end=start + timedelta(hours=1)
+            )
+        )
+        for offset in range(0, ROWS, 50_000):
+            await conn.execute(
+                insert(WorkoutExercise),
+                [
+                    {
+                        "description": f"Set {i}",
+                        "workout_plan_id": 1,
+                        "exercise_id": 1,
+                        "sets": 3,
+                        "repetitions": 8,
+                        "weight": 60.0,
+                        "status": "completed",
+                    }
+                    for i in range(offset, min(offset + 50_000, ROWS))
+                ],
+            )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("format", list(FileFormat))
+async def test_export_streams_in_constant_memory(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    history: None,
+    format: FileFormat,
+):
+    # Through the route's session dependency and the whole middleware stack.
+    # httpx.ASGITransport keeps the body it receives, which is small once
+    # gzipped; the rows themselves must only be held a batch at a time.
+    if not reset_peak_rss():
+        pytest.skip("needs /proc/self/clear_refs to measure the peak RSS")
+    before = peak_rss_mb()
+
+    lines = 0
+    async with client.stream(
+        "GET",
+        f"/export/workouts?format={format}",
+        headers={**auth_headers, "Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # Decompressed a piece at a time; httpx would inflate it all at once.
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        async for chunk in response.aiter_raw():
+            while chunk:
+                lines += decompressor.decompress(chunk, 2**16).count(b"\n")
+                chunk = decompressor.unconsumed_tail
+
+    assert lines == ROWS + (1 if format == FileFormat.CSV else 0)
+    growth = peak_rss_mb() - before
+    assert growth < MAX_RSS_GROWTH_MB, f"peak RSS grew by {growth:.1f} MB"
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import pytest
+from sqlalchemy import insert
+
+from crud.workout import WorkoutCrud
+from db import async_session_maker, engine
+from models import Category, Exercise, MuscleGroup, WorkoutPlan
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def plan(client: httpx.AsyncClient) -> None:
+    start = datetime(2024, 1, 1, 8)
+    async with engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="Strength", description="-"))
+        await conn.execute(insert(MuscleGroup).values(name="Chest", description="-"))
+        await conn.execute(
+            insert(Exercise).values(
+                name="Bench press", description="-", category_id=1, muscle_group_id=1
+            )
+        )
+        await conn.execute(
+            insert(WorkoutPlan).values(
+                name="Push day", to_start=start, to_end=start + timedelta(hours=1)
+            )
+        )
+
+
+def workout(weight: float, repetitions: int) -> dict:
+    return {
+        "workout_plan_id": 1,
+        "exercise_id": 1,
+        "sets": 1,
+        "repetitions": repetitions,
+        "weight": weight,
+        "status": "completed",
+    }
+
+
+async def test_insert_many_returns_the_new_ids_in_order(
+    plan: None, statements: List[str]
+):
+    async with async_session_maker() as session:
+        crud = WorkoutCrud(session)
+        assert await crud.insert_many([workout(50, 5), workout(60, 5)]) == [1, 2]
+        statements.clear()
+        assert await crud.insert_many([workout(70, 3), workout(80, 1)]) == [3, 4]
+
+    # The ids come back from the INSERT, not from a max(id) lookup.
+    assert not any("max(workout_exercises.id)" in s for s in statements)
+
+
+async def test_import_updates_derived_tables(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], plan: None
+):
+    lines = [workout(80, 5), workout(100, 1), {**workout(90, 3), "workout_plan_id": 9}]
+    response = await client.post(
+        "/import/workouts?format=ndjson",
+        content="\n".join(json.dumps(line) for line in lines),
+        headers=auth_headers,
+    )
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (2, 1)
+    assert report["errors"] == [{"line": 3, "error": "Workout plan 9 not found"}]
+
+    response = await client.get("/exercise/1/records", headers=auth_headers)
+    assert response.json()["heaviest_weight"] == 100
+    assert len(response.json()["rep_records"]) == 2
+
+
+async def test_weights_out_of_range_are_rejected_per_line(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], plan: None
+):
+    response = await client.post(
+        "/workout/", json={"description": "Set", **workout(12_000, 1)}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    lines = [workout(12_000, 1), workout(-5, 1), workout(9999.99, 1)]
+    response = await client.post(
+        "/import/workouts?format=ndjson",
+        content="\n".join(json.dumps(line) for line in lines),
+        headers=auth_headers,
+    )
+    report = response.json()
+    assert (report["imported"], report["failed"], report["aborted"]) == (1, 2, None)
+    assert [error["line"] for error in report["errors"]] == [1, 2]
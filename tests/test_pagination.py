@@ -0,0 +1,42 @@
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+RESOURCES = ["/category", "/muscle-group", "/exercise"]
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_invalid_cursor_is_a_bad_request(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], path: str
+):
+    response = await client.get(f"{path}/?cursor=not-a-cursor", headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_empty_table_is_not_found(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], path: str
+):
+    response = await client.get(f"{path}/", headers=auth_headers)
+    assert response.status_code == 404
+
+
+async def test_cursor_continues_after_the_previous_page(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+):
+    for i in range(5):
+        await client.post(
+            "/category/",
+            json={"name": f"Category {i}", "description": "-"},
+            headers=auth_headers,
+        )
+
+    first = (await client.get("/category/?limit=3", headers=auth_headers)).json()
+    assert [item["id"] for item in first["items"]] == [1, 2, 3]
+
+    second = await client.get(
+        f"/category/?limit=3&cursor={first['next_cursor']}", headers=auth_headers
+    )
+    assert [item["id"] for item in second.json()["items"]] == [4, 5]
+    assert second.json()["next_cursor"] is None
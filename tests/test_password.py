@@ -0,0 +1,23 @@
+import httpx
+import pytest
+
+from tests.conftest import USER
+from utils.password import password_duration
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_password_health_reads_the_hash_histograms(
+    client: httpx.AsyncClient,
+) -> None:
+    before = (await client.get("/health/password")).json()
+    await client.post("/user/", json=USER)
+    await client.post("/user/login", json=USER)
+    after = (await client.get("/health/password")).json()
+
+    assert after["completed"] - before["completed"] == 2
+    assert after["hash_seconds_total"] > before["hash_seconds_total"]
+    assert after["hash_seconds_total"] == pytest.approx(
+        sum(child.sum for child in password_duration.children.values())
+    )
+    assert after["rejected"] == before["rejected"]
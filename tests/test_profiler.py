@@ -0,0 +1,25 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from utils.profiler import Sampler, collapsed, speedscope
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cpu_bound_samples_are_weighted_by_the_time_measured():
+    sampler = Sampler(asyncio.current_task().get_coro())
+    sampler.start()
+    # Holds the GIL, so samples come every switch interval, not every interval.
+    deadline = time.perf_counter() + 0.3
+    while time.perf_counter() < deadline:
+        pass
+    sampler.stop()
+
+    profile = json.loads(speedscope(sampler, "busy"))["profiles"][0]
+    assert sum(profile["weights"]) == pytest.approx(sampler.duration, rel=0.1)
+    microseconds = sum(int(line.rsplit(" ", 1)[1]) for line in collapsed(sampler).splitlines())
+    assert microseconds / 1e6 == pytest.approx(sampler.duration, rel=0.1)
+    assert sum(sampler.samples.values()) * sampler.interval < sampler.duration / 2
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import insert, select
+
+from db import async_session_maker, engine
+from models import (Category, DailyExerciseStats, Exercise, MuscleGroup,
+                    WorkoutExercise, WorkoutPlan)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def exercises(client: httpx.AsyncClient) -> None:
+    start = datetime(2024, 1, 1, 8)
+    async with engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="Strength", description="-"))
+        await conn.execute(insert(MuscleGroup).values(name="Chest", description="-"))
+        await conn.execute(
+            insert(Exercise),
+            [
+                {"name": name, "description": "-", "category_id": 1, "muscle_group_id": 1}
+                for name in ("Bench press", "Squat")
+            ],
+        )
+        await conn.execute(
+            insert(WorkoutPlan).values(
+                name="Day", to_start=start, to_end=start + timedelta(hours=1)
+            )
+        )
+
+
+async def log_set(client, headers, exercise_id: int) -> None:
+    response = await client.post(
+        "/workout/",
+        json={
+            "description": "Set",
+            "workout_plan_id": 1,
+            "exercise_id": exercise_id,
+            "sets": 3,
+            "repetitions": 5,
+            "weight": 100,
+            "status": "completed",
+        },
+        headers=headers,
+    )
+    assert response.status_code < 300, response.text
+
+
+async def entries() -> dict[int, int]:
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(DailyExerciseStats.exercise_id, DailyExerciseStats.entries)
+        )
+        return dict(result.all())
+
+
+async def test_a_write_refreshes_the_rollup_of_its_exercise_only(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], exercises: None
+):
+    await log_set(client, auth_headers, 1)
+    await log_set(client, auth_headers, 2)
+    # A squat the rollup has not seen, on the same day.
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(WorkoutExercise).values(
+                workout_plan_id=1, exercise_id=2, sets=1, repetitions=1, weight=50, status="completed"
+            )
+        )
+
+    await log_set(client, auth_headers, 1)
+    assert await entries() == {1: 2, 2: 1}
@@ -0,0 +1,34 @@
+import pytest
+
+CONFTEST = """
+from tests.conftest import anyio_backend, auth_headers, client
+from tests.test_workout_plan import plans
+"""
+
+TESTS = """
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.query_budget(2)
+async def test_within_budget(client, auth_headers, plans):
+    response = await client.get("/workout-plan/2/full", headers=auth_headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.query_budget(1)
+async def test_over_budget(client, auth_headers, plans):
+    response = await client.get("/workout-plan/2/full", headers=auth_headers)
+    assert response.status_code == 200
+"""
+
+
+def test_requests_over_the_test_budget_fail_the_test(pytester: pytest.Pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(TESTS)
+
+    result = pytester.runpytest("-p", "utils.query_budget_plugin")
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*/full ran 2 queries, over its budget of 1*"])
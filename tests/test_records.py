@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import pytest
+from sqlalchemy import insert, select
+
+from crud.records import (apply_new_workouts, compute_records,
+                          compute_records_vectorized, record_rows)
+from db import async_session_maker, engine
+from models import (Category, Exercise, ExerciseRecord, MuscleGroup, RepRecord,
+                    WorkoutExercise, WorkoutPlan)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def exercise(client: httpx.AsyncClient) -> None:
+    start = datetime(2024, 1, 1, 8)
+    async with engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="Strength", description="-"))
+        await conn.execute(insert(MuscleGroup).values(name="Chest", description="-"))
+        await conn.execute(
+            insert(Exercise).values(
+                name="Bench press", description="-", category_id=1, muscle_group_id=1
+            )
+        )
+        await conn.execute(
+            insert(WorkoutPlan).values(
+                name="Push day", to_start=start, to_end=start + timedelta(hours=1)
+            )
+        )
+
+
+async def log_set(client, headers, weight: float, repetitions: int) -> None:
+    response = await client.post(
+        "/workout/",
+        json={
+            "description": "Set",
+            "workout_plan_id": 1,
+            "exercise_id": 1,
+            "sets": 1,
+            "repetitions": repetitions,
+            "weight": weight,
+            "status": "completed",
+        },
+        headers=headers,
+    )
+    assert response.status_code < 300, response.text
+
+
+async def test_rep_records_are_kept_per_weight_to_two_decimals(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], exercise: None
+):
+    await log_set(client, auth_headers, 82.5, 5)
+    # Beats the record at the same weight, which updates its row.
+    await log_set(client, auth_headers, 82.5, 8)
+    await log_set(client, auth_headers, 82.5, 6)
+    await log_set(client, auth_headers, 100.004, 1)
+
+    response = await client.get("/exercise/1/records", headers=auth_headers)
+    records = response.json()
+    assert records["heaviest_weight"] == pytest.approx(100.004)
+    assert [(r["weight"], r["repetitions"], r["workout_id"]) for r in records["rep_records"]] == [
+        (82.5, 8, 2),
+        (100.0, 1, 4),
+    ]
+
+
+async def test_rebuild_matches_incremental_records(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], exercise: None
+):
+    for weight, repetitions in [(60.25, 10), (60.251, 12), (70.1, 3), (70.1, 3), (80.3, 1)]:
+        await log_set(client, auth_headers, weight, repetitions)
+
+    async with async_session_maker() as session:
+        rows = await record_rows(session)
+        stored = {
+            (record.exercise_id, record.weight): (record.repetitions, record.workout_id)
+            for record in await session.scalars(select(RepRecord))
+        }
+
+    records, rep_records = compute_records(rows)
+    assert compute_records_vectorized(rows) == (records, rep_records)
+    assert rep_records == stored
+
+
+async def test_concurrent_writes_raise_the_same_records(exercise: None):
+    # Two sets at the same weight, written without their records.
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(WorkoutExercise),
+            [
+                {"workout_plan_id": 1, "exercise_id": 1, "sets": 1, "repetitions": repetitions, "weight": 80.0, "status": "completed"}
+                for repetitions in (5, 8)
+            ],
+        )
+
+    async def apply(workout_id: int) -> None:
+        async with async_session_maker() as session:
+            await apply_new_workouts(session, [workout_id])
+            await session.commit()
+
+    # Both requests find no record before either one writes it.
+    await asyncio.gather(apply(2), apply(1))
+
+    async with async_session_maker() as session:
+        record = await session.get(ExerciseRecord, 1)
+        rep_records = (await session.scalars(select(RepRecord))).all()
+    assert (record.heaviest_weight, record.heaviest_workout_id) == (80.0, 1)
+    assert record.epley_workout_id == 2
+    assert [(r.repetitions, r.workout_id) for r in rep_records] == [(8, 2)]
+
+
+def recomputed(statements: List[str]) -> bool:
+    return any(statement.startswith("DELETE FROM exercise_records") for statement in statements)
+
+
+async def test_edits_recompute_records_only_when_they_can_lower_one(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    exercise: None,
+    statements: List[str],
+):
+    await log_set(client, auth_headers, 100.0, 1)
+    await log_set(client, auth_headers, 90.0, 3)
+    await log_set(client, auth_headers, 90.0, 2)
+
+    statements.clear()
+    response = await client.patch("/workout/2", json={"description": "Back-off set"}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert not any("exercise_records" in statement for statement in statements)
+
+    # Workout 3 holds no record, so it can only raise one.
+    statements.clear()
+    response = await client.patch("/workout/3", json={"repetitions": 4}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert not recomputed(statements)
+
+    # Workout 3 now holds the rep record at 90 kg.
+    statements.clear()
+    response = await client.patch("/workout/3", json={"repetitions": 5}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert recomputed(statements)
+
+    # Workout 1 holds the heaviest weight; deleting it lowers the record.
+    response = await client.delete("/workout/1", headers=auth_headers)
+    assert response.status_code < 300, response.text
+    records = (await client.get("/exercise/1/records", headers=auth_headers)).json()
+    assert (records["heaviest_weight"], records["heaviest_workout_id"]) == (90.0, 2)
+    assert [(r["weight"], r["repetitions"]) for r in records["rep_records"]] == [(90.0, 5)]
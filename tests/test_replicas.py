@@ -0,0 +1,134 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import AsyncIterator, Callable, List
+
+import httpx
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+import db
+from config import config
+from crud.category import CategoryCrud
+from models import Base, Category
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replica(tmp_path: Path) -> AsyncIterator[str]:
+    """The URL of a second SQLite database, holding one category."""
+    url = f"sqlite+aiosqlite:///{tmp_path}/replica.db"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(Category).values(name="From replica", description="-")
+        )
+    await engine.dispose()
+    yield url
+
+
+@pytest.fixture
+async def route_to(monkeypatch) -> AsyncIterator[Callable[[List[str]], db.ReplicaRouter]]:
+    """Replaces the app's replicas with routers to the given URLs."""
+    routers: List[db.ReplicaRouter] = []
+
+    def make(urls: List[str]) -> db.ReplicaRouter:
+        router = db.ReplicaRouter(urls)
+        routers.append(router)
+        monkeypatch.setattr(db, "replicas", router)
+        return router
+
+    yield make
+    for router in routers:
+        for session_maker in router.session_makers:
+            await session_maker.kw["bind"].dispose()
+
+
+async def reads_replica(method: str, user_id: int = 1) -> bool:
+    request = Request(
+        {"type": "http", "method": method, "headers": [], "user": SimpleNamespace(id=user_id)}
+    )
+    sessions = db.get_async_session(request)
+    session = await anext(sessions)
+    replica = session.info.get("replica", False)
+    # Runs the dependency to its end, as FastAPI does after the request.
+    await anext(sessions, None)
+    return replica
+
+
+async def test_reads_go_to_replicas_and_writes_to_the_primary(route_to, replica):
+    route_to([replica])
+    assert await reads_replica("GET")
+    assert not await reads_replica("POST")
+
+
+async def test_writers_read_their_writes_from_the_primary(route_to, replica):
+    route_to([replica])
+    assert not await reads_replica("PATCH", user_id=1)
+    assert not await reads_replica("GET", user_id=1)
+    assert await reads_replica("GET", user_id=2)
+
+
+async def test_long_writes_pin_their_user_from_their_end(route_to, replica, monkeypatch):
+    monkeypatch.setattr(config, "DB_READ_YOUR_WRITES_SECONDS", 0.2)
+    route_to([replica])
+    request = Request(
+        {"type": "http", "method": "POST", "headers": [], "user": SimpleNamespace(id=1)}
+    )
+    sessions = db.get_async_session(request)
+    await anext(sessions)
+    # The write outlasts the window it opened with.
+    await asyncio.sleep(0.3)
+    await anext(sessions, None)
+    assert not await reads_replica("GET", user_id=1)
+
+
+async def test_falls_back_to_the_primary_when_a_replica_is_down(
+    route_to, replica, tmp_path: Path
+):
+    router = route_to([f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db", replica])
+    assert await reads_replica("GET")
+    assert await reads_replica("GET")
+    # The broken replica is skipped until DB_REPLICA_RETRY_SECONDS passed.
+    assert router._down_until[0] > 0
+
+    route_to([f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db"])
+    assert not await reads_replica("GET")
+
+
+async def test_falls_back_to_the_primary_when_a_replica_lags(
+    route_to, replica, monkeypatch
+):
+    monkeypatch.setattr(config, "DB_REPLICA_LAG_QUERY", "SELECT 60")
+    route_to([replica])
+    assert not await reads_replica("GET")
+
+    monkeypatch.setattr(config, "DB_REPLICA_LAG_QUERY", "SELECT 0")
+    route_to([replica])
+    assert await reads_replica("GET")
+
+
+async def test_replica_reads_are_not_cached(client: httpx.AsyncClient, route_to, replica):
+    router = route_to([replica])
+    async with await router.open_session() as session:
+        category = await CategoryCrud(session).get_category_by_id(1)
+    assert category.name == "From replica"
+    assert CategoryCrud.cache.get_nowait(("id", 1)) is None
+
+
+async def test_conditional_gets_read_from_the_primary(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], route_to, replica
+):
+    # The versions in the ETag and the stored precompressed response describe
+    # the primary, so the rows must come from it too.
+    async with db.engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="From primary", description="-"))
+    route_to([replica])
+    response = await client.get(
+        "/category/1", headers={**auth_headers, "Accept-Encoding": "gzip"}
+    )
+    assert response.json()["name"] == "From primary"
@@ -0,0 +1,38 @@
+import pytest
+
+from utils.search import SearchIndex
+
+ROWS = [
+    {"id": 1, "name": "Bench press", "description": "Barbell press", "category_id": 1, "muscle_group_id": 1},
+    {"id": 2, "name": "Incline bench press", "description": None, "category_id": 1, "muscle_group_id": 1},
+    {"id": 3, "name": "Back squat", "description": "Barbell squat", "category_id": 2, "muscle_group_id": 2},
+    {"id": 4, "name": "Bent over row", "description": "Barbell row", "category_id": 1, "muscle_group_id": 3},
+]
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    return SearchIndex(ROWS)
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_no_results_below_a_limit_of_one(index: SearchIndex, limit: int):
+    assert index.search("bench", limit=limit) == []
+    assert index.autocomplete("ben", limit=limit) == []
+
+
+def test_search_ranks_and_limits(index: SearchIndex):
+    results = index.search("bench", limit=1)
+    assert [document.id for document, _ in results] == [1]
+    results = index.search("barbell", limit=10)
+    assert {document.id for document, _ in results} == {1, 3, 4}
+
+
+def test_search_filters_and_requires_every_word(index: SearchIndex):
+    assert [d.id for d, _ in index.search("barbell", category_id=2)] == [3]
+    assert [d.id for d, _ in index.search("incline press")] == [2]
+    assert index.search("incline squat") == []
+
+
+def test_autocomplete_prefers_names_starting_with_the_prefix(index: SearchIndex):
+    assert [d.id for d in index.autocomplete("be")] == [1, 4, 2]
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import pytest
+from sqlalchemy import insert
+
+from db import engine
+from models import Category, Exercise, MuscleGroup, WorkoutExercise, WorkoutPlan
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def plans(client: httpx.AsyncClient) -> None:
+    """Plan 1 with 2 workout exercises and plan 2 with 50."""
+    start = datetime(2024, 1, 1, 8)
+    async with engine.begin() as conn:
+        await conn.execute(insert(Category).values(name="Strength", description="-"))
+        await conn.execute(insert(MuscleGroup).values(name="Chest", description="-"))
+        await conn.execute(
+            insert(Exercise),
+            [
+                {"name": f"Exercise {i}", "description": "-", "category_id": 1, "muscle_group_id": 1}
+                for i in range(10)
+            ],
+        )
+        await conn.execute(
+            insert(WorkoutPlan),
+            [
+                {"name": f"Plan {i}", "to_start": start, "to_end": start + timedelta(hours=1)}
+                for i in range(2)
+            ],
+        )
+        await conn.execute(
+            insert(WorkoutExercise),
+            [
+                {"workout_plan_id": plan_id, "exercise_id": 1 + i % 10, "sets": 3, "repetitions": 8, "weight": 50.0}
+                for plan_id, count in [(1, 2), (2, 50)]
+                for i in range(count)
+            ],
+        )
+
+
+@pytest.mark.query_budget(2)
+async def test_plan_detail_runs_the_same_queries_whatever_its_size(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    plans: None,
+    statements: List[str],
+):
+    counts = []
+    for plan_id, size in [(1, 2), (2, 50)]:
+        statements.clear()
+        response = await client.get(f"/workout-plan/{plan_id}/full", headers=auth_headers)
+        assert response.status_code == 200, response.text
+        workout_exercises = response.json()["workout_exercises"]
+        assert len(workout_exercises) == size
+        assert workout_exercises[0]["exercise"]["category"]["name"] == "Strength"
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1] == 2
@@ -0,0 +1,123 @@
+from typing import List
+
+import httpx
+import pytest
+
+from crud.exercise import search_index
+from db import engine
+
+pytestmark = pytest.mark.anyio
+
+RESOURCES = ["/category", "/muscle-group", "/exercise"]
+
+
+@pytest.fixture
+async def seeded(client: httpx.AsyncClient, auth_headers: dict[str, str]) -> None:
+    for path, data in [
+        ("/category/", {"name": "Strength", "description": "Lift heavy"}),
+        ("/muscle-group/", {"name": "Chest", "description": "Pectorals"}),
+        (
+            "/exercise/",
+            {
+                "name": "Bench press",
+                "description": "Press the bar",
+                "category_id": 1,
+                "muscle_group_id": 1,
+            },
+        ),
+    ]:
+        response = await client.post(path, json=data, headers=auth_headers)
+        assert response.status_code < 300, response.text
+
+
+def full_update(path: str) -> dict:
+    data = {"name": "Renamed", "description": "Updated"}
+    if path == "/exercise":
+        data.update(category_id=1, muscle_group_id=1)
+    return data
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_patch_runs_one_statement(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    seeded: None,
+    statements: List[str],
+    path: str,
+):
+    statements.clear()
+    response = await client.patch(
+        f"{path}/1", json={"description": "Updated"}, headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["description"] == "Updated"
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_put_runs_one_statement(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    seeded: None,
+    statements: List[str],
+    path: str,
+):
+    statements.clear()
+    response = await client.put(f"{path}/1", json=full_update(path), headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["name"] == "Renamed"
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_delete_runs_one_statement(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    seeded: None,
+    statements: List[str],
+    path: str,
+):
+    if path != "/exercise":
+        # The exercise references the category and the muscle group.
+        await client.delete("/exercise/1", headers=auth_headers)
+    statements.clear()
+    response = await client.delete(f"{path}/1", headers=auth_headers)
+    assert response.status_code < 300, response.text
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.parametrize("path", RESOURCES)
+async def test_writes_to_unknown_ids_return_404(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], seeded: None, path: str
+):
+    response = await client.patch(
+        f"{path}/99", json={"description": "Updated"}, headers=auth_headers
+    )
+    assert response.status_code == 404
+    response = await client.delete(f"{path}/99", headers=auth_headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+async def test_exercise_writes_keep_search_index_current(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    seeded: None,
+    monkeypatch,
+    update_returning: bool,
+):
+    # Without RETURNING (MySQL) the updated row is read back instead.
+    monkeypatch.setattr(engine.dialect, "update_returning", update_returning)
+    response = await client.get("/exercise/search?q=bench", headers=auth_headers)
+    assert [item["id"] for item in response.json()] == [1]
+    index = search_index["index"]
+
+    await client.patch("/exercise/1", json={"name": "Squat"}, headers=auth_headers)
+    response = await client.get("/exercise/search?q=squat", headers=auth_headers)
+    assert [item["id"] for item in response.json()] == [1]
+
+    await client.delete("/exercise/1", headers=auth_headers)
+    response = await client.get("/exercise/search?q=squat", headers=auth_headers)
+    assert response.json() == []
+    # Updated in place rather than reloaded from the table.
+    assert search_index["index"] is index
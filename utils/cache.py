@@ -0,0 +1,323 @@
+import asyncio
+import json
+import logging
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+caches: dict[str, "CacheBackend"] = {}
+
+
+class CacheBackend(ABC):
+    """
+    Interface of the caches used by the CRUD layer.
+
+    Every instance registers itself by name in `caches` so its hit/miss
+    counters can be reported. Values must be JSON-serializable so that they
+    can be shared between workers.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 300):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        caches[name] = self
+
+    @abstractmethod
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        """The value stored for `key`, or `default` when it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` for `key` for `ttl` seconds."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry."""
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": type(self).__name__,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class LRUCache(CacheBackend):
+    """
+    A bounded least-recently-used cache whose entries expire after `ttl` seconds.
+    Lives in the memory of a single worker.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 300):
+        super().__init__(name, maxsize, ttl)
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get_nowait(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set_nowait(
+        self, key: Hashable, value: Any, ttl: float | None = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear_nowait(self) -> None:
+        self._data.clear()
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.get_nowait(key, default)
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        self.set_nowait(key, value)
+
+    async def clear(self) -> None:
+        self.clear_nowait()
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "size": len(self._data)}
+
+
+class RedisCache(CacheBackend):
+    """
+    A cache shared by all workers through Redis, fronted by a small per-worker
+    `LRUCache`.
+
+    Every entry is its own key, stored with `SET ... EX ttl` so it expires on
+    its own. Keys carry a generation number, and `clear` increments it instead
+    of deleting keys, so the old entries are no longer read and expire later.
+    The keys of a generation are also kept in a sorted set by insertion time,
+    and the oldest are evicted once there are more than `maxsize`.
+
+    `clear` also publishes the cache name on `CACHE_REDIS_CHANNEL`; every worker
+    listens on it and drops its local copies, so a write in one worker is not
+    followed by stale reads in the others. A value read before a clear is not
+    stored after it. While Redis is unreachable the cache falls back to the
+    local copies.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 300,
+        client: Any = None,
+    ):
+        super().__init__(name, maxsize, ttl)
+        if client is None:
+            try:
+                from redis.asyncio import Redis
+            except ImportError as e:
+                raise RuntimeError(
+                    "CACHE_BACKEND=redis requires the `redis` package"
+                ) from e
+            client = Redis.from_url(config.CACHE_REDIS_URL)
+        self.client = client
+        self.local = LRUCache(f"{name}:local", maxsize, config.CACHE_LOCAL_TTL)
+        self._prefix = f"{config.CACHE_REDIS_PREFIX}:{name}"
+        self._generation: int | None = None
+        self._generation_expires = 0.0
+        # The generation each missing key was read at, until it is set.
+        self._read_generations: OrderedDict[str, int] = OrderedDict()
+        self._listener: asyncio.Task | None = None
+
+    @staticmethod
+    def _field(key: Hashable) -> str:
+        return json.dumps(key, default=str)
+
+    def _key(self, generation: int, field: str) -> str:
+        return f"{self._prefix}:{generation}:{field}"
+
+    def _index(self, generation: int) -> str:
+        return f"{self._prefix}:{generation}"
+
+    async def _current_generation(self) -> int:
+        # Other workers' clears reset it through the invalidation channel; it
+        # is re-read after CACHE_LOCAL_TTL in case a message was missed.
+        if self._generation is None or self._generation_expires < time.monotonic():
+            raw = await self.client.get(f"{self._prefix}:generation")
+            self._generation = int(raw or 0)
+            self._generation_expires = time.monotonic() + config.CACHE_LOCAL_TTL
+        return self._generation
+
+    def _unavailable(self, error: Exception) -> None:
+        self._generation = None
+        logger.warning("Redis cache %s unavailable, using local copies: %s", self.name, error)
+
+    def _listen(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(
+                self._invalidations()
+            )
+
+    async def _invalidations(self) -> None:
+        try:
+            async with self.client.pubsub() as pubsub:
+                await pubsub.subscribe(config.CACHE_REDIS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        data = message["data"]
+                        if isinstance(data, bytes):
+                            data = data.decode()
+                        if data == self.name:
+                            self.local.clear_nowait()
+                            self._generation = None
+        except Exception:
+            # Resubscribed by the next `get`.
+            self._generation = None
+
+    async def close(self) -> None:
+        """Stop listening for invalidations."""
+        listener, self._listener = self._listener, None
+        # redis-py may swallow a cancellation that arrives while it connects,
+        # so cancel until the task is done.
+        while listener is not None and not listener.done():
+            listener.cancel()
+            await asyncio.wait([listener], timeout=0.1)
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        self._listen()
+        value = self.local.get_nowait(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        field = self._field(key)
+        try:
+            generation = await self._current_generation()
+            raw = await self.client.get(self._key(generation, field))
+        except Exception as e:
+            self._unavailable(e)
+            self.misses += 1
+            return default
+
+        if raw is None:
+            self._read_generations[field] = generation
+            self._read_generations.move_to_end(field)
+            if len(self._read_generations) > self.maxsize:
+                self._read_generations.popitem(last=False)
+            self.misses += 1
+            return default
+
+        value = json.loads(raw)
+        self.local.set_nowait(key, value)
+        self.hits += 1
+        return value
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        field = self._field(key)
+        read_generation = self._read_generations.pop(field, None)
+        try:
+            generation = await self._current_generation()
+        except Exception as e:
+            self._unavailable(e)
+            self.local.set_nowait(key, value)
+            return
+        if read_generation is not None and read_generation != generation:
+            # Cleared since the value was read, so it may be stale.
+            return
+
+        self.local.set_nowait(key, value)
+        entry = self._key(generation, field)
+        index = self._index(generation)
+        ttl = max(1, int(self.ttl))
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(entry, json.dumps(value, default=str), ex=ttl)
+                pipe.zadd(index, {entry: time.time()})
+                pipe.expire(index, ttl)
+                pipe.zcard(index)
+                *_, size = await pipe.execute()
+            if size > self.maxsize:
+                evicted = await self.client.zpopmin(index, size - self.maxsize)
+                if evicted:
+                    await self.client.delete(*(name for name, _ in evicted))
+        except Exception as e:
+            self._unavailable(e)
+
+    async def clear(self) -> None:
+        self.local.clear_nowait()
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.incr(f"{self._prefix}:generation")
+                pipe.publish(config.CACHE_REDIS_CHANNEL, self.name)
+                generation, _ = await pipe.execute()
+        except Exception as e:
+            self._unavailable(e)
+            return
+        self._generation = generation
+        self._generation_expires = time.monotonic() + config.CACHE_LOCAL_TTL
+
+
+def create_cache(name: str, maxsize: int, ttl: float) -> CacheBackend:
+    """
+    Create the cache backend selected by `CACHE_BACKEND` ("memory" or "redis").
+    """
+    if config.CACHE_BACKEND == "redis":
+        return RedisCache(name, maxsize, ttl)
+    return LRUCache(name, maxsize, ttl)
+
+
+class TableVersion:
+    """
+    An opaque token that changes with every write to a table, for ETags.
+
+    The token lives in a cache backend of its own, so with
+    CACHE_BACKEND=redis a write in one worker changes it for all of them.
+    Writes clear it and the next read picks a new random one; tokens are
+    never reused, so an old ETag can never match newer data.
+
+    With the memory backend each worker only sees its own writes, so a token
+    lives at most REFERENCE_CACHE_TTL, as long as the cached rows it covers.
+    """
+
+    def __init__(self, table: str):
+        self.cache = create_cache(
+            f"version:{table}",
+            maxsize=1,
+            ttl=min(config.TABLE_VERSION_TTL, config.REFERENCE_CACHE_TTL),
+        )
+
+    async def get(self) -> str:
+        """
+        The current version. Call it before reading the table: a new token is
+        stored right away, so a write committing in between clears it again.
+        """
+        version = await self.cache.get("version")
+        if version is None:
+            version = secrets.token_urlsafe(8)
+            await self.cache.set("version", version)
+        return version
+
+    async def bump(self) -> None:
+        await self.cache.clear()
+
+
+table_versions: dict[str, TableVersion] = {}
+
+
+def table_version(table: str) -> TableVersion:
+    if table not in table_versions:
+        table_versions[table] = TableVersion(table)
+    return table_versions[table]
@@ -0,0 +1,37 @@
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any
+
+from config import config
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(
+        config.JWT_SECRET_KEY.encode(), payload, hashlib.sha256
+    ).digest()[:16]
+
+
+def encode_cursor(data: dict[str, Any]) -> str:
+    """
+    Encode the keyset position into an opaque, signed, URL-safe cursor.
+    """
+    payload = json.dumps(data, separators=(",", ":"), default=str).encode()
+    token = base64.urlsafe_b64encode(payload + _sign(payload))
+    return token.rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor produced by `encode_cursor` and return the keyset position.
+    Raises an exception if the cursor is malformed or has been tampered with.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload, signature = raw[:-16], raw[-16:]
+        if not hmac.compare_digest(signature, _sign(payload)):
+            raise ValueError("Bad signature")
+        return json.loads(payload)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from enum import Enum, StrEnum
+from typing import Any, AsyncIterator, List
+
+# Rows are joined into chunks of about this many bytes before being sent, so
+# a large export is not written one tiny chunk per row.
+CHUNK_SIZE = 64 * 1024
+
+
+class FileFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def ndjson_chunks(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON, one object per line.
+    """
+    buffer = []
+    size = 0
+    async for row in rows:
+        line = json.dumps(
+            {key: _plain(value) for key, value in row.items()},
+            separators=(",", ":"),
+            default=str,
+        )
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= CHUNK_SIZE:
+            yield ("\n".join(buffer) + "\n").encode()
+            buffer = []
+            size = 0
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode()
+
+
+async def csv_chunks(
+    rows: AsyncIterator[dict[str, Any]], fieldnames: List[str]
+) -> AsyncIterator[bytes]:
+    """
+    Encode rows as CSV with a header line.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    async for row in rows:
+        writer.writerow({key: _plain(value) for key, value in row.items()})
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
@@ -0,0 +1,86 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Tuple
+
+from utils.export import FileFormat
+
+
+class RecordError(ValueError):
+    """A record of the file that cannot be parsed; carries its line number."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(message)
+        self.line = line
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a stream of UTF-8 bytes into lines (with their line endings), holding
+    only the current chunk and one partial line in memory.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def read_records(
+    chunks: AsyncIterator[bytes], file_format: FileFormat
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Parse an NDJSON or CSV stream incrementally.
+
+    Yields `(line, record)` pairs, where `line` is the 1-based line the record
+    starts on and `record` is a dict of field values, or a `RecordError` for
+    a record that cannot be parsed. Empty CSV fields become None.
+    """
+    line_number = 0
+    if file_format == FileFormat.NDJSON:
+        async for line in read_lines(chunks):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, RecordError(line_number, f"Invalid JSON: {e}")
+                continue
+            if not isinstance(record, dict):
+                yield line_number, RecordError(line_number, "Expected a JSON object")
+                continue
+            yield line_number, record
+        return
+
+    header = None
+    text, start = "", 0
+    async for line in read_lines(chunks):
+        line_number += 1
+        if not text:
+            start = line_number
+        text += line
+        # A quoted field may span lines; the record ends once quotes balance.
+        if text.count('"') % 2:
+            continue
+        values = next(csv.reader([text]), [])
+        text = ""
+        if not values:
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, RecordError(
+                start, f"Expected {len(header)} fields, got {len(values)}"
+            )
+            continue
+        yield start, {
+            name: value if value != "" else None for name, value in zip(header, values)
+        }
+    if text:
+        yield start, RecordError(start, "Unterminated quoted field")
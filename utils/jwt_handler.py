@@ -1,9 +1,19 @@
+import hashlib
 import time
 from typing import Any
 
 from jose import JWTError, jwt
 
 from config import config
+from utils.cache import LRUCache
+
+# Payloads of tokens that already passed verification, keyed by the token hash.
+# Entries never outlive the token's own `exp`.
+verified_tokens = LRUCache(
+    "verified_tokens",
+    maxsize=config.TOKEN_CACHE_MAX_SIZE,
+    ttl=config.TOKEN_CACHE_TTL,
+)
 
 
 def encode_token(payload: dict[str, Any]) -> str:
@@ -24,14 +34,24 @@ def encode_token(payload: dict[str, Any]) -> str:
 def decode_token(token: str) -> dict:
     """
     Decode the JWT token and return the payload.
+    Tokens verified before are served from `verified_tokens` without redoing
+    the signature check.
     Raises an exception if the token is invalid or expired.
     """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = verified_tokens.get_nowait(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
             config.JWT_SECRET_KEY,
             algorithms=[config.JWT_ALGORITHM],
         )
-        return payload
     except JWTError as e:
         raise ValueError("Invalid or expired token") from e
+
+    ttl = payload["exp"] - time.time() if "exp" in payload else None
+    verified_tokens.set_nowait(key, payload, ttl=ttl)
+    return dict(payload)
@@ -0,0 +1,198 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# A scrape-time collector yields (name, type, help, samples) per metric, each
+# sample being (labels, value).
+Sample = Tuple[Dict[str, str], float]
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild(CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One count per bucket and one for +Inf; made cumulative when scraped.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Metric(ABC):
+    """
+    A metric family: one child per combination of label values.
+
+    Children are plain Python numbers updated in place, without locks. Every
+    update happens on the event loop thread (work done in thread pools is
+    recorded once awaited), so no two updates ever interleave.
+    """
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.children: Dict[Tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _child(self) -> object:
+        """A new child, for a combination of label values not seen before."""
+
+    def labels(self, *values: str):
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self.children[values] = self._child()
+        return child
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [
+            (self.name, dict(zip(self.labelnames, values)), child.value)
+            for values, child in self.children.items()
+        ]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _child(self) -> CounterChild:
+        return CounterChild()
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def _child(self) -> GaugeChild:
+        return GaugeChild()
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Iterable[float] = (),
+    ):
+        super().__init__(name, help, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def _child(self) -> HistogramChild:
+        return HistogramChild(self.bounds)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        samples = []
+        for values, child in self.children.items():
+            labels = dict(zip(self.labelnames, values))
+            total = 0
+            for bound, count in zip((*self.bounds, float("inf")), child.counts):
+                total += count
+                le = "+Inf" if bound == float("inf") else format_value(bound)
+                samples.append((f"{self.name}_bucket", {**labels, "le": le}, total))
+            samples.append((f"{self.name}_sum", labels, child.sum))
+            samples.append((f"{self.name}_count", labels, total))
+        return samples
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _line(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        pairs = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{pairs}}} {format_value(value)}"
+    return f"{name} {format_value(value)}"
+
+
+class Registry:
+    """
+    Holds the metrics recorded as requests run and the collectors read at
+    scrape time, and renders both in the Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: List[Collector] = []
+
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Iterable[float] = (),
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def collector(self, collector: Collector) -> Collector:
+        """Register `collector`; usable as a decorator."""
+        self.collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(_line(*sample) for sample in metric.samples())
+        for collector in self.collectors:
+            for name, type_, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {type_}")
+                lines.extend(_line(name, labels, value) for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+def parse_buckets(buckets: str) -> Tuple[float, ...]:
+    return tuple(float(bound) for bound in buckets.split(",") if bound.strip())
+
+
+registry = Registry()
@@ -1,6 +1,72 @@
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from config import config
+from utils.metrics import parse_buckets, registry
+
+
+def build_context(
+    scheme: str = config.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = config.PASSWORD_BCRYPT_ROUNDS,
+    argon2_time_cost: int = config.PASSWORD_ARGON2_TIME_COST,
+    argon2_memory_cost: int = config.PASSWORD_ARGON2_MEMORY_COST,
+    argon2_parallelism: int = config.PASSWORD_ARGON2_PARALLELISM,
+) -> CryptContext:
+    """
+    Build the password context for the given scheme and cost.
+
+    bcrypt always stays verifiable so existing hashes keep working after a
+    switch to argon2. Hashes made with another scheme or a lower cost are
+    reported by `needs_update` and get rehashed on the next login.
+    """
+    settings: dict[str, Any] = {
+        "bcrypt__rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+    }
+    schemes = [scheme]
+    if scheme == "argon2":
+        schemes.append("bcrypt")
+        settings.update(
+            argon2__time_cost=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+
+pwd_context = build_context()
+
+# bcrypt releases the GIL while hashing, so a thread pool keeps the event loop
+# free without the pickling overhead of a process pool.
+_executor = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+_pending = 0
+
+password_rejected = registry.counter(
+    "password_hash_rejected_total", "Operations refused as the queue was full."
+)
+password_wait = registry.histogram(
+    "password_hash_wait_seconds",
+    "Time password operations waited for a free worker.",
+    ("operation",),
+    parse_buckets(config.METRICS_PASSWORD_BUCKETS),
+)
+password_duration = registry.histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on a worker.",
+    ("operation",),
+    parse_buckets(config.METRICS_PASSWORD_BUCKETS),
+)
+
+
+class PasswordHashQueueFull(Exception):
+    """Raised when more password hashes are pending than the pool accepts."""
 
 
 def hash_password(password: str) -> str:
@@ -9,3 +75,146 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify the password and, when its hash is outdated, also return a new hash
+    made with the current scheme and cost.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _timed(fn: Callable, submitted: float, *args: Any) -> tuple[Any, float, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, started - submitted, time.perf_counter() - started
+
+
+async def _run_in_pool(fn: Callable, *args: Any) -> Any:
+    global _pending
+    if _pending >= config.PASSWORD_HASH_WORKERS + config.PASSWORD_HASH_MAX_QUEUE:
+        password_rejected.labels().inc()
+        raise PasswordHashQueueFull("Too many password operations in progress")
+
+    _pending += 1
+    try:
+        result, waited, took = await asyncio.get_running_loop().run_in_executor(
+            _executor, _timed, fn, time.perf_counter(), *args
+        )
+    finally:
+        _pending -= 1
+
+    password_wait.labels(fn.__name__).observe(waited)
+    password_duration.labels(fn.__name__).observe(took)
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash the password on the password worker pool.
+    Raises PasswordHashQueueFull when the pool and its queue are full.
+    """
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify the password on the password worker pool.
+    Raises PasswordHashQueueFull when the pool and its queue are full.
+    """
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Run `verify_and_update_password` on the password worker pool.
+    Raises PasswordHashQueueFull when the pool and its queue are full.
+    """
+    return await _run_in_pool(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def password_pool_stats() -> dict[str, float]:
+    """The state of the worker pool, with totals read from its metrics."""
+    durations = password_duration.children.values()
+    return {
+        "completed": sum(sum(child.counts) for child in durations),
+        "rejected": password_rejected.labels().value,
+        "wait_seconds_total": sum(
+            child.sum for child in password_wait.children.values()
+        ),
+        "hash_seconds_total": sum(child.sum for child in durations),
+        "queue_depth": max(_pending - config.PASSWORD_HASH_WORKERS, 0),
+        "in_progress": min(_pending, config.PASSWORD_HASH_WORKERS),
+        "workers": config.PASSWORD_HASH_WORKERS,
+        "max_queue": config.PASSWORD_HASH_MAX_QUEUE,
+    }
+
+
+def _hash_seconds(context: CryptContext, samples: int = 3) -> float:
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def calibrate(
+    scheme: str, target_seconds: float
+) -> tuple[dict[str, int], list[tuple[int, float]]]:
+    """
+    Find the highest cost whose hash time on this machine stays within
+    `target_seconds`: bcrypt rounds, or argon2 time cost at the configured
+    memory cost. Also returns the seconds measured per cost tried.
+    """
+    if scheme == "bcrypt":
+        setting, costs = "PASSWORD_BCRYPT_ROUNDS", range(4, 20)
+
+        def context(cost: int) -> CryptContext:
+            return build_context("bcrypt", bcrypt_rounds=cost)
+
+    else:
+        setting, costs = "PASSWORD_ARGON2_TIME_COST", range(1, 33)
+
+        def context(cost: int) -> CryptContext:
+            return build_context("argon2", argon2_time_cost=cost)
+
+    best = {setting: costs[0]}
+    timings = []
+    for cost in costs:
+        took = _hash_seconds(context(cost))
+        timings.append((cost, took))
+        if took > target_seconds:
+            break
+        best[setting] = cost
+    return best, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pick the password hash cost for a target latency."
+    )
+    parser.add_argument("-T", "--target-ms", help="Target", default=250, type=float)
+    parser.add_argument(
+        "-S", "--scheme", help="Scheme", default=config.PASSWORD_HASH_SCHEME
+    )
+    args = parser.parse_args()
+
+    settings, timings = calibrate(args.scheme, args.target_ms / 1000)
+    cost_name = "rounds" if args.scheme == "bcrypt" else "time_cost"
+    for cost, took in timings:
+        print(f"{args.scheme} {cost_name}={cost}: {took * 1000:.1f} ms")
+    print(f"PASSWORD_HASH_SCHEME={args.scheme}")
+    for key, value in settings.items():
+        print(f"{key}={value}")
+
+
+if __name__ == "__main__":
+    main()
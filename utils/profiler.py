@@ -0,0 +1,223 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Dict, List, Tuple
+
+from config import config
+
+# (function, file, line) from the outermost frame to the innermost one.
+Stack = Tuple[Tuple[str, str, int], ...]
+
+PROFILE_NAME = re.compile(r"^[\w.-]+\.(speedscope\.json|collapsed\.txt)$")
+
+
+def _coroutine_frames(coro: Any, root: FrameType | None) -> Tuple[List[FrameType], Any]:
+    """
+    Frames of the await chain starting at `coro`, outermost first, leaving out
+    those above `root`, and the object the innermost coroutine awaits.
+    """
+    frames: List[FrameType] = []
+    awaited = coro
+    while awaited is not None:
+        frame = (
+            getattr(awaited, "cr_frame", None)
+            or getattr(awaited, "gi_frame", None)
+            or getattr(awaited, "ag_frame", None)
+        )
+        if frame is None:
+            break
+        frames.append(frame)
+        awaited = (
+            getattr(awaited, "cr_await", None)
+            or getattr(awaited, "gi_yieldfrom", None)
+            or getattr(awaited, "ag_await", None)
+        )
+    if root is not None and root in frames:
+        frames = frames[frames.index(root) :]
+    return frames, awaited
+
+
+def _entry(frame: FrameType) -> Tuple[str, str, int]:
+    code = frame.f_code
+    return code.co_qualname, code.co_filename, frame.f_lineno
+
+
+class Sampler:
+    """
+    Wall-clock sampling profiler for one asyncio task.
+
+    A thread records the task's stack every PROFILE_INTERVAL seconds. The
+    stack is read from the task's chain of awaiting coroutines, so time the
+    task spends suspended (waiting on the database, a thread pool, ...) is
+    attributed to the await it is stuck on. While the task runs on the event
+    loop, the plain frames below its innermost coroutine are added, from the
+    loop thread's stack. Nothing runs on the event loop itself.
+
+    The thread needs the GIL to take a sample, so while the loop runs Python
+    code samples come no faster than `sys.getswitchinterval()` (5 ms by
+    default), whatever the interval; they are meant for slow requests. Each
+    sample is therefore weighted by the time measured since the previous one,
+    not by the interval.
+    """
+
+    def __init__(self, coro: Any, root: FrameType | None = None):
+        self.coro = coro
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self.interval = config.PROFILE_INTERVAL
+        self.samples: Counter = Counter()
+        # Stack -> seconds measured over its samples.
+        self.seconds: Counter = Counter()
+        self.started = 0.0
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        last = self.started
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            stack = self._sample()
+            if stack:
+                self.samples[stack] += 1
+                self.seconds[stack] += now - last
+            last = now
+
+    def _sample(self) -> Stack:
+        frames, awaited = _coroutine_frames(self.coro, self.root)
+        if not frames:
+            return ()
+        stack = [_entry(frame) for frame in frames]
+
+        innermost = frames[-1]
+        below: List[Tuple[str, str, int]] = []
+        frame = sys._current_frames().get(self.thread_id)
+        while frame is not None and frame is not innermost:
+            below.append(_entry(frame))
+            frame = frame.f_back
+        if frame is innermost:
+            # Running: the loop thread is inside the innermost coroutine.
+            stack[-1] = _entry(innermost)
+            stack.extend(reversed(below))
+        elif awaited is not None:
+            stack.append((f"<await {type(awaited).__name__}>", "", 0))
+        return tuple(stack)
+
+
+def collapsed(sampler: Sampler) -> str:
+    """
+    Samples in the collapsed-stack format read by flamegraph.pl and speedscope,
+    weighted by the microseconds measured.
+    """
+    lines = []
+    for stack, seconds in sampler.seconds.most_common():
+        names = ";".join(
+            f"{name} ({os.path.basename(file)}:{line})" if file else name
+            for name, file, line in stack
+        )
+        lines.append(f"{names} {round(seconds * 1e6)}")
+    return "\n".join(lines) + "\n"
+
+
+def speedscope(sampler: Sampler, name: str) -> str:
+    """Samples as a speedscope "sampled" profile, weighted by the seconds measured."""
+    frames: Dict[Tuple[str, str, int], int] = {}
+    samples, weights = [], []
+    for stack, seconds in sampler.seconds.items():
+        samples.append([frames.setdefault(entry, len(frames)) for entry in stack])
+        weights.append(seconds)
+    return json.dumps(
+        {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "fitness-workout-tracker",
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file, "line": line}
+                    for function, file, line in frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sampler.duration,
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+    )
+
+
+def profile_filename(method: str, path: str) -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    slug = re.sub(r"[^\w-]+", "_", path.strip("/")) or "root"
+    extension = (
+        "collapsed.txt" if config.PROFILE_FORMAT == "collapsed" else "speedscope.json"
+    )
+    return f"{stamp}-{method}-{slug[:60]}.{extension}"
+
+
+def save_profile(sampler: Sampler, filename: str, title: str) -> None:
+    """
+    Write the profile to PROFILE_DIR, then delete the oldest profiles beyond
+    PROFILE_MAX_FILES.
+    """
+    os.makedirs(config.PROFILE_DIR, exist_ok=True)
+    if filename.endswith(".collapsed.txt"):
+        content = collapsed(sampler)
+    else:
+        content = speedscope(sampler, title)
+    with open(os.path.join(config.PROFILE_DIR, filename), "w") as file:
+        file.write(content)
+
+    for profile in list_profiles()[config.PROFILE_MAX_FILES :]:
+        try:
+            os.remove(os.path.join(config.PROFILE_DIR, profile["name"]))
+        except FileNotFoundError:
+            pass
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Stored profiles, newest first."""
+    if not os.path.isdir(config.PROFILE_DIR):
+        return []
+    profiles = []
+    for entry in os.scandir(config.PROFILE_DIR):
+        if entry.is_file() and PROFILE_NAME.match(entry.name):
+            stat = entry.stat()
+            profiles.append(
+                {
+                    "name": entry.name,
+                    "size": stat.st_size,
+                    "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                }
+            )
+    profiles.sort(key=lambda profile: profile["name"], reverse=True)
+    return profiles
+
+
+def profile_path(name: str) -> str | None:
+    """Path of a stored profile, or None for unknown or unsafe names."""
+    if not PROFILE_NAME.match(name):
+        return None
+    path = os.path.join(config.PROFILE_DIR, name)
+    return path if os.path.isfile(path) else None
@@ -0,0 +1,37 @@
+"""
+pytest plugin failing tests whose requests run more SQL statements than their
+route's query budget.
+
+    $ python -m pytest -p utils.query_budget_plugin
+
+Budgets are SQL_QUERY_BUDGET, or what a route declares with `QueryBudget`.
+`@pytest.mark.query_budget(n)` caps every budget within one test. Requests
+are checked by `QueryStatsMiddleware`, so the tests have to go through the
+app, e.g. with an `httpx.AsyncClient` on `httpx.ASGITransport(app)`.
+"""
+import pytest
+
+from utils import query_stats
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(queries): cap the SQL statements any request of the test may run",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    marker = item.get_closest_marker("query_budget")
+    query_stats.violations = []
+    query_stats.test_budget = marker.args[0] if marker is not None else None
+    try:
+        result = yield
+    finally:
+        violations = query_stats.violations
+        query_stats.violations = None
+        query_stats.test_budget = None
+    if violations:
+        pytest.fail("\n".join(violations), pytrace=False)
+    return result
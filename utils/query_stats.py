@@ -0,0 +1,95 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements run while serving one request."""
+
+    budget: int = config.SQL_QUERY_BUDGET
+    count: int = 0
+    seconds: float = 0.0
+    # Statement text, bound parameters left out, -> times it ran.
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement] += 1
+
+    def repeated(self) -> List[Tuple[str, int]]:
+        """Statements run at least SQL_REPEATED_QUERY_THRESHOLD times."""
+        return [
+            (statement, count)
+            for statement, count in self.shapes.most_common()
+            if count >= config.SQL_REPEATED_QUERY_THRESHOLD
+        ]
+
+
+# Stats of the request being served; set by QueryStatsMiddleware.
+current_queries: ContextVar[QueryStats | None] = ContextVar(
+    "current_queries", default=None
+)
+
+# While the pytest plugin runs a test, requests over budget are appended here
+# and `test_budget` caps every budget of the test.
+violations: List[str] | None = None
+test_budget: int | None = None
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """Count and time the statements `engine` runs for the current request."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        stats = current_queries.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - conn.info["query_started"])
+
+
+def check(stats: QueryStats, method: str, route: str) -> None:
+    """
+    Log a request that ran more statements than its budget, and every
+    statement it repeated often enough to be a likely N+1.
+    """
+    budget = stats.budget
+    if violations is not None and test_budget is not None:
+        budget = min(budget, test_budget)
+
+    if stats.count > budget:
+        message = (
+            f"{method} {route} ran {stats.count} queries, "
+            f"over its budget of {budget}"
+        )
+        logger.warning(message)
+        if violations is not None:
+            violations.append(message)
+
+    for statement, count in stats.repeated():
+        logger.warning(
+            "%s %s ran the same statement %d times, likely an N+1 query: %s",
+            method,
+            route,
+            count,
+            " ".join(statement.split()),
+        )
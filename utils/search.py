@@ -0,0 +1,324 @@
+import heapq
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+TOKEN = re.compile(r"\w+")
+
+# Score of a query token matching a document token, by how it matched ...
+EXACT, PREFIX, SUBSTRING = 3.0, 2.0, 1.0
+# ... and by the field it matched in.
+NAME_WEIGHT, DESCRIPTION_WEIGHT = 2.0, 1.0
+
+
+def tokenize(text: str | None) -> List[str]:
+    return TOKEN.findall(text.lower()) if text else []
+
+
+def trigrams(token: str) -> Set[str]:
+    return {token[i : i + 3] for i in range(len(token) - 2)}
+
+
+class Trie:
+    """
+    Prefix tree over words, each word mapping to a set of ids.
+    """
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "Trie"] = {}
+        self.ids: Set[int] = set()
+
+    def add(self, word: str, _id: int) -> None:
+        node = self
+        for char in word:
+            node = node.children.setdefault(char, Trie())
+        node.ids.add(_id)
+
+    def remove(self, word: str, _id: int) -> None:
+        path = [self]
+        for char in word:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].ids.discard(_id)
+        # Prune the branch back to the last node still in use.
+        for depth in range(len(word), 0, -1):
+            if path[depth].ids or path[depth].children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+
+    def get(self, word: str) -> Set[int]:
+        node = self
+        for char in word:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.ids
+
+    def words(self, prefix: str) -> Iterable[Tuple[str, Set[int]]]:
+        """Every word starting with `prefix`, with its ids."""
+        node = self
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return
+        stack = [(prefix, node)]
+        while stack:
+            word, node = stack.pop()
+            if node.ids:
+                yield word, node.ids
+            for char, child in node.children.items():
+                stack.append((word + char, child))
+
+
+@dataclass
+class Document:
+    id: int
+    name: str
+    description: str | None
+    category_id: int
+    muscle_group_id: int
+    name_words: Tuple[str, ...]
+    name_tokens: Set[str]
+    description_tokens: Set[str]
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over exercise names and descriptions.
+
+    Query tokens match document tokens exactly, by prefix (through a trie per
+    field) or as a substring of at least three characters (through a trigram →
+    token map), so no query scans the documents. Every query token must match;
+    documents are ranked by how well and in which field they matched, then by
+    the shortest name. Candidates are combined and ranked with set operations
+    and `heapq` over precomputed keys rather than a Python loop per document.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()) -> None:
+        self.documents: Dict[int, Document] = {}
+        self.names = Trie()
+        self.descriptions = Trie()
+        self.first_words = Trie()  # first name token -> ids, for autocomplete
+        self.trigrams: Dict[str, Set[str]] = {}
+        self.by_category: Dict[int, Set[int]] = {}
+        self.by_muscle_group: Dict[int, Set[int]] = {}
+        self.name_length: Dict[int, int] = {}
+        self.negated_length: Dict[int, int] = {}
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Index a row with the columns of `Exercise`, replacing any older version."""
+        self.remove(row["id"])
+        name_tokens = tokenize(row["name"])
+        document = Document(
+            id=row["id"],
+            name=row["name"],
+            description=row.get("description"),
+            category_id=row["category_id"],
+            muscle_group_id=row["muscle_group_id"],
+            name_words=tuple(name_tokens),
+            name_tokens=set(name_tokens),
+            description_tokens=set(tokenize(row.get("description"))),
+        )
+        _id = document.id
+        self.documents[_id] = document
+        for token in document.name_tokens:
+            self.names.add(token, _id)
+        for token in document.description_tokens:
+            self.descriptions.add(token, _id)
+        for token in document.name_tokens | document.description_tokens:
+            for trigram in trigrams(token):
+                self.trigrams.setdefault(trigram, set()).add(token)
+        if name_tokens:
+            self.first_words.add(name_tokens[0], _id)
+        self.by_category.setdefault(document.category_id, set()).add(_id)
+        self.by_muscle_group.setdefault(document.muscle_group_id, set()).add(_id)
+        self.name_length[_id] = len(document.name)
+        self.negated_length[_id] = -len(document.name)
+
+    def remove(self, _id: int) -> None:
+        document = self.documents.pop(_id, None)
+        if document is None:
+            return
+        for token in document.name_tokens:
+            self.names.remove(token, _id)
+        for token in document.description_tokens:
+            self.descriptions.remove(token, _id)
+        for token in document.name_tokens | document.description_tokens:
+            if self.names.get(token) or self.descriptions.get(token):
+                continue
+            for trigram in trigrams(token):
+                tokens = self.trigrams.get(trigram)
+                if tokens is not None:
+                    tokens.discard(token)
+                    if not tokens:
+                        del self.trigrams[trigram]
+        if document.name_words:
+            self.first_words.remove(document.name_words[0], _id)
+        for groups, key in (
+            (self.by_category, document.category_id),
+            (self.by_muscle_group, document.muscle_group_id),
+        ):
+            groups[key].discard(_id)
+            if not groups[key]:
+                del groups[key]
+        del self.name_length[_id]
+        del self.negated_length[_id]
+
+    def _substrings(self, query_token: str) -> Set[str]:
+        """Vocabulary tokens containing `query_token`, which has 3+ characters."""
+        candidates = None
+        for trigram in trigrams(query_token):
+            tokens = self.trigrams.get(trigram)
+            if tokens is None:
+                return set()
+            candidates = tokens if candidates is None else candidates & tokens
+        return {token for token in candidates if query_token in token}
+
+    def _postings(self, query_token: str) -> List[Tuple[float, Set[int]]]:
+        """
+        (score, ids) for every field token matching `query_token`, best first.
+        """
+        postings = []
+        for trie, weight in (
+            (self.names, NAME_WEIGHT),
+            (self.descriptions, DESCRIPTION_WEIGHT),
+        ):
+            for token, ids in trie.words(query_token):
+                quality = EXACT if token == query_token else PREFIX
+                postings.append((quality * weight, ids))
+            if len(query_token) >= 3:
+                for token in self._substrings(query_token):
+                    if not token.startswith(query_token):
+                        ids = trie.get(token)
+                        if ids:
+                            postings.append((SUBSTRING * weight, ids))
+        postings.sort(key=operator.itemgetter(0), reverse=True)
+        return postings
+
+    def _allowed(
+        self, category_id: int | None, muscle_group_id: int | None
+    ) -> Set[int] | None:
+        allowed = None
+        if category_id is not None:
+            allowed = self.by_category.get(category_id, set())
+        if muscle_group_id is not None:
+            ids = self.by_muscle_group.get(muscle_group_id, set())
+            allowed = ids if allowed is None else allowed & ids
+        return allowed
+
+    def search(
+        self,
+        query: str,
+        category_id: int | None = None,
+        muscle_group_id: int | None = None,
+        limit: int = 10,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Documents matching every token of `query`, best first, with their score.
+        """
+        query_tokens = set(tokenize(query))
+        if not query_tokens or limit < 1:
+            return []
+        allowed = self._allowed(category_id, muscle_group_id)
+        scores: Dict[int, float] = {}
+        for position, query_token in enumerate(query_tokens):
+            # Each document keeps the best score of this token; postings come
+            # best first, so only ids not seen yet are taken from later ones.
+            token_scores: Dict[int, float] = {}
+            lowest = float("inf")
+            for score, ids in self._postings(query_token):
+                if (
+                    len(query_tokens) == 1
+                    and len(token_scores) >= limit
+                    and score < lowest
+                ):
+                    # The top `limit` are settled; lower scores cannot rank.
+                    break
+                if allowed is not None:
+                    ids = ids & allowed
+                token_scores.update(dict.fromkeys(ids - token_scores.keys(), score))
+                lowest = score
+            if position:
+                scores = {
+                    _id: scores[_id] + token_scores[_id]
+                    for _id in scores.keys() & token_scores.keys()
+                }
+            else:
+                scores = token_scores
+            if not scores:
+                return []
+            allowed = scores.keys()
+
+        best = heapq.nlargest(
+            limit,
+            zip(
+                scores.values(),
+                map(self.negated_length.__getitem__, scores),
+                map(operator.neg, scores),
+            ),
+        )
+        return [(self.documents[-negated_id], score) for score, _, negated_id in best]
+
+    def autocomplete(
+        self,
+        prefix: str,
+        category_id: int | None = None,
+        muscle_group_id: int | None = None,
+        limit: int = 10,
+    ) -> List[Document]:
+        """
+        Documents whose name has a word starting with the last word of
+        `prefix` and has the words before it; names starting with `prefix`
+        come first, then the shortest names.
+        """
+        words = tokenize(prefix)
+        if not words or limit < 1:
+            return []
+        *complete, last = words
+
+        candidates: Set[int] = set()
+        for _, ids in self.names.words(last):
+            candidates |= ids
+        for word in complete:
+            candidates &= self.names.get(word)
+        allowed = self._allowed(category_id, muscle_group_id)
+        if allowed is not None:
+            candidates &= allowed
+
+        if complete:
+            # Few candidates are left once every complete word has to match.
+            leading = {
+                _id
+                for _id in candidates & self.first_words.get(complete[0])
+                if self._starts_with(self.documents[_id], complete, last)
+            }
+        else:
+            leading = set()
+            for _, ids in self.first_words.words(last):
+                leading |= ids & candidates
+
+        ranked = []
+        for group in (leading, candidates - leading):
+            ranked += heapq.nsmallest(
+                limit - len(ranked),
+                zip(map(self.name_length.__getitem__, group), group),
+            )
+            if len(ranked) >= limit:
+                break
+        return [self.documents[_id] for _, _id in ranked]
+
+    @staticmethod
+    def _starts_with(document: Document, complete: List[str], last: str) -> bool:
+        words = document.name_words
+        return (
+            len(words) > len(complete)
+            and list(words[: len(complete)]) == complete
+            and words[len(complete)].startswith(last)
+        )